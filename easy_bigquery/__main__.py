@@ -0,0 +1,5 @@
+import sys
+
+from easy_bigquery.cli import main
+
+sys.exit(main())
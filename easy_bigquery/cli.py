@@ -0,0 +1,436 @@
+"""
+The `easy-bigquery` command-line tool for streaming bulk data moves.
+
+`export` streams a query result to a file or stdout as Arrow IPC,
+Parquet or CSV, one record batch at a time, so it can feed shell
+pipelines with constant memory:
+
+    easy-bigquery export 'SELECT * FROM `my.dataset.events`' \\
+        --format csv | duckdb -c "SELECT count(*) FROM read_csv('/dev/stdin')"
+
+`import` reads Arrow IPC, Parquet or CSV from a file or stdin and loads
+it into a table in chunks of `--chunk-rows` rows:
+
+    cat events.arrows | easy-bigquery import my_dataset.events --replace
+
+Both report progress and throughput on stderr, leaving stdout for
+data. Connection settings come from the usual `BQ_*` environment
+variables, with `--project` and `--dataset` overrides.
+"""
+import argparse
+import json
+import os
+import pathlib
+import sys
+import time
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+from easy_bigquery.context.manager import BQManager
+from easy_bigquery.logger import logger
+
+FORMATS = ('arrow', 'parquet', 'csv')
+
+# File extensions used to infer --format when it is not given.
+EXTENSIONS = {
+    '.arrow': 'arrow',
+    '.arrows': 'arrow',
+    '.ipc': 'arrow',
+    '.feather': 'arrow',
+    '.parquet': 'parquet',
+    '.pq': 'parquet',
+    '.csv': 'csv',
+}
+
+# Parquet row groups are buffered to at least this many rows, since
+# Storage API batches are much smaller than a useful row group.
+PARQUET_ROW_GROUP_ROWS = 128_000
+
+# Magic bytes at the start of an Arrow IPC file (as opposed to stream).
+ARROW_FILE_MAGIC = b'ARROW1'
+
+
+class Progress:
+    """
+    Reports rows, bytes and throughput on stderr while data moves.
+
+    Updates overwrite a single line at most every `interval` seconds;
+    `finish()` prints the final totals.
+    """
+
+    def __init__(
+        self,
+        label: str,
+        enabled: bool = True,
+        interval: float = 0.5,
+        stream: Any = None,
+    ):
+        """
+        Initializes the Progress reporter.
+
+        Args:
+            label: The verb shown in the report (e.g. 'Exported').
+            enabled: If False, nothing is printed. Defaults to True.
+            interval: The minimum seconds between updates.
+            stream: The text stream to write to. Defaults to stderr.
+        """
+        self.label = label
+        self.enabled = enabled
+        self.interval = interval
+        self.stream = stream or sys.stderr
+        self.rows = 0
+        self.bytes = 0
+        self._start = time.perf_counter()
+        self._last = 0.0
+
+    def update(self, rows: int, nbytes: int) -> None:
+        """Adds moved rows and bytes, redrawing the line if due."""
+        self.rows += rows
+        self.bytes += nbytes
+        now = time.perf_counter()
+        if self.enabled and now - self._last >= self.interval:
+            self._last = now
+            self.stream.write(f'\r{self._line(now)}')
+            self.stream.flush()
+
+    def finish(self) -> None:
+        """Prints the final totals."""
+        if self.enabled:
+            self.stream.write(f'\r{self._line(time.perf_counter())}\n')
+            self.stream.flush()
+
+    def _line(self, now: float) -> str:
+        elapsed = max(now - self._start, 1e-9)
+        megabytes = self.bytes / 2**20
+        return (
+            f'{self.label} {self.rows:,} rows ({megabytes:,.1f} MB) in '
+            f'{elapsed:.1f}s: {self.rows / elapsed:,.0f} rows/s, '
+            f'{megabytes / elapsed:,.1f} MB/s'
+        )
+
+
+class _ParquetSink:
+    """A Parquet writer that buffers batches into sizeable row groups."""
+
+    def __init__(self, sink: BinaryIO, schema: pa.Schema, compression: str):
+        self._writer = pq.ParquetWriter(sink, schema, compression=compression)
+        self._buffer: List[pa.RecordBatch] = []
+        self._rows = 0
+
+    def write_batch(self, batch: pa.RecordBatch) -> None:
+        self._buffer.append(batch)
+        self._rows += batch.num_rows
+        if self._rows >= PARQUET_ROW_GROUP_ROWS:
+            self._flush()
+
+    def close(self) -> None:
+        self._flush()
+        self._writer.close()
+
+    def _flush(self) -> None:
+        if self._buffer:
+            self._writer.write_table(pa.Table.from_batches(self._buffer))
+            self._buffer, self._rows = [], 0
+
+
+def _resolve_format(explicit: Optional[str], path: Optional[str]) -> str:
+    """Returns the explicit format or infers it from the file name."""
+    if explicit:
+        return explicit
+    if path and path != '-':
+        suffix = pathlib.Path(path).suffix.lower()
+        if suffix in EXTENSIONS:
+            return EXTENSIONS[suffix]
+    return 'arrow'
+
+
+def _read_query(query: str) -> str:
+    """Reads the query from stdin ('-') or a file ('@path') if asked."""
+    if query == '-':
+        return sys.stdin.read()
+    if query.startswith('@'):
+        return pathlib.Path(query[1:]).read_text()
+    return query
+
+
+def _parse_params(pairs: List[str]) -> Optional[Dict[str, Any]]:
+    """
+    Parses `name=value` pairs into query parameters.
+
+    Values are read as JSON when possible (so `7`, `true` and `[1, 2]`
+    keep their types) and as plain strings otherwise.
+    """
+    if not pairs:
+        return None
+    params = {}
+    for pair in pairs:
+        name, separator, value = pair.partition('=')
+        if not separator:
+            raise ValueError(f'Expected name=value, got {pair!r}.')
+        try:
+            params[name] = json.loads(value)
+        except json.JSONDecodeError:
+            params[name] = value
+    return params
+
+
+def _split_table(name: str) -> Tuple[Optional[str], Optional[str], str]:
+    """Splits `[[project.]dataset.]table` into its parts."""
+    parts = name.split('.')
+    if len(parts) > 3:
+        raise ValueError(f'Invalid table name: {name!r}.')
+    return tuple([None] * (3 - len(parts)) + parts)
+
+
+def _open_output(path: Optional[str]) -> BinaryIO:
+    """Opens the output file, or returns the binary stdout."""
+    if path is None or path == '-':
+        return sys.stdout.buffer
+    return open(path, 'wb')
+
+
+def _open_writer(
+    fmt: str, sink: BinaryIO, schema: pa.Schema, args: argparse.Namespace
+) -> Any:
+    """Creates a streaming writer exposing write_batch() and close()."""
+    if fmt == 'parquet':
+        return _ParquetSink(sink, schema, args.compression or 'zstd')
+    if fmt == 'csv':
+        return pacsv.CSVWriter(sink, schema)
+    options = None
+    if args.compression and args.compression != 'none':
+        options = pa.ipc.IpcWriteOptions(compression=args.compression)
+    return pa.ipc.new_stream(sink, schema, options=options)
+
+
+def _read_batches(
+    fmt: str, path: Optional[str], chunk_rows: int
+) -> Iterator[pa.RecordBatch]:
+    """Streams record batches from a file or stdin."""
+    from_stdin = path is None or path == '-'
+    if fmt == 'parquet':
+        # Parquet keeps its metadata in a footer, so a pipe must be
+        # buffered whole; files are read one batch at a time.
+        source = (
+            pa.BufferReader(sys.stdin.buffer.read()) if from_stdin else path
+        )
+        yield from pq.ParquetFile(source).iter_batches(batch_size=chunk_rows)
+        return
+    if from_stdin:
+        source = sys.stdin.buffer
+        yield from (
+            pacsv.open_csv(source)
+            if fmt == 'csv'
+            else pa.ipc.open_stream(source)
+        )
+        return
+    with pa.OSFile(path, 'rb') as source:
+        if fmt == 'csv':
+            yield from pacsv.open_csv(source)
+        elif source.read(len(ARROW_FILE_MAGIC)) == ARROW_FILE_MAGIC:
+            reader = pa.ipc.open_file(source)
+            for index in range(reader.num_record_batches):
+                yield reader.get_batch(index)
+        else:
+            source.seek(0)
+            yield from pa.ipc.open_stream(source)
+
+
+def _manager(args: argparse.Namespace) -> BQManager:
+    """Builds the manager from the connection options."""
+    options = {}
+    if args.project:
+        options['project_id'] = args.project
+    if args.dataset:
+        options['dataset'] = args.dataset
+    return BQManager(timeout=args.timeout, **options)
+
+
+def export(args: argparse.Namespace) -> int:
+    """Runs the `export` command."""
+    query = _read_query(args.query)
+    fmt = _resolve_format(args.format, args.output)
+    progress = Progress('Exported', enabled=not args.quiet)
+    with _manager(args) as bq:
+        batches = bq.iter_batches(
+            query,
+            params=_parse_params(args.param),
+            use_storage_api=not args.no_storage_api,
+        )
+        sink = _open_output(args.output)
+        writer = None
+        try:
+            for batch in batches:
+                if writer is None:
+                    writer = _open_writer(fmt, sink, batch.schema, args)
+                writer.write_batch(batch)
+                progress.update(batch.num_rows, batch.nbytes)
+        finally:
+            if writer is not None:
+                writer.close()
+            if sink is not sys.stdout.buffer:
+                sink.close()
+            else:
+                sink.flush()
+    progress.finish()
+    return 0
+
+
+def import_(args: argparse.Namespace) -> int:
+    """Runs the `import` command."""
+    fmt = _resolve_format(args.format, args.input)
+    project_id, dataset, table = _split_table(args.table)
+    progress = Progress('Imported', enabled=not args.quiet)
+    disposition = 'WRITE_TRUNCATE' if args.replace else 'WRITE_APPEND'
+
+    with _manager(args) as bq:
+
+        def push(chunk: List[pa.RecordBatch]) -> None:
+            nonlocal disposition
+            data = pa.Table.from_batches(chunk)
+            bq.push(
+                data.to_pandas(),
+                project_id=project_id,
+                dataset=dataset,
+                table=table,
+                write_disposition=disposition,
+                compression=args.compression,
+            )
+            # Later chunks are appended to what the first one wrote.
+            disposition = 'WRITE_APPEND'
+            progress.update(data.num_rows, data.nbytes)
+
+        chunk: List[pa.RecordBatch] = []
+        rows = 0
+        for batch in _read_batches(fmt, args.input, args.chunk_rows):
+            chunk.append(batch)
+            rows += batch.num_rows
+            if rows >= args.chunk_rows:
+                push(chunk)
+                chunk, rows = [], 0
+        if chunk:
+            push(chunk)
+    progress.finish()
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Builds the argument parser of the `easy-bigquery` command."""
+    parser = argparse.ArgumentParser(
+        prog='easy-bigquery',
+        description='Stream data between BigQuery and files or pipes.',
+    )
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--project', help='The GCP project ID.')
+    common.add_argument('--dataset', help='The default dataset.')
+    common.add_argument(
+        '--format',
+        choices=FORMATS,
+        help='The data format. Inferred from the file name, else arrow.',
+    )
+    common.add_argument(
+        '--compression',
+        help=(
+            'The codec: zstd, lz4 or none for Arrow; snappy, zstd, gzip '
+            'or none for Parquet; ignored for CSV exports.'
+        ),
+    )
+    common.add_argument(
+        '--timeout',
+        type=float,
+        help='Cancel jobs running longer than this many seconds.',
+    )
+    common.add_argument(
+        '-q', '--quiet', action='store_true', help='Hide progress.'
+    )
+    common.add_argument(
+        '-v', '--verbose', action='store_true', help='Show library logs.'
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    exporter = commands.add_parser(
+        'export',
+        parents=[common],
+        help='Stream a query result to a file or stdout.',
+    )
+    exporter.add_argument(
+        'query', help="The SQL, '@file.sql', or '-' to read stdin."
+    )
+    exporter.add_argument(
+        '-o', '--output', help='The output file. Defaults to stdout.'
+    )
+    exporter.add_argument(
+        '-p',
+        '--param',
+        action='append',
+        default=[],
+        metavar='NAME=VALUE',
+        help='A query parameter; the value is parsed as JSON if valid.',
+    )
+    exporter.add_argument(
+        '--no-storage-api',
+        action='store_true',
+        help='Download through the REST API instead.',
+    )
+    exporter.set_defaults(handler=export)
+
+    importer = commands.add_parser(
+        'import',
+        parents=[common],
+        help='Load a file or stdin into a table, in chunks.',
+    )
+    importer.add_argument('table', help='[[project.]dataset.]table')
+    importer.add_argument(
+        '-i', '--input', help='The input file. Defaults to stdin.'
+    )
+    importer.add_argument(
+        '--chunk-rows',
+        type=int,
+        default=500_000,
+        help='Rows per load job. Defaults to 500000.',
+    )
+    importer.add_argument(
+        '--replace',
+        action='store_true',
+        help='Truncate the table with the first chunk instead of appending.',
+    )
+    importer.set_defaults(handler=import_)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Runs the `easy-bigquery` command.
+
+    Args:
+        argv: The arguments, excluding the program name. Defaults to
+            `sys.argv[1:]`.
+
+    Returns:
+        The process exit code.
+    """
+    args = build_parser().parse_args(argv)
+    if not args.verbose:
+        logger.remove()
+        logger.add(sys.stderr, level='WARNING')
+    try:
+        return args.handler(args)
+    except KeyboardInterrupt:
+        # Leaving the manager context already cancelled running jobs.
+        sys.stderr.write('\nInterrupted.\n')
+        return 130
+    except BrokenPipeError:
+        # The reader (e.g. `head`) went away; silence the flush at exit.
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 0
+    except (OSError, ValueError, RuntimeError, TimeoutError) as error:
+        sys.stderr.write(f'easy-bigquery: error: {error}\n')
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,14 +1,23 @@
-import json
+import os
+import threading
 from typing import Any, Dict, Optional
 
 from google.cloud import bigquery as bq
 from google.cloud.bigquery_storage import BigQueryReadClient
 from google.oauth2 import service_account
 
+from easy_bigquery.connector.credentials import (
+    get_credentials,
+    parse_credentials_info,
+)
+from easy_bigquery.connector.jobs import JobRegistry
+from easy_bigquery.connector.scheduler import JobScheduler
 from easy_bigquery.core.config import (
     BQ_DATASET,
     BQ_JSON_CREDENTIALS,
+    BQ_MAX_CONCURRENT_JOBS,
     BQ_PROJECT_ID,
+    BQ_REQUESTS_PER_SECOND,
     BQ_TABLE_NAME,
 )
 from easy_bigquery.logger.manager import logger
@@ -33,6 +42,22 @@ class BQConnector:
         client (Optional[bq.Client]): The main BigQuery client.
         bq_storage (Optional[BigQueryReadClient]): The BigQuery
             Storage API client, used for fast data downloads.
+        jobs (JobRegistry): The jobs currently in flight through this
+            connector, which can be cancelled with `jobs.cancel_all()`.
+        scheduler (JobScheduler): The admission control every worker
+            goes through before starting a job; its `metrics()` expose
+            queue depths and wait times.
+
+    The clients hold gRPC channels that cannot be used across a
+    `fork`. The connector remembers the process that connected it and
+    `ensure_process()` transparently rebuilds the clients when it is
+    used from a different process. Pickling a connector (e.g. to send
+    it to a `spawn` worker) drops the clients, which are then
+    recreated lazily on first use in the receiving process.
+
+    Credentials are shared process-wide per service account (see
+    `easy_bigquery.connector.credentials`), so creating many
+    connectors does not repeat the OAuth token exchange.
 
     Example:
         ```python
@@ -62,6 +87,8 @@ class BQConnector:
         credentials_info: str = BQ_JSON_CREDENTIALS,
         dataset: str = BQ_DATASET,
         table: str = BQ_TABLE_NAME,
+        max_concurrent_jobs: int = BQ_MAX_CONCURRENT_JOBS,
+        requests_per_second: float = BQ_REQUESTS_PER_SECOND,
     ):
         """
         Initializes the BQConnector.
@@ -76,33 +103,91 @@ class BQConnector:
                 value from the environment configuration.
             table: The default BigQuery table name. Defaults to the
                 value from the environment configuration.
+            max_concurrent_jobs: The cap on jobs running at once
+                through this connector, 0 for none. Defaults to the
+                `BQ_MAX_CONCURRENT_JOBS` setting.
+            requests_per_second: The rate of API calls (job
+                submissions and table reads), 0 for no limit.
+                Defaults to the `BQ_REQUESTS_PER_SECOND` setting.
         """
         self.project_id = project_id
         self.dataset = dataset
         self.table = table
-        self._creds_info: Dict[str, Any] = json.loads(credentials_info)
+        self._creds_info: Dict[str, Any] = parse_credentials_info(
+            credentials_info
+        )
         self.credentials: Optional[service_account.Credentials] = None
         self.client: Optional[bq.Client] = None
         self.bq_storage: Optional[BigQueryReadClient] = None
+        self.jobs = JobRegistry()
+        self.scheduler = JobScheduler(
+            max_concurrent_jobs=max_concurrent_jobs,
+            requests_per_second=requests_per_second,
+        )
+        self._pid: Optional[int] = None
+        # Serializes (re)connection between threads sharing the clients.
+        self._lock = threading.RLock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Drops the process-bound clients when the connector is pickled."""
+        state = self.__dict__.copy()
+        state.update(credentials=None, client=None, bq_storage=None)
+        if self._pid is not None:
+            # No process has pid 0, so the receiver reconnects on first
+            # use, even when it is unpickled in this same process.
+            state['_pid'] = 0
+        del state['jobs'], state['_lock']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restores a pickled connector with an empty job registry."""
+        self.__dict__.update(state)
+        self.jobs = JobRegistry()
+        self._lock = threading.RLock()
 
     def connect(self) -> None:
         """Establishes connections to BigQuery clients."""
         logger.info(f'Connecting to BigQuery project: {self.project_id}')
-        self.credentials = (
-            service_account.Credentials.from_service_account_info(
-                info=self._creds_info
+        with self._lock:
+            self.credentials = get_credentials(self._creds_info)
+            self.client = bq.Client(
+                credentials=self.credentials, project=self.project_id
             )
-        )
-        self.client = bq.Client(
-            credentials=self.credentials, project=self.project_id
-        )
-        self.bq_storage = BigQueryReadClient(credentials=self.credentials)
+            self.bq_storage = BigQueryReadClient(credentials=self.credentials)
+            self._pid = os.getpid()
         logger.info('BigQuery clients created successfully.')
 
+    def ensure_process(self) -> None:
+        """
+        Reconnects if the connector is used from a different process.
+
+        Clients inherited through `fork` (or lost when the connector was
+        pickled) are discarded without closing their transports, since
+        those still belong to the parent process, and new clients are
+        created for the current process. Connectors that were never
+        connected are left untouched.
+        """
+        if self._pid is None or self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return  # Another thread reconnected first.
+            logger.info(
+                f'Connector used from process {os.getpid()} after being '
+                f'connected in {self._pid}; reconnecting.'
+            )
+            self.credentials = None
+            self.client = None
+            self.bq_storage = None
+            self.jobs = JobRegistry()
+            self.scheduler = self.scheduler.reset()
+            self.connect()
+
     def close(self) -> None:
         """Closes all active BigQuery connections."""
-        if self.bq_storage and hasattr(self.bq_storage.transport, 'close'):
-            self.bq_storage.transport.close()
-        self.client = None
-        self.bq_storage = None
+        with self._lock:
+            if self.bq_storage and hasattr(self.bq_storage.transport, 'close'):
+                self.bq_storage.transport.close()
+            self.client = None
+            self.bq_storage = None
         logger.info('BigQuery connections closed.')
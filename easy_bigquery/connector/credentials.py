@@ -0,0 +1,164 @@
+"""
+Process-wide cache of service account credentials and access tokens.
+
+Every `BQConnector` used to parse its credentials JSON and build a new
+`service_account.Credentials` object, so the first request of every
+connector paid for an OAuth token exchange. Credentials are now shared
+per service account identity: connectors created in the same process
+reuse the same credentials object, and therefore the same access
+token. A daemon thread renews tokens shortly before they expire, so
+requests rarely have to wait for a refresh.
+"""
+import datetime as dt
+import json
+import os
+import threading
+from functools import lru_cache
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from google.auth.transport.requests import Request
+from google.oauth2 import service_account
+
+from easy_bigquery.core.config import BQ_CREDENTIALS_REFRESH_INTERVAL
+from easy_bigquery.logger.manager import logger
+
+# Scopes covering both the BigQuery API and the BigQuery Storage API,
+# so neither client needs to derive its own scoped copy.
+SCOPES = (
+    'https://www.googleapis.com/auth/bigquery',
+    'https://www.googleapis.com/auth/cloud-platform',
+)
+
+# Tokens expiring within this margin are refreshed in the background.
+REFRESH_MARGIN = dt.timedelta(minutes=5)
+
+_lock = threading.Lock()
+_cache: Dict[Tuple[Any, ...], service_account.Credentials] = {}
+_refresher_pid: Optional[int] = None
+_wakeup = threading.Event()
+
+
+@lru_cache(maxsize=32)
+def _parse(credentials_info: str) -> Tuple[Tuple[str, Any], ...]:
+    """Parses a credentials JSON string once per distinct string."""
+    return tuple(json.loads(credentials_info).items())
+
+
+def parse_credentials_info(credentials_info: str) -> Dict[str, Any]:
+    """
+    Parses a service account JSON string, caching the decoded result.
+
+    Args:
+        credentials_info: A JSON string of the service account
+            credentials.
+
+    Returns:
+        A new dict with the decoded credentials.
+    """
+    return dict(_parse(credentials_info))
+
+
+def _identity(info: Mapping[str, Any]) -> Tuple[Any, ...]:
+    """Returns the cache key identifying a service account key."""
+    return (
+        info.get('client_email'),
+        info.get('private_key_id'),
+        info.get('token_uri'),
+    )
+
+
+def get_credentials(
+    info: Mapping[str, Any],
+    refresh_interval: float = BQ_CREDENTIALS_REFRESH_INTERVAL,
+) -> service_account.Credentials:
+    """
+    Returns the shared credentials for a service account.
+
+    The first call for a service account creates the credentials and
+    schedules a token refresh in the background; later calls return
+    the same object.
+
+    Args:
+        info: The decoded service account information.
+        refresh_interval: Seconds between checks of the background
+            refresher. 0 disables proactive refreshing. Defaults to
+            `BQ_CREDENTIALS_REFRESH_INTERVAL`.
+
+    Returns:
+        The scoped, shared `service_account.Credentials`.
+    """
+    key = _identity(info)
+    with _lock:
+        credentials = _cache.get(key)
+        if credentials is None:
+            credentials = (
+                service_account.Credentials.from_service_account_info(
+                    info=info, scopes=SCOPES
+                )
+            )
+            _cache[key] = credentials
+            _wakeup.set()
+    if refresh_interval > 0:
+        _ensure_refresher(refresh_interval)
+    return credentials
+
+
+def clear_cache() -> None:
+    """Forgets every cached credentials object and parsed JSON string."""
+    with _lock:
+        _cache.clear()
+    _parse.cache_clear()
+
+
+def _needs_refresh(credentials: service_account.Credentials) -> bool:
+    """Tells whether a token is missing or close to expiring."""
+    if not credentials.token or credentials.expiry is None:
+        return True
+    now = dt.datetime.now(dt.timezone.utc).replace(tzinfo=None)
+    return credentials.expiry - now < REFRESH_MARGIN
+
+
+def refresh_expiring() -> int:
+    """
+    Refreshes every cached token that is missing or about to expire.
+
+    Returns:
+        The number of credentials refreshed.
+    """
+    with _lock:
+        candidates = list(_cache.values())
+    refreshed = 0
+    for credentials in candidates:
+        if not _needs_refresh(credentials):
+            continue
+        try:
+            credentials.refresh(Request())
+            refreshed += 1
+        except Exception as error:
+            logger.warning(f'Background token refresh failed: {error}')
+    return refreshed
+
+
+def _ensure_refresher(interval: float) -> None:
+    """Starts the refresher thread once per process."""
+    global _refresher_pid
+    with _lock:
+        if _refresher_pid == os.getpid():
+            return
+        # Threads do not survive fork; a child starts its own refresher.
+        _refresher_pid = os.getpid()
+    thread = threading.Thread(
+        target=_refresh_loop,
+        args=(interval,),
+        name='easy-bigquery-token-refresher',
+        daemon=True,
+    )
+    thread.start()
+
+
+def _refresh_loop(interval: float) -> None:
+    """Periodically refreshes expiring tokens until the process exits."""
+    while True:
+        refresh_expiring()
+        _wakeup.wait(interval)
+        _wakeup.clear()
@@ -0,0 +1,223 @@
+"""
+Deadlines, cancellation and polling for BigQuery jobs.
+
+Waiting on `job.result()` blocks a thread until the job finishes, with
+no way to give up or to stop the job from another thread. The helpers
+here poll job status with adaptive backoff instead, so a wait can end
+at a deadline, on `KeyboardInterrupt`, or when another thread calls
+`JobHandle.cancel()`; in all three cases the job is also cancelled
+server-side so it stops consuming slots.
+"""
+import threading
+import time
+from concurrent.futures import CancelledError
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional, Set
+
+from easy_bigquery.logger import logger
+
+# Polling starts fast for short jobs and backs off for long ones.
+INITIAL_POLL_INTERVAL = 0.2
+MAX_POLL_INTERVAL = 5.0
+POLL_BACKOFF = 1.5
+
+
+class JobHandle:
+    """
+    Lets any thread cancel a fetch or push running in another thread.
+
+    Create a handle, pass it to `fetch`/`push` as `handle=...`, and
+    call `cancel()` from elsewhere. The waiting call raises
+    `concurrent.futures.CancelledError` promptly and the BigQuery job
+    is cancelled server-side.
+
+    Attributes:
+        job (Optional[Any]): The job currently attached, if any.
+
+    Example:
+        ```python
+        import threading
+
+        from easy_bigquery.connector.jobs import JobHandle
+
+        handle = JobHandle()
+        threading.Timer(30, handle.cancel).start()
+        with BQManager() as bq:
+            df = bq.fetch('SELECT ...', handle=handle)
+        ```
+    """
+
+    def __init__(self):
+        """Initializes a handle that is not yet attached to a job."""
+        self.job: Optional[Any] = None
+        self._cancelled = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether `cancel()` was called."""
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """Requests cancellation of the attached (or next) job."""
+        with self._lock:
+            self._cancelled.set()
+            job = self.job
+        if job is not None:
+            _cancel(job)
+
+    def attach(self, job: Any) -> None:
+        """
+        Associates a job with the handle.
+
+        If the handle was already cancelled, the job is cancelled
+        immediately.
+
+        Args:
+            job: The BigQuery job.
+        """
+        with self._lock:
+            self.job = job
+            cancelled = self._cancelled.is_set()
+        if cancelled:
+            _cancel(job)
+
+    def wait(self, seconds: float) -> bool:
+        """Sleeps up to `seconds`, waking early on cancellation."""
+        return self._cancelled.wait(seconds)
+
+
+class JobRegistry:
+    """
+    Tracks the jobs in flight on a connector so they can be cancelled.
+
+    Workers register each job for as long as they wait on it or read
+    its results; `BQManager.__exit__` cancels whatever is still
+    registered, e.g. jobs started by other threads. A
+    `KeyboardInterrupt` raised while a job is tracked cancels it too.
+    """
+
+    def __init__(self):
+        """Initializes an empty registry."""
+        self._jobs: Set[Any] = set()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._jobs)
+
+    @contextmanager
+    def track(self, job: Any) -> Iterator[Any]:
+        """
+        Registers a job for the duration of a `with` block.
+
+        Args:
+            job: The BigQuery job.
+
+        Yields:
+            The job itself.
+        """
+        with self._lock:
+            self._jobs.add(job)
+        try:
+            yield job
+        except KeyboardInterrupt:
+            _cancel(job)
+            raise
+        finally:
+            with self._lock:
+                self._jobs.discard(job)
+
+    def cancel_all(self) -> int:
+        """
+        Cancels every registered job server-side.
+
+        Returns:
+            The number of jobs for which cancellation was requested.
+        """
+        with self._lock:
+            jobs = list(self._jobs)
+        for job in jobs:
+            _cancel(job)
+        if jobs:
+            logger.warning(f'Cancelled {len(jobs)} in-flight job(s).')
+        return len(jobs)
+
+
+def deadline_after(timeout: Optional[float]) -> Optional[float]:
+    """
+    Converts a timeout in seconds into an absolute monotonic deadline.
+
+    Args:
+        timeout: The timeout in seconds, or None for no deadline.
+
+    Returns:
+        The deadline, or None.
+    """
+    return None if timeout is None else time.monotonic() + timeout
+
+
+def wait_for_job(
+    job: Any,
+    deadline: Optional[float] = None,
+    handle: Optional[JobHandle] = None,
+) -> None:
+    """
+    Waits for a job with adaptive polling, a deadline and cancellation.
+
+    The job state is polled with `job.done()`, starting every
+    `INITIAL_POLL_INTERVAL` seconds and backing off by `POLL_BACKOFF`
+    up to `MAX_POLL_INTERVAL`. Sleeps wake immediately when the handle
+    is cancelled. Without a deadline or a handle there is nothing to
+    supervise and the function returns at once, leaving the caller's
+    blocking `result()` call to do the waiting.
+
+    Job errors are not raised here: call `job.result()` (or a method
+    that does, such as `to_dataframe()`) once the wait is over.
+
+    Args:
+        job: The BigQuery job to wait for.
+        deadline: An optional absolute `time.monotonic()` deadline (see
+            `deadline_after`).
+        handle: An optional `JobHandle` allowing other threads to
+            cancel the wait.
+
+    Raises:
+        TimeoutError: If the deadline passes first.
+        CancelledError: If the handle is cancelled first.
+    """
+    if deadline is None and handle is None:
+        return
+    if handle is not None:
+        handle.attach(job)
+    interval = INITIAL_POLL_INTERVAL
+    while True:
+        if handle is not None and handle.cancelled:
+            _cancel(job)
+            raise CancelledError(f'Job {job.job_id} was cancelled.')
+        if job.done():
+            return
+        pause = interval
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                _cancel(job)
+                raise TimeoutError(
+                    f'Job {job.job_id} did not finish before its '
+                    'deadline and was cancelled.'
+                )
+            pause = min(pause, remaining)
+        if handle is not None:
+            handle.wait(pause)
+        else:
+            time.sleep(pause)
+        interval = min(interval * POLL_BACKOFF, MAX_POLL_INTERVAL)
+
+
+def _cancel(job: Any) -> None:
+    """Requests server-side cancellation, ignoring failures."""
+    try:
+        job.cancel()
+        logger.info(f'Requested cancellation of job {job.job_id}.')
+    except Exception as error:
+        logger.warning(f'Could not cancel job {job.job_id}: {error}')
@@ -0,0 +1,107 @@
+"""
+Per-process connector management for multiprocessing pools.
+
+BigQuery clients cannot be shared across processes, and reconnecting
+inside every task wastes time on authentication and channel setup.
+This module keeps exactly one `BQConnector` per worker process: the
+pool initializer connects it once and tasks retrieve it with
+`get_worker_connector()`.
+
+Example:
+    ```python
+    from easy_bigquery.connector.pool import (
+        get_worker_connector,
+        process_pool,
+    )
+    from easy_bigquery.workers import FetchWorker
+
+    def count_rows(query):
+        worker = FetchWorker(get_worker_connector())
+        return len(worker.fetch(query))
+
+    queries = ['SELECT 1', 'SELECT 2']
+    with process_pool(max_workers=4) as pool:
+        print(list(pool.map(count_rows, queries)))
+    ```
+
+    The same initializer works with `multiprocessing.Pool`:
+
+    ```python
+    import multiprocessing
+
+    from easy_bigquery.connector.pool import init_worker
+
+    pool = multiprocessing.Pool(4, initializer=init_worker, initargs=({},))
+    ```
+"""
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.util import Finalize
+from typing import Any, Dict, Optional
+
+from easy_bigquery.connector.connector import BQConnector
+
+_worker_connector: Optional[BQConnector] = None
+
+
+def init_worker(connector_kwargs: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Connects the connector of the current worker process.
+
+    Intended to be used as the `initializer` of a process pool. The
+    connector is closed automatically when the worker process exits.
+
+    Args:
+        connector_kwargs: Keyword arguments passed to the `BQConnector`
+            constructor (e.g., `project_id`).
+    """
+    global _worker_connector
+    connector = BQConnector(**(connector_kwargs or {}))
+    connector.connect()
+    Finalize(connector, connector.close, exitpriority=10)
+    _worker_connector = connector
+
+
+def get_worker_connector() -> BQConnector:
+    """
+    Returns the connector of the current worker process.
+
+    Returns:
+        The connected `BQConnector` created by `init_worker`.
+
+    Raises:
+        RuntimeError: If `init_worker` has not run in this process.
+    """
+    if _worker_connector is None:
+        raise RuntimeError(
+            'Worker connector is not initialized; use init_worker as the '
+            'pool initializer.'
+        )
+    _worker_connector.ensure_process()
+    return _worker_connector
+
+
+def process_pool(
+    max_workers: Optional[int] = None,
+    mp_context: Any = None,
+    **connector_kwargs: Any,
+) -> ProcessPoolExecutor:
+    """
+    Creates a process pool whose workers each hold one connector.
+
+    Args:
+        max_workers: The maximum number of worker processes. Defaults
+            to the number of CPUs.
+        mp_context: An optional multiprocessing context (e.g. the one
+            returned by `multiprocessing.get_context('spawn')`).
+        **connector_kwargs: Keyword arguments passed to the
+            `BQConnector` constructor in each worker.
+
+    Returns:
+        A `ProcessPoolExecutor` configured with `init_worker`.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=mp_context,
+        initializer=init_worker,
+        initargs=(connector_kwargs,),
+    )
@@ -0,0 +1,277 @@
+"""
+Admission control for the jobs started through a connector.
+
+When many threads share a connector, firing every job at once runs into
+BigQuery's concurrent-query and API rate limits, and the retries that
+follow make throughput collapse. A `JobScheduler` sits in front of
+every job submission instead: a token bucket spaces out the API calls
+that start jobs, a cap bounds how many jobs run at once, and waiting
+jobs are admitted by priority lane (interactive fetches ahead of batch
+pushes by default), first come first served within a lane. Calls that
+do not start a job, such as reading table metadata or pages of rows,
+take a token from the same bucket through `throttle()`.
+"""
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from easy_bigquery.logger import logger
+
+# Lower values are admitted first.
+DEFAULT_LANES = {'interactive': 0, 'batch': 1}
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket limiting the rate of API calls.
+
+    Tokens accrue at `rate` per second up to `capacity`; each call
+    takes one, waiting if none is available.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Initializes a full bucket.
+
+        Args:
+            rate: The sustained number of calls per second.
+            capacity: The burst size. Defaults to `max(1, rate)`.
+
+        Raises:
+            ValueError: If `rate` is not positive.
+        """
+        if rate <= 0:
+            raise ValueError('The token rate must be positive.')
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1) -> float:
+        """
+        Takes tokens, sleeping until enough have accrued.
+
+        Args:
+            tokens: The number of tokens to take. Defaults to 1.
+
+        Returns:
+            The number of seconds spent waiting.
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated) * self.rate,
+                )
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                pause = (tokens - self._tokens) / self.rate
+            time.sleep(pause)
+            waited += pause
+
+
+@dataclass(frozen=True)
+class SchedulerMetrics:
+    """
+    A snapshot of a scheduler's state, for tuning its limits.
+
+    Attributes:
+        running (int): The jobs currently admitted.
+        queued (Dict[str, int]): The jobs waiting, per lane.
+        admitted (Dict[str, int]): The jobs admitted so far, per lane.
+        mean_wait (Dict[str, float]): The mean seconds between asking
+            for and getting a slot (rate limiting included), per lane.
+        max_wait (Dict[str, float]): The longest such wait, per lane.
+        throttled_seconds (float): The total time spent waiting for
+            API tokens.
+    """
+
+    running: int
+    queued: Dict[str, int]
+    admitted: Dict[str, int]
+    mean_wait: Dict[str, float]
+    max_wait: Dict[str, float]
+    throttled_seconds: float
+
+
+class JobScheduler:
+    """
+    Admits jobs by priority under a concurrency cap and a rate limit.
+
+    Workers wrap each job, from submission until its results are read,
+    in `slot()`. Without limits (the default) slots are granted
+    immediately and the scheduler only collects metrics. Lanes are
+    strict priorities, so a steady stream of interactive work can
+    delay batch work indefinitely.
+
+    Attributes:
+        max_concurrent_jobs (Optional[int]): The cap on jobs running at
+            once, or None for no cap.
+        requests_per_second (Optional[float]): The rate of job
+            submissions and throttled API calls, or None for no limit.
+        burst (Optional[float]): The number of submissions allowed at
+            once before the rate applies.
+        lanes (Dict[str, int]): The priority of each lane (lower
+            first).
+
+    Example:
+        ```python
+        from concurrent.futures import ThreadPoolExecutor
+
+        with BQManager(max_concurrent_jobs=4, requests_per_second=5) as bq:
+            with ThreadPoolExecutor(16) as pool:
+                pool.map(bq.fetch, queries)
+            print(bq.connector.scheduler.metrics())
+        ```
+    """
+
+    def __init__(
+        self,
+        max_concurrent_jobs: Optional[int] = None,
+        requests_per_second: Optional[float] = None,
+        burst: Optional[float] = None,
+        lanes: Optional[Dict[str, int]] = None,
+    ):
+        """
+        Initializes the JobScheduler.
+
+        Args:
+            max_concurrent_jobs: The cap on jobs running at once. None
+                or 0 disables the cap.
+            requests_per_second: The sustained rate of job submissions
+                and throttled API calls. None or 0 disables rate
+                limiting.
+            burst: The token bucket capacity. Defaults to
+                `max(1, requests_per_second)`.
+            lanes: The priority of each lane, lower first. Defaults to
+                'interactive' ahead of 'batch'.
+        """
+        self.max_concurrent_jobs = max_concurrent_jobs or None
+        self.requests_per_second = requests_per_second or None
+        self.burst = burst
+        self.lanes = dict(lanes or DEFAULT_LANES)
+        self._bucket = (
+            TokenBucket(self.requests_per_second, burst)
+            if self.requests_per_second
+            else None
+        )
+        self._condition = threading.Condition()
+        self._waiting: List[Tuple[int, int]] = []
+        self._tickets = itertools.count()
+        self._running = 0
+        self._queued = {lane: 0 for lane in self.lanes}
+        self._admitted = {lane: 0 for lane in self.lanes}
+        self._wait_total = {lane: 0.0 for lane in self.lanes}
+        self._wait_max = {lane: 0.0 for lane in self.lanes}
+        self._throttled = 0.0
+
+    def __getstate__(self) -> Dict[str, object]:
+        """Pickles the limits only; the receiver starts with no state."""
+        return {
+            'max_concurrent_jobs': self.max_concurrent_jobs,
+            'requests_per_second': self.requests_per_second,
+            'burst': self.burst,
+            'lanes': self.lanes,
+        }
+
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        self.__init__(**state)
+
+    def reset(self) -> 'JobScheduler':
+        """Returns a scheduler with the same limits and no state."""
+        return JobScheduler(**self.__getstate__())
+
+    @contextmanager
+    def slot(self, lane: str = 'interactive') -> Iterator[None]:
+        """
+        Holds an admission slot for the duration of a `with` block.
+
+        Args:
+            lane: The priority lane of the job. Defaults to
+                'interactive'.
+
+        Raises:
+            ValueError: If the lane is unknown.
+        """
+        if lane not in self.lanes:
+            raise ValueError(
+                f'Unknown lane {lane!r}; expected one of {list(self.lanes)}.'
+            )
+        start = time.monotonic()
+        ticket = (self.lanes[lane], next(self._tickets))
+        with self._condition:
+            heapq.heappush(self._waiting, ticket)
+            self._queued[lane] += 1
+            try:
+                while self._waiting[0] != ticket or self._full():
+                    self._condition.wait()
+            finally:
+                self._queued[lane] -= 1
+                self._waiting.remove(ticket)
+                heapq.heapify(self._waiting)
+                # The next ticket may be admissible now.
+                self._condition.notify_all()
+            self._running += 1
+        try:
+            self.throttle()
+            waited = time.monotonic() - start
+            with self._condition:
+                self._admitted[lane] += 1
+                self._wait_total[lane] += waited
+                self._wait_max[lane] = max(self._wait_max[lane], waited)
+            if waited > 1:
+                logger.debug(f'Job in lane {lane!r} waited {waited:.1f}s.')
+            yield
+        finally:
+            with self._condition:
+                self._running -= 1
+                self._condition.notify_all()
+
+    def throttle(self) -> float:
+        """
+        Takes an API token, without holding a slot.
+
+        Used before API calls that do not start a job (table metadata,
+        row pages) so they count against the same rate limit as job
+        submissions. Returns immediately without a rate limit.
+
+        Returns:
+            The number of seconds spent waiting.
+        """
+        if self._bucket is None:
+            return 0.0
+        throttled = self._bucket.acquire()
+        with self._condition:
+            self._throttled += throttled
+        return throttled
+
+    def metrics(self) -> SchedulerMetrics:
+        """Returns a snapshot of the queue depth and wait times."""
+        with self._condition:
+            return SchedulerMetrics(
+                running=self._running,
+                queued=dict(self._queued),
+                admitted=dict(self._admitted),
+                mean_wait={
+                    lane: self._wait_total[lane] / count if count else 0.0
+                    for lane, count in self._admitted.items()
+                },
+                max_wait=dict(self._wait_max),
+                throttled_seconds=self._throttled,
+            )
+
+    def _full(self) -> bool:
+        """Whether the concurrency cap is reached. Requires the lock."""
+        return (
+            self.max_concurrent_jobs is not None
+            and self._running >= self.max_concurrent_jobs
+        )
@@ -0,0 +1,399 @@
+import graphlib
+import time
+import uuid
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Literal,
+    Optional,
+    Tuple,
+)
+
+from easy_bigquery.core.hashing import hash_value
+from easy_bigquery.logger import logger
+
+if TYPE_CHECKING:
+    from easy_bigquery.context.manager import BQManager
+
+# Step kinds that write to BigQuery rather than only produce a value.
+WRITING_KINDS = frozenset({'push', 'sql'})
+# Step kinds whose inputs are all outputs of other steps, and so can be
+# skipped when those are unchanged. Fetch and SQL steps read BigQuery.
+SKIPPABLE_KINDS = frozenset({'transform', 'push'})
+
+
+@dataclass(frozen=True)
+class StepResult:
+    """
+    The outcome of one step of a `JobGraph` run.
+
+    Attributes:
+        name (str): The step name.
+        status (str): 'ran' if the step executed, or 'skipped' if its
+            inputs were unchanged since the previous run.
+        seconds (float): The wall time spent on the step.
+        output (Any): The value produced by the step (a DataFrame for
+            fetch and transform steps, None for push steps).
+        output_hash (Optional[str]): The content hash of `output`. For
+            push and SQL steps, which write to BigQuery, a token that
+            changes every time the step runs, so that steps reading
+            what they wrote are not skipped.
+    """
+
+    name: str
+    status: Literal['ran', 'skipped']
+    seconds: float
+    output: Any = None
+    output_hash: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class _Step:
+    """A registered step: how to run it and what it depends on."""
+
+    name: str
+    kind: str
+    run: Callable[[Dict[str, Any]], Any]
+    definition: str
+    depends_on: Tuple[str, ...]
+
+
+def _callable_identity(func: Callable) -> str:
+    """Describes a callable well enough to notice when it changes."""
+    code = getattr(func, '__code__', None)
+    return repr(
+        (
+            getattr(func, '__module__', None),
+            getattr(func, '__qualname__', repr(func)),
+            hash_value(code.co_code) if code else None,
+        )
+    )
+
+
+class JobGraph:
+    """
+    Runs named fetch, transform, push and SQL steps as a dependency DAG.
+
+    Steps whose dependencies are satisfied run concurrently on a thread
+    pool and share the manager's connector. Outputs are handed to
+    dependent steps in memory. Every output is content-hashed, and a
+    transform or push step is skipped (reusing its previous output)
+    when its definition and the hashes of all its inputs are unchanged
+    since the last run of the same graph. Fetch and SQL steps always
+    run, even with dependencies, because their real inputs live in
+    BigQuery, and steps downstream of a push or SQL step that ran are
+    never skipped, since that step may have changed their input
+    tables.
+
+    Instances are created with `BQManager.graph()`.
+
+    Example:
+        ```python
+        with BQManager() as bq:
+            graph = (
+                bq.graph(max_workers=4)
+                .fetch('orders', 'SELECT * FROM `p.d.orders`')
+                .fetch('users', 'SELECT * FROM `p.d.users`')
+                .transform(
+                    'joined',
+                    lambda orders, users: orders.merge(users, on='user_id'),
+                    depends_on=['orders', 'users'],
+                )
+                .push('save', source='joined', table='orders_by_user')
+            )
+            results = graph.run()
+            print(results['joined'].seconds)
+
+            # A second run skips 'joined' and 'save' if the fetched
+            # data did not change.
+            graph.run()
+        ```
+    """
+
+    def __init__(self, manager: 'BQManager', max_workers: int = 4):
+        """
+        Initializes the JobGraph.
+
+        Args:
+            manager: The active `BQManager` whose workers run the steps.
+            max_workers: The maximum number of steps running at once.
+                Defaults to 4.
+        """
+        self.manager = manager
+        self.max_workers = max_workers
+        self._steps: Dict[str, _Step] = {}
+        self._previous: Dict[str, Tuple[str, StepResult]] = {}
+
+    def fetch(
+        self,
+        name: str,
+        query: str,
+        depends_on: Iterable[str] = (),
+        params: Any = None,
+        **kwargs: Any,
+    ) -> 'JobGraph':
+        """
+        Adds a step that fetches a query result into a DataFrame.
+
+        Args:
+            name: The unique step name.
+            query: The SQL query to execute.
+            depends_on: Names of steps that must finish first.
+            params: An optional mapping of query parameters, or a
+                callable that receives a dict of the dependency outputs
+                and returns that mapping.
+            **kwargs: Additional arguments for `BQManager.fetch`.
+
+        Returns:
+            The graph itself, to allow chaining.
+        """
+
+        def run(inputs: Dict[str, Any]) -> Any:
+            values = params(inputs) if callable(params) else params
+            return self.manager.fetch(query, params=values, **kwargs)
+
+        described = _callable_identity(params) if callable(params) else params
+        return self._add(
+            name, 'fetch', run, (query, described, kwargs), depends_on
+        )
+
+    def transform(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        depends_on: Iterable[str],
+    ) -> 'JobGraph':
+        """
+        Adds a local step computed from the outputs of other steps.
+
+        Args:
+            name: The unique step name.
+            func: A callable receiving the outputs of `depends_on`
+                positionally, in the same order.
+            depends_on: Names of the steps whose outputs are passed.
+
+        Returns:
+            The graph itself, to allow chaining.
+        """
+        depends_on = tuple(depends_on)
+
+        def run(inputs: Dict[str, Any]) -> Any:
+            return func(*(inputs[dep] for dep in depends_on))
+
+        return self._add(
+            name, 'transform', run, _callable_identity(func), depends_on
+        )
+
+    def push(
+        self,
+        name: str,
+        source: str,
+        table: str,
+        project_id: Optional[str] = None,
+        dataset: Optional[str] = None,
+        depends_on: Iterable[str] = (),
+        **kwargs: Any,
+    ) -> 'JobGraph':
+        """
+        Adds a step that pushes the output of another step to a table.
+
+        Args:
+            name: The unique step name.
+            source: The name of the step producing the DataFrame.
+            table: The destination table name.
+            project_id: Optional GCP project ID.
+            dataset: Optional dataset name.
+            depends_on: Names of additional steps that must finish
+                first. `source` is always a dependency.
+            **kwargs: Additional arguments for `BQManager.push` (e.g.,
+                `write_disposition`).
+
+        Returns:
+            The graph itself, to allow chaining.
+        """
+
+        def run(inputs: Dict[str, Any]) -> None:
+            self.manager.push(
+                inputs[source],
+                project_id=project_id,
+                dataset=dataset,
+                table=table,
+                **kwargs,
+            )
+
+        return self._add(
+            name,
+            'push',
+            run,
+            (source, project_id, dataset, table, kwargs),
+            (source, *depends_on),
+        )
+
+    def sql(
+        self,
+        name: str,
+        query: str,
+        depends_on: Iterable[str] = (),
+        params: Optional[Dict[str, Any]] = None,
+    ) -> 'JobGraph':
+        """
+        Adds a step that executes a statement without fetching rows.
+
+        Args:
+            name: The unique step name.
+            query: The SQL statement (DDL, DML or a script).
+            depends_on: Names of steps that must finish first.
+            params: An optional mapping of query parameters.
+
+        Returns:
+            The graph itself, to allow chaining.
+        """
+
+        def run(inputs: Dict[str, Any]) -> Any:
+            return self.manager.execute(query, params=params)
+
+        return self._add(name, 'sql', run, (query, params), depends_on)
+
+    def run(self) -> Dict[str, StepResult]:
+        """
+        Runs every step, honoring dependencies.
+
+        Returns:
+            A dict mapping step names to their `StepResult`.
+
+        Raises:
+            ValueError: If a dependency is unknown or the graph has a
+                cycle.
+            RuntimeError: If a step fails. Steps already running are
+                allowed to finish; no further steps are started.
+        """
+        for step in self._steps.values():
+            unknown = set(step.depends_on) - self._steps.keys()
+            if unknown:
+                raise ValueError(
+                    f'Step {step.name!r} depends on unknown steps: '
+                    f'{sorted(unknown)}'
+                )
+        sorter = graphlib.TopologicalSorter(
+            {name: step.depends_on for name, step in self._steps.items()}
+        )
+        try:
+            sorter.prepare()
+        except graphlib.CycleError as error:
+            raise ValueError(f'Job graph has a cycle: {error.args[1]}')
+
+        results: Dict[str, StepResult] = {}
+        failure: Optional[Tuple[str, BaseException]] = None
+        start = time.perf_counter()
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix='easy-bigquery'
+        ) as pool:
+            running: Dict[Future, str] = {}
+            while sorter.is_active():
+                if failure is None:
+                    for name in sorter.get_ready():
+                        future = pool.submit(
+                            self._execute, self._steps[name], results
+                        )
+                        running[future] = name
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        results[name] = future.result()
+                    except Exception as error:
+                        logger.error(f'Step {name!r} failed: {error}')
+                        failure = failure or (name, error)
+                    else:
+                        sorter.done(name)
+
+        if failure is not None:
+            name, error = failure
+            raise RuntimeError(f'Step {name!r} failed.') from error
+        logger.info(
+            f'Job graph finished {len(results)} steps in '
+            f'{time.perf_counter() - start:.3f}s: '
+            + ', '.join(
+                f'{result.name}={result.status}({result.seconds:.3f}s)'
+                for result in results.values()
+            )
+        )
+        return results
+
+    def _add(
+        self,
+        name: str,
+        kind: str,
+        run: Callable[[Dict[str, Any]], Any],
+        definition: Any,
+        depends_on: Iterable[str],
+    ) -> 'JobGraph':
+        """Registers a step under a unique name."""
+        if name in self._steps:
+            raise ValueError(f'Duplicate step name: {name!r}')
+        self._steps[name] = _Step(
+            name, kind, run, repr(definition), tuple(depends_on)
+        )
+        return self
+
+    def _execute(
+        self, step: _Step, results: Dict[str, StepResult]
+    ) -> StepResult:
+        """Runs one step, or reuses its previous output if unchanged."""
+        start = time.perf_counter()
+        fingerprint = hash_value(
+            (
+                step.kind,
+                step.definition,
+                [results[dep].output_hash for dep in step.depends_on],
+            )
+        )
+        previous = self._previous.get(step.name)
+        if (
+            step.kind in SKIPPABLE_KINDS
+            and step.depends_on
+            and previous
+            and previous[0] == fingerprint
+        ):
+            result = StepResult(
+                step.name,
+                'skipped',
+                time.perf_counter() - start,
+                previous[1].output,
+                previous[1].output_hash,
+            )
+        else:
+            output = step.run(
+                {dep: results[dep].output for dep in step.depends_on}
+            )
+            if step.kind in WRITING_KINDS:
+                # Whatever reads the written tables must run again.
+                output_hash = uuid.uuid4().hex
+            elif output is None:
+                output_hash = None
+            else:
+                output_hash = hash_value(output)
+            result = StepResult(
+                step.name,
+                'ran',
+                time.perf_counter() - start,
+                output,
+                output_hash,
+            )
+        logger.info(
+            f'Step {step.name!r} {result.status} in {result.seconds:.3f}s'
+        )
+        self._previous[step.name] = (fingerprint, result)
+        return result
@@ -1,11 +1,30 @@
-from typing import Any, List, Literal, Optional
+import copy
+import threading
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
 
 import pandas as pd
+import pyarrow as pa
 from google.cloud import bigquery as bq
 
 from easy_bigquery.connector.connector import BQConnector
+from easy_bigquery.context.dag import JobGraph
+from easy_bigquery.workers.cursor import QueryCursor
+from easy_bigquery.workers.export import GCSStorage
 from easy_bigquery.workers.fetch import FetchWorker
+from easy_bigquery.workers.local import LocalTier
+from easy_bigquery.workers.materialize import MaterializedTable
 from easy_bigquery.workers.push import PushWorker
+from easy_bigquery.workers.shared import SharedTable
 
 
 class BQManager:
@@ -18,12 +37,36 @@ class BQManager:
     automatically. Internally, it orchestrates the Connector, Fetcher,
     and Pusher classes.
 
+    Entering the manager is reference-counted: the connection is made
+    on the first entry and closed when the last entry exits, so nested
+    `with` blocks, and threads entering the same manager, share one set
+    of clients. Calls in progress also hold the connection: the last
+    exit refuses new calls, waits for the running ones to return, then
+    cancels jobs still in flight (e.g. of unfinished cursors) and
+    closes the clients.
+
+    In thread-safe mode, one manager can be shared by many threads,
+    e.g. the request handlers of a threaded web server. The clients and
+    the connector (its job registry and scheduler) are shared, but each
+    call runs on a lightweight copy of the fetcher or pusher, so
+    per-call state such as `last_profile` never leaks between threads;
+    pass a `Profile` to collect profiles in this mode. The copies also
+    share one export storage, and so one Cloud Storage client. Calls
+    made after the last exit or `close()` raise `ConnectionError`; the
+    last exit must not be made from within a call.
+
     Attributes:
         connector (BQConnector): The underlying connector instance.
         fetcher (Optional[FetchWorker]): The fetcher instance,
             available after the context is entered.
         pusher (Optional[PushWorker]): The pusher instance,
             available after the context is entered.
+        local_tier (Optional[LocalTier]): The local execution tier,
+            available after `enable_local_tier()` is called.
+        timeout (Optional[float]): The default deadline in seconds for
+            fetches, statements and pushes that do not pass their own
+            `timeout`.
+        thread_safe (bool): Whether calls run on per-call workers.
 
     Example:
         ```python
@@ -50,46 +93,356 @@ class BQManager:
                 table=table_name,
                 write_disposition='WRITE_APPEND',
             )
+
+        # 3. Share one manager across threads.
+        from concurrent.futures import ThreadPoolExecutor
+
+        shared = BQManager(thread_safe=True).open()
+        try:
+            with ThreadPoolExecutor(8) as pool:
+                frames = list(pool.map(shared.fetch, queries))
+        finally:
+            shared.close()
         ```
     """
 
-    def __init__(self, **kwargs: Any):
+    def __init__(
+        self,
+        timeout: Optional[float] = None,
+        thread_safe: bool = False,
+        **kwargs: Any,
+    ):
         """
         Initializes the manager by creating a connector.
 
         Args:
+            timeout: An optional default deadline in seconds for each
+                job started through the manager. Jobs exceeding it are
+                cancelled server-side and raise `TimeoutError`.
+            thread_safe: If True, every call runs on its own shallow
+                copy of the fetcher or pusher, so one manager can serve
+                many threads at once. Defaults to False.
             **kwargs: Keyword arguments to be passed down to the
                 `BQConnector` constructor (e.g., `project_id`).
         """
+        self.timeout = timeout
+        self.thread_safe = thread_safe
         self.connector = BQConnector(**kwargs)
         self.fetcher: Optional[FetchWorker] = None
         self.pusher: Optional[PushWorker] = None
+        self.local_tier: Optional[LocalTier] = None
+        self._users = 0
+        self._calls = 0
+        self._closing = False
+        self._condition = threading.Condition()
 
     def __enter__(self) -> 'BQManager':
-        """Establishes connection and initializes service classes."""
-        self.connector.connect()
-        self.fetcher = FetchWorker(self.connector)
-        self.pusher = PushWorker(self.connector)
+        """Connects on the first entry and counts nested entries."""
+        with self._condition:
+            while self._closing:
+                self._condition.wait()
+            if not self._users:
+                self.connector.connect()
+                self.fetcher = FetchWorker(self.connector)
+                if self.thread_safe:
+                    # Created here so the per-call copies share it,
+                    # rather than each creating its own client.
+                    self.fetcher.export_storage = GCSStorage(
+                        project=self.connector.project_id,
+                        credentials=self.connector.credentials,
+                    )
+                self.pusher = PushWorker(self.connector)
+            self._users += 1
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        """Closes the connection."""
-        self.connector.close()
+        """
+        Closes the connection when the last entry exits.
+
+        The last exit waits for calls in progress to return, then
+        cancels jobs still in flight; earlier exits leave the clients
+        and jobs of the remaining users untouched.
+        """
+        with self._condition:
+            if not self._users:
+                return
+            self._users -= 1
+            if self._users:
+                return
+            # Refuse new calls, then let the running ones finish.
+            self.fetcher = None
+            self.pusher = None
+            self._closing = True
+            try:
+                while self._calls:
+                    self._condition.wait()
+                self.connector.jobs.cancel_all()
+                self.connector.close()
+            finally:
+                self._closing = False
+                self._condition.notify_all()
+
+    def open(self) -> 'BQManager':
+        """
+        Connects outside a `with` block, e.g. at application startup.
+
+        Equivalent to entering the context; balance it with `close()`.
+        """
+        return self.__enter__()
+
+    def close(self) -> None:
+        """Releases a reference taken by `open()` or `with`."""
+        self.__exit__(None, None, None)
+
+    @contextmanager
+    def _worker(self, name: str) -> Iterator[Any]:
+        """
+        Lends the fetcher or pusher for one call.
+
+        The call is counted until the block exits, so the last exit of
+        the manager does not close the clients underneath it.
+
+        Raises:
+            ConnectionError: If the manager is not entered.
+        """
+        with self._condition:
+            worker = getattr(self, name)
+            if worker is None:
+                raise ConnectionError('Manager context is not active.')
+            self._calls += 1
+        try:
+            yield copy.copy(worker) if self.thread_safe else worker
+        finally:
+            with self._condition:
+                self._calls -= 1
+                self._condition.notify_all()
+
+    def _fetcher(self) -> Iterator[FetchWorker]:
+        """Lends the fetcher for one call."""
+        return self._worker('fetcher')
+
+    def _pusher(self) -> Iterator[PushWorker]:
+        """Lends the pusher for one call."""
+        return self._worker('pusher')
+
+    def _with_timeout(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Applies the manager's default deadline to a call's kwargs."""
+        if self.timeout is not None:
+            kwargs.setdefault('timeout', self.timeout)
+        return kwargs
 
     def fetch(self, query: str, **kwargs: Any) -> pd.DataFrame:
         """
         High-level method to fetch data. Delegates to FetchWorker.
 
+        If the local tier is enabled and the call has no options other
+        than `params`, the query is first offered to the tier and only
+        sent to BigQuery when it cannot be served locally.
+
         Args:
             query: The SQL query to execute.
-            **kwargs: Additional arguments for the fetcher.
+            **kwargs: Additional arguments for the fetcher (e.g.,
+                `params` to bind values to `@name` placeholders, or
+                `timeout` and `handle` to bound or cancel the job).
 
         Returns:
             A pandas DataFrame with the query results.
         """
-        if not self.fetcher:
-            raise ConnectionError('Manager context is not active.')
-        return self.fetcher.fetch(query, **kwargs)
+        with self._fetcher() as fetcher:
+            if self.local_tier is not None and kwargs.keys() <= {'params'}:
+                df = self.local_tier.query(query, kwargs.get('params'))
+                if df is not None:
+                    return df
+            return fetcher.fetch(query, **self._with_timeout(kwargs))
+
+    def enable_local_tier(
+        self,
+        cache_dir: str,
+        tables: Union[Iterable[str], Dict[str, Optional[str]]],
+        max_staleness: Optional[float] = None,
+        refresh: bool = True,
+    ) -> LocalTier:
+        """
+        Serves compatible queries from local snapshots with DuckDB.
+
+        Requires the optional `duckdb` dependency
+        (`pip install 'easy-bigquery[local]'`).
+
+        Args:
+            cache_dir: The directory where snapshots are stored.
+            tables: An iterable of table IDs, or a dict mapping table
+                IDs to an optional incremental column.
+            max_staleness: An optional maximum snapshot age in seconds
+                after which a snapshot is refreshed before use.
+            refresh: If True, snapshots the tables immediately.
+                Defaults to True.
+
+        Returns:
+            The `LocalTier`, which can be used to refresh snapshots.
+        """
+        with self._fetcher():
+            self.local_tier = LocalTier(
+                self.connector, cache_dir, max_staleness=max_staleness
+            ).add_tables(tables, refresh=refresh)
+        return self.local_tier
+
+    def iter_batches(
+        self, query: str, **kwargs: Any
+    ) -> Iterator[pa.RecordBatch]:
+        """
+        High-level method to stream a result as Arrow batches.
+        Delegates to FetchWorker.
+
+        Args:
+            query: The SQL query to execute.
+            **kwargs: Additional arguments for the fetcher (e.g.,
+                `params` or `use_storage_api`).
+
+        Returns:
+            An iterator of `pyarrow.RecordBatch` objects.
+        """
+        with self._fetcher() as fetcher:
+            return fetcher.iter_batches(query, **self._with_timeout(kwargs))
+
+    def fetch_shared(self, query: str, **kwargs: Any) -> SharedTable:
+        """
+        High-level method to fetch data into shared memory. Delegates to
+        FetchWorker.
+
+        Args:
+            query: The SQL query to execute.
+            **kwargs: Additional arguments for the fetcher (e.g.,
+                `params` or `refs`).
+
+        Returns:
+            A `SharedTable` handle that worker processes can open
+            zero-copy.
+        """
+        with self._fetcher() as fetcher:
+            return fetcher.fetch_shared(query, **self._with_timeout(kwargs))
+
+    def execute(self, query: str, **kwargs: Any) -> Optional[int]:
+        """
+        High-level method to run a statement. Delegates to FetchWorker.
+
+        Args:
+            query: The SQL statement to execute.
+            **kwargs: Additional arguments for the fetcher (e.g.,
+                `params`).
+
+        Returns:
+            The number of rows affected by a DML statement, or None.
+        """
+        with self._fetcher() as fetcher:
+            return fetcher.execute(query, **self._with_timeout(kwargs))
+
+    def materialize(
+        self, query: str, ttl: float = 3600, **kwargs: Any
+    ) -> MaterializedTable:
+        """
+        High-level method to store a query result in an expiring table.
+        Delegates to FetchWorker.
+
+        Args:
+            query: The SQL query to execute.
+            ttl: The number of seconds the result is kept. Defaults to
+                one hour.
+            **kwargs: Additional arguments for the fetcher (e.g.,
+                `params`, `dataset` or `refresh`).
+
+        Returns:
+            A `MaterializedTable` usable in later SQL and in
+            `read_table()`.
+        """
+        with self._fetcher() as fetcher:
+            return fetcher.materialize(
+                query, ttl=ttl, **self._with_timeout(kwargs)
+            )
+
+    def export(self, query: str, directory: str, **kwargs: Any) -> List[str]:
+        """
+        High-level method to export a large result to local files.
+        Delegates to FetchWorker.
+
+        Args:
+            query: The SQL query string to execute.
+            directory: The local directory to download the shards to.
+            **kwargs: Additional arguments for the fetcher (e.g.,
+                `destination_uri` or `destination_format`).
+
+        Returns:
+            The local paths of the exported shards.
+        """
+        with self._fetcher() as fetcher:
+            return fetcher.export(
+                query, directory, **self._with_timeout(kwargs)
+            )
+
+    def preview(
+        self, source: Union[str, MaterializedTable], n: int = 10, **kwargs: Any
+    ) -> pd.DataFrame:
+        """
+        High-level method to look at the first rows of a table or query.
+        Delegates to FetchWorker.
+
+        Args:
+            source: A table path, a `MaterializedTable` or a SQL query.
+            n: The number of rows to return. Defaults to 10.
+            **kwargs: Additional arguments for the fetcher (e.g.,
+                `params` for queries; ignored for tables).
+
+        Returns:
+            A pandas DataFrame with at most `n` rows.
+        """
+        with self._fetcher() as fetcher:
+            return fetcher.preview(source, n=n, **self._with_timeout(kwargs))
+
+    def read_table(
+        self, table: Union[str, MaterializedTable], **kwargs: Any
+    ) -> pd.DataFrame:
+        """
+        High-level method to download a table without a query.
+        Delegates to FetchWorker.
+
+        Args:
+            table: A full table path or a `MaterializedTable`.
+            **kwargs: Additional arguments for the fetcher (e.g.,
+                `columns` or `max_results`).
+
+        Returns:
+            A pandas DataFrame with the table rows.
+        """
+        with self._fetcher() as fetcher:
+            return fetcher.read_table(table, **kwargs)
+
+    def graph(self, max_workers: int = 4) -> JobGraph:
+        """
+        Creates a job graph whose steps run through this manager.
+
+        Args:
+            max_workers: The maximum number of steps running at once.
+                Defaults to 4.
+
+        Returns:
+            An empty `JobGraph` to which steps can be added.
+        """
+        return JobGraph(self, max_workers=max_workers)
+
+    def open_cursor(self, query: str, **kwargs: Any) -> QueryCursor:
+        """
+        High-level method to page through results. Delegates to
+        FetchWorker.
+
+        Args:
+            query: The SQL query to execute.
+            **kwargs: Additional arguments for the fetcher (e.g.,
+                `params` or `prefetch`).
+
+        Returns:
+            A `QueryCursor` serving pages of the query result.
+        """
+        with self._fetcher() as fetcher:
+            return fetcher.open_cursor(query, **self._with_timeout(kwargs))
 
     def push(
         self,
@@ -105,6 +458,7 @@ class BQManager:
             'WRITE_DISPOSITION_UNSPECIFIED',
             'WRITE_TRUNCATE_DATA',
         ] = 'WRITE_APPEND',
+        **kwargs: Any,
     ) -> None:
         """
         High-level method to push data. Delegates to PushWorker.
@@ -121,14 +475,16 @@ class BQManager:
             write_disposition: Write mode ('WRITE_TRUNCATE', 'WRITE_APPEND',
                 'WRITE_EMPTY', 'WRITE_DISPOSITION_UNSPECIFIED',
                 'WRITE_TRUNCATE_DATA'. Defaults to 'WRITE_APPEND').
+            **kwargs: Additional arguments for the pusher (e.g.,
+                `source_format`, `compression` or `timeout`).
         """
-        if not self.pusher:
-            raise ConnectionError('Manager context is not active.')
-        self.pusher.push(
-            df,
-            project_id,
-            dataset,
-            table,
-            schema,
-            write_disposition,
-        )
+        with self._pusher() as pusher:
+            pusher.push(
+                df,
+                project_id,
+                dataset,
+                table,
+                schema,
+                write_disposition,
+                **self._with_timeout(kwargs),
+            )
@@ -20,3 +20,47 @@ BQ_JSON_CREDENTIALS = config('BQ_JSON_CREDENTIALS', cast=str, default=None)
 BQ_PROJECT_ID = config('BQ_PROJECT_ID', cast=str, default=None)
 BQ_TABLE_NAME = config('BQ_TABLE_NAME', cast=str, default=None)
 BQ_DATASET = config('BQ_DATASET', cast=str, default=None)
+
+# Seconds between checks of the background credentials refresher.
+# Tokens expiring within the refresh margin are renewed proactively;
+# set to 0 to disable the background thread.
+BQ_CREDENTIALS_REFRESH_INTERVAL = config(
+    'BQ_CREDENTIALS_REFRESH_INTERVAL', cast=float, default=60
+)
+
+# Local manifest of content hashes used by PushWorker to skip pushes
+# whose data did not change since the last successful load.
+BQ_PUSH_MANIFEST = config(
+    'BQ_PUSH_MANIFEST',
+    cast=str,
+    default=os.path.join(
+        pathlib.Path.home(), '.cache', 'easy_bigquery', 'push_manifest.json'
+    ),
+)
+
+# Dataset where BQManager.materialize() stores auto-expiring result
+# tables. Defaults to the connector's dataset when unset.
+BQ_MATERIALIZE_DATASET = config(
+    'BQ_MATERIALIZE_DATASET', cast=str, default=None
+)
+
+# Process-wide default for the `profile=` option of fetch and push:
+# empty to disable, 'phases' for per-phase timings and memory peaks,
+# or 'sampling' to also sample stacks. Reports are logged.
+BQ_PROFILE = config('BQ_PROFILE', cast=str, default='')
+
+# Admission control of the jobs started through a connector: the cap
+# on jobs running at once and the rate of job submissions per second.
+# 0 disables the corresponding limit.
+BQ_MAX_CONCURRENT_JOBS = config('BQ_MAX_CONCURRENT_JOBS', cast=int, default=0)
+BQ_REQUESTS_PER_SECOND = config(
+    'BQ_REQUESTS_PER_SECOND', cast=float, default=0
+)
+
+# Large-result exports: the base object storage URI under which extract
+# jobs write their shards (e.g. gs://bucket/tmp), and the result size
+# in bytes past which fetches switch to that path. 0 disables it.
+BQ_EXPORT_URI = config('BQ_EXPORT_URI', cast=str, default=None)
+BQ_EXPORT_THRESHOLD_BYTES = config(
+    'BQ_EXPORT_THRESHOLD_BYTES', cast=int, default=0
+)
@@ -0,0 +1,244 @@
+"""
+Query parameter binding for BigQuery standard SQL.
+
+This module maps plain Python values to BigQuery query parameters
+(`ScalarQueryParameter`, `ArrayQueryParameter`, `StructQueryParameter`)
+so callers can write `@name` placeholders instead of formatting
+literals into the SQL text. Keeping the SQL text constant lets
+BigQuery reuse cached results and removes the risk of injection.
+
+Both the placeholder names of a query template and the BigQuery types
+of a parameter signature are cached, so binding the same template in
+a tight loop only pays for building the parameter objects themselves.
+"""
+import datetime as dt
+import decimal
+import numbers
+import re
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+import numpy as np
+from google.cloud import bigquery as bq
+from google.cloud.bigquery.query import _AbstractQueryParameter
+
+# Tokens that may contain an '@' without it being a parameter: string
+# literals, quoted identifiers, comments and '@@' system variables.
+_TOKEN_PATTERN = re.compile(
+    r"""
+    '''.*?'''
+    | \"\"\".*?\"\"\"
+    | '(?:\\.|[^'\\])*'
+    | "(?:\\.|[^"\\])*"
+    | `[^`]*`
+    | --[^\n]*
+    | \#[^\n]*
+    | /\*.*?\*/
+    | @@\w+
+    | @(?P<name>[A-Za-z_]\w*)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+# Ordered so that subclasses are matched before their parents
+# (e.g. bool before int, datetime before date).
+_SCALAR_TYPES: Tuple[Tuple[Any, str], ...] = (
+    ((bool, np.bool_), 'BOOL'),
+    (numbers.Integral, 'INT64'),
+    (decimal.Decimal, 'NUMERIC'),
+    (numbers.Real, 'FLOAT64'),
+    (str, 'STRING'),
+    ((bytes, bytearray), 'BYTES'),
+    (dt.datetime, 'DATETIME'),
+    (dt.date, 'DATE'),
+    (dt.time, 'TIME'),
+)
+
+
+@lru_cache(maxsize=512)
+def template_names(query: str) -> FrozenSet[str]:
+    """
+    Returns the named parameters referenced by a query template.
+
+    Placeholders inside string literals, quoted identifiers and
+    comments are ignored, as are `@@` system variables. Results are
+    cached per query string.
+
+    Args:
+        query: The SQL query text.
+
+    Returns:
+        A frozenset with the parameter names, without the '@' prefix.
+
+    Example:
+        >>> sorted(template_names("SELECT @a, '@b', @@time_zone, @c"))
+        ['a', 'c']
+    """
+    return frozenset(
+        match.group('name')
+        for match in _TOKEN_PATTERN.finditer(query)
+        if match.group('name')
+    )
+
+
+def replace_placeholders(query: str, replace: Callable[[str], str]) -> str:
+    """
+    Rewrites the named placeholders of a query template.
+
+    Only real placeholders are rewritten; text inside string literals,
+    quoted identifiers and comments is left untouched.
+
+    Args:
+        query: The SQL query text.
+        replace: A callable receiving a parameter name (without '@')
+            and returning the replacement text.
+
+    Returns:
+        The query text with every placeholder replaced.
+
+    Example:
+        >>> replace_placeholders("SELECT @a, '@a'", lambda name: '$' + name)
+        "SELECT $a, '@a'"
+    """
+    return _TOKEN_PATTERN.sub(
+        lambda match: (
+            replace(match.group('name'))
+            if match.group('name')
+            else match.group(0)
+        ),
+        query,
+    )
+
+
+def _type_key(value: Any) -> Any:
+    """Returns the cache key describing the BigQuery type of a value."""
+    if isinstance(value, dt.datetime):
+        return (dt.datetime, value.tzinfo is not None)
+    if isinstance(value, (list, tuple)):
+        for item in value:
+            if item is not None:
+                return (list, _type_key(item))
+        raise ValueError(
+            'Cannot infer the element type of an empty or all-null '
+            'array parameter; pass a bigquery.ArrayQueryParameter instead.'
+        )
+    if isinstance(value, Mapping):
+        return (
+            dict,
+            tuple((key, _type_key(item)) for key, item in value.items()),
+        )
+    return type(value)
+
+
+@lru_cache(maxsize=512)
+def _scalar_type(key: Any) -> str:
+    """Resolves the BigQuery scalar type for a cached type key."""
+    if isinstance(key, tuple) and key[0] is dt.datetime:
+        return 'TIMESTAMP' if key[1] else 'DATETIME'
+    for python_types, bq_type in _SCALAR_TYPES:
+        if isinstance(key, type) and issubclass(key, python_types):
+            return bq_type
+    raise TypeError(f'Unsupported query parameter type: {key!r}')
+
+
+def _to_python(value: Any) -> Any:
+    """Converts numpy scalars to their builtin equivalents."""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _build(name: Optional[str], key: Any, value: Any):
+    """Builds a query parameter from a resolved type key and value."""
+    if isinstance(key, tuple) and key[0] is list:
+        item_key = key[1]
+        if isinstance(item_key, tuple) and item_key[0] is dict:
+            return bq.ArrayQueryParameter(
+                name,
+                'STRUCT',
+                [_build(None, item_key, item) for item in value],
+            )
+        return bq.ArrayQueryParameter(
+            name,
+            _scalar_type(item_key),
+            [_to_python(item) for item in value],
+        )
+    if isinstance(key, tuple) and key[0] is dict:
+        return bq.StructQueryParameter(
+            name,
+            *(
+                _build(field, field_key, value[field])
+                for field, field_key in key[1]
+            ),
+        )
+    return bq.ScalarQueryParameter(name, _scalar_type(key), _to_python(value))
+
+
+def build_query_parameters(params: Dict[str, Any]) -> list:
+    """
+    Converts a mapping of Python values into BigQuery query parameters.
+
+    Lists and tuples become `ArrayQueryParameter`, dicts become
+    `StructQueryParameter` and every other supported value becomes a
+    `ScalarQueryParameter`. Timezone-aware datetimes map to TIMESTAMP
+    and naive ones to DATETIME. Values that already are BigQuery query
+    parameter objects are passed through unchanged, which is the way
+    to bind NULLs or empty arrays with an explicit type.
+
+    Args:
+        params: A mapping of parameter name to value.
+
+    Returns:
+        A list of BigQuery query parameter objects.
+
+    Raises:
+        TypeError: If a value has no BigQuery equivalent.
+        ValueError: If the element type of an array cannot be inferred.
+    """
+    parameters = []
+    for name, value in params.items():
+        if isinstance(value, _AbstractQueryParameter):
+            parameters.append(value)
+        elif value is None:
+            raise ValueError(
+                f'Cannot infer the type of NULL parameter @{name}; pass a '
+                'bigquery.ScalarQueryParameter instead.'
+            )
+        else:
+            parameters.append(_build(name, _type_key(value), value))
+    return parameters
+
+
+def build_query_config(
+    query: str,
+    params: Dict[str, Any],
+    job_config: Optional[bq.QueryJobConfig] = None,
+) -> bq.QueryJobConfig:
+    """
+    Creates a query job configuration with the parameters bound.
+
+    Args:
+        query: The SQL query text containing `@name` placeholders.
+        params: A mapping of parameter name to value.
+        job_config: An optional existing configuration to extend.
+
+    Returns:
+        The query job configuration with `query_parameters` set.
+
+    Raises:
+        ValueError: If a placeholder in the query has no value.
+    """
+    missing = template_names(query) - params.keys()
+    if missing:
+        raise ValueError(
+            f'Missing values for query parameters: {sorted(missing)}'
+        )
+    job_config = job_config or bq.QueryJobConfig()
+    job_config.query_parameters = build_query_parameters(params)
+    return job_config
@@ -0,0 +1,416 @@
+"""
+Opt-in profiling of fetch and push calls.
+
+A `Profile` records the wall time, CPU time and peak traced memory of
+each phase of a call (e.g. job execution versus download). With a
+sampling interval, a background thread also samples the Python stacks
+of the profiled threads, attributing each sample to the current phase
+and to a category derived from the innermost recognized module
+(network, Arrow, pandas, ...), and keeps collapsed stacks that
+flamegraph tools accept.
+
+Profiling is enabled per call with `profile=True` (or `'sampling'`) or
+process-wide with the `BQ_PROFILE` setting, so a slow production job
+can be diagnosed without patching the library.
+"""
+import collections
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from typing import (
+    ContextManager,
+    Counter,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import pandas as pd
+
+from easy_bigquery.core.config import BQ_PROFILE
+from easy_bigquery.logger import logger
+
+# Interval between stack samples when sampling is enabled.
+DEFAULT_SAMPLE_INTERVAL = 0.005
+
+# Module prefixes identifying where a sampled thread spends its time;
+# the innermost frame matching a prefix decides the category.
+CATEGORIES: Tuple[Tuple[str, str], ...] = (
+    ('pyarrow', 'arrow'),
+    ('pandas', 'pandas'),
+    ('numpy', 'pandas'),
+    ('db_dtypes', 'pandas'),
+    ('grpc', 'network'),
+    ('google.cloud.bigquery_storage', 'network'),
+    ('google.api_core', 'network'),
+    ('google.auth', 'network'),
+    ('requests', 'network'),
+    ('urllib3', 'network'),
+    ('http', 'network'),
+    ('ssl', 'network'),
+    ('socket', 'network'),
+    ('threading', 'waiting'),
+    ('queue', 'waiting'),
+    ('concurrent', 'waiting'),
+    ('selectors', 'waiting'),
+)
+
+ProfileOption = Union[None, bool, str, 'Profile']
+
+# tracemalloc is process-wide, so the profiles of concurrent calls share
+# it: tracing is reference-counted, and the peak is only reset when no
+# other phase is being measured.
+_TRACING_LOCK = threading.Lock()
+_tracing_users = 0
+_started_tracing = False
+_active_phases = 0
+
+
+def _acquire_tracing() -> None:
+    """Starts tracing memory for one more profile, if needed."""
+    global _tracing_users, _started_tracing
+    with _TRACING_LOCK:
+        if not _tracing_users and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _started_tracing = True
+        _tracing_users += 1
+
+
+def _release_tracing() -> None:
+    """Stops tracing after the last profile, unless started elsewhere."""
+    global _tracing_users, _started_tracing
+    with _TRACING_LOCK:
+        _tracing_users -= 1
+        if not _tracing_users and _started_tracing:
+            tracemalloc.stop()
+            _started_tracing = False
+
+
+@dataclass(frozen=True)
+class PhaseStats:
+    """
+    The resources used by one phase of a profiled call.
+
+    Attributes:
+        name (str): The phase name.
+        wall (float): The elapsed time in seconds.
+        cpu (float): The process CPU time in seconds, including any
+            threads the phase started.
+        peak_bytes (Optional[int]): The peak traced memory of the
+            process during the phase, or None if memory tracing was
+            off.
+    """
+
+    name: str
+    wall: float
+    cpu: float
+    peak_bytes: Optional[int] = None
+
+
+class Profile:
+    """
+    Collects per-phase timings, memory peaks and optional stack samples.
+
+    Use it as a context manager around a call and wrap each phase in
+    `phase()`. Memory peaks come from `tracemalloc`, which is started
+    while any profile needs it if it was not already running (tracing
+    started elsewhere is never stopped). Peaks and CPU time are
+    process-wide, so concurrent work in other threads is included:
+    phases measured at the same time, in this or another profile,
+    share one peak, which each reports as its own.
+
+    Attributes:
+        label (str): A description of the profiled call.
+        phases (List[PhaseStats]): The completed phases, in order.
+        samples (Counter[Tuple[str, str]]): Stack sample counts per
+            `(phase, category)`.
+        stacks (Counter[str]): Sample counts per collapsed stack
+            (`outer;...;inner`), the input format of flamegraph tools.
+
+    Example:
+        ```python
+        from easy_bigquery.core.profiling import Profile
+
+        with BQManager() as bq:
+            with Profile('daily export', sample_interval=0.005) as profile:
+                df = bq.fetch('SELECT ...', profile=profile)
+                bq.push(df, table='export', profile=profile)
+        print(profile.report())
+        print(profile.collapsed_stacks())  # For flamegraph tools.
+        ```
+    """
+
+    enabled = True
+
+    def __init__(
+        self,
+        label: str = 'call',
+        trace_memory: bool = True,
+        sample_interval: Optional[float] = None,
+    ):
+        """
+        Initializes the Profile.
+
+        Args:
+            label: A description of the profiled call.
+            trace_memory: If True, records peak memory with
+                `tracemalloc`, which slows allocation-heavy code while
+                active. Defaults to True.
+            sample_interval: If set, samples stacks every this many
+                seconds. Defaults to None (no sampling).
+        """
+        self.label = label
+        self.trace_memory = trace_memory
+        self.sample_interval = sample_interval
+        self.phases: List[PhaseStats] = []
+        self.samples: Counter[Tuple[str, str]] = collections.Counter()
+        self.stacks: Counter[str] = collections.Counter()
+        self._current = 'other'
+        self._tracing = False
+        self._sampler: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._ignored: set = set()
+
+    def __enter__(self) -> 'Profile':
+        if self.trace_memory:
+            _acquire_tracing()
+            self._tracing = True
+        if self.sample_interval:
+            # Threads that already exist (other than the caller) are
+            # unrelated to the call; those started during it are not.
+            self._ignored = {
+                thread.ident
+                for thread in threading.enumerate()
+                if thread is not threading.current_thread()
+            }
+            self._stop.clear()
+            self._sampler = threading.Thread(
+                target=self._sample,
+                name='easy-bigquery-profiler',
+                daemon=True,
+            )
+            self._sampler.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if self._sampler is not None:
+            self._stop.set()
+            self._sampler.join()
+            self._sampler = None
+        if self._tracing:
+            _release_tracing()
+            self._tracing = False
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Measures a phase of the profiled call.
+
+        Args:
+            name: The phase name, e.g. 'job' or 'download'.
+        """
+        global _active_phases
+        with _TRACING_LOCK:
+            tracing = tracemalloc.is_tracing()
+            if tracing and not _active_phases:
+                # Other phases still rely on the peak they started with.
+                tracemalloc.reset_peak()
+            _active_phases += 1
+        previous, self._current = self._current, name
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            with _TRACING_LOCK:
+                _active_phases -= 1
+                peak = (
+                    tracemalloc.get_traced_memory()[1]
+                    if tracing and tracemalloc.is_tracing()
+                    else None
+                )
+            self.phases.append(
+                PhaseStats(
+                    name,
+                    time.perf_counter() - wall,
+                    time.process_time() - cpu,
+                    peak,
+                )
+            )
+            self._current = previous
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Returns the phase statistics as a DataFrame.
+
+        When stacks were sampled, the share of samples of each category
+        within a phase is added as a `<category>_pct` column.
+        """
+        report = pd.DataFrame(
+            [
+                {
+                    'phase': stats.name,
+                    'wall_s': round(stats.wall, 4),
+                    'cpu_s': round(stats.cpu, 4),
+                    'peak_mb': (
+                        None
+                        if stats.peak_bytes is None
+                        else round(stats.peak_bytes / 2**20, 2)
+                    ),
+                }
+                for stats in self.phases
+            ],
+            columns=['phase', 'wall_s', 'cpu_s', 'peak_mb'],
+        )
+        if self.samples:
+            counts = pd.Series(self.samples).unstack(fill_value=0)
+            shares = counts.div(counts.sum(axis=1), axis=0).mul(100)
+            shares.columns = [f'{column}_pct' for column in shares.columns]
+            report = report.join(shares.round(1), on='phase')
+        return report
+
+    def report(self, top: int = 10) -> str:
+        """
+        Returns a human-readable summary of the profile.
+
+        Args:
+            top: The number of hottest sampled stacks to include.
+                Defaults to 10.
+
+        Returns:
+            The phase table, followed by the hottest stacks when
+            sampling was enabled.
+        """
+        lines = [
+            f'Profile of {self.label}:',
+            self.to_frame().to_string(index=False),
+        ]
+        if self.stacks:
+            total = sum(self.stacks.values())
+            lines.append(f'Hottest of {total} sampled stacks:')
+            for stack, count in self.stacks.most_common(top):
+                frames = stack.split(';')
+                lines.append(
+                    f'  {100 * count / total:5.1f}%  '
+                    + ' <- '.join(reversed(frames[-3:]))
+                )
+        return '\n'.join(lines)
+
+    def collapsed_stacks(self) -> str:
+        """
+        Returns the sampled stacks in collapsed format.
+
+        Each line is `phase;outer;...;inner count`, ready for tools
+        such as `flamegraph.pl` or speedscope.
+        """
+        return '\n'.join(
+            f'{stack} {count}' for stack, count in self.stacks.most_common()
+        )
+
+    def _sample(self) -> None:
+        """Samples the stacks of the profiled threads until stopped."""
+        own = threading.get_ident()
+        while not self._stop.wait(self.sample_interval):
+            phase = self._current
+            for ident, frame in sys._current_frames().items():
+                if ident == own or ident in self._ignored:
+                    continue
+                names = []
+                category = None
+                while frame is not None:
+                    module = frame.f_globals.get('__name__', '?')
+                    if category is None:
+                        category = _categorize(module)
+                    names.append(f'{module}:{frame.f_code.co_name}')
+                    frame = frame.f_back
+                self.samples[(phase, category or 'other')] += 1
+                self.stacks[';'.join([phase] + names[::-1])] += 1
+
+
+class _NullProfile:
+    """Stands in for a Profile when profiling is off, at no cost."""
+
+    enabled = False
+
+    def phase(self, name: str) -> ContextManager[None]:
+        return nullcontext()
+
+
+NULL_PROFILE = _NullProfile()
+
+# What workers record phases into: a live profile or the no-op one.
+ProfileRecorder = Union[Profile, _NullProfile]
+
+
+def _categorize(module: str) -> Optional[str]:
+    """Maps a module name to a sample category, if it is recognized."""
+    for prefix, category in CATEGORIES:
+        if module == prefix or module.startswith(f'{prefix}.'):
+            return category
+    return None
+
+
+def create_profile(
+    label: str, option: ProfileOption = None
+) -> Tuple[ProfileRecorder, bool]:
+    """
+    Resolves a `profile=` argument into a profile to record into.
+
+    Args:
+        label: A description of the profiled call.
+        option: False or '' to disable profiling; True or 'phases' for
+            phase timings and memory peaks; 'sampling' to also sample
+            stacks; an existing (entered) `Profile` to record into it;
+            or None to use the `BQ_PROFILE` setting.
+
+    Returns:
+        A tuple of the profile and whether it was created here (and so
+        should be entered, reported and exited by the caller).
+
+    Raises:
+        ValueError: If the option is not recognized.
+    """
+    if isinstance(option, Profile):
+        return option, False
+    if option is None:
+        option = BQ_PROFILE
+    if option in (False, '', '0', 'false', 'off'):
+        return NULL_PROFILE, False
+    if option in (True, '1', 'true', 'on', 'phases'):
+        return Profile(label), True
+    if option == 'sampling':
+        return Profile(label, sample_interval=DEFAULT_SAMPLE_INTERVAL), True
+    raise ValueError(f'Unknown profile option: {option!r}')
+
+
+@contextmanager
+def profiling(
+    label: str, option: ProfileOption = None
+) -> Iterator[ProfileRecorder]:
+    """
+    Profiles a block according to a `profile=` argument.
+
+    Profiles created here are logged when the block ends, even if it
+    fails; profiles passed in by the caller are left to the caller.
+
+    Args:
+        label: A description of the profiled call.
+        option: See `create_profile`.
+
+    Yields:
+        The profile, whose `phase()` method wraps each phase. When
+        profiling is off this is a no-op stand-in.
+    """
+    profile, owned = create_profile(label, option)
+    if not owned:
+        yield profile
+        return
+    with profile:
+        try:
+            yield profile
+        finally:
+            logger.info(profile.report())
@@ -0,0 +1,132 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
+import pandas as pd
+from google.cloud import bigquery as bq
+
+from easy_bigquery.connector.scheduler import JobScheduler
+from easy_bigquery.logger import logger
+
+
+class QueryCursor:
+    """
+    Serves pages of a finished query result on demand.
+
+    The query runs once; its results stay in the job's destination
+    table (BigQuery keeps anonymous result tables for about a day), and
+    each page is read from that table with `list_rows` and a row
+    offset. After a page is served, the next page of the same size is
+    prefetched in the background, so sequential paging only waits on
+    the network for the first page.
+
+    Instances are created with `FetchWorker.open_cursor()`.
+
+    Attributes:
+        destination (bq.TableReference): The table holding the results.
+        total_rows (int): The number of rows in the result.
+
+    Example:
+        ```python
+        with BQManager() as bq:
+            with bq.open_cursor('SELECT * FROM `my.big.table`') as cursor:
+                first = cursor.page(0, size=100)
+                second = cursor.page(1, size=100)  # Already prefetched.
+        ```
+    """
+
+    def __init__(
+        self,
+        client: bq.Client,
+        destination: bq.TableReference,
+        total_rows: int,
+        prefetch: bool = True,
+        scheduler: Optional[JobScheduler] = None,
+    ):
+        """
+        Initializes the QueryCursor.
+
+        Args:
+            client: The BigQuery client used to read pages.
+            destination: The table holding the query results.
+            total_rows: The number of rows in the result.
+            prefetch: If True, the page following each served page is
+                read in the background. Defaults to True.
+            scheduler: An optional scheduler whose rate limit each
+                page read counts against.
+        """
+        self.destination = destination
+        self.total_rows = total_rows
+        self._client = client
+        self._prefetch = prefetch
+        self._scheduler = scheduler
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Dict[Tuple[int, int], Future] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> 'QueryCursor':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def num_pages(self, size: int) -> int:
+        """Returns the number of pages of the given size."""
+        return -(-self.total_rows // size)
+
+    def page(self, n: int, size: int) -> pd.DataFrame:
+        """
+        Returns page `n` (zero-based) of `size` rows.
+
+        Args:
+            n: The zero-based page number.
+            size: The number of rows per page.
+
+        Returns:
+            A pandas DataFrame with the rows of the page. Pages past the
+            end of the result are empty.
+
+        Raises:
+            ValueError: If `n` is negative or `size` is not positive.
+        """
+        if n < 0 or size <= 0:
+            raise ValueError('Page number must be >= 0 and size > 0.')
+        with self._lock:
+            future = self._pending.pop((n, size), None)
+            # Drop prefetched pages that the consumer skipped.
+            for stale in self._pending.values():
+                stale.cancel()
+            self._pending.clear()
+            if self._prefetch and (n + 1) * size < self.total_rows:
+                self._pending[(n + 1, size)] = self._submit(n + 1, size)
+        if future is not None:
+            return future.result()
+        return self._read(n, size)
+
+    def close(self) -> None:
+        """Cancels pending prefetches and stops the background thread."""
+        with self._lock:
+            for future in self._pending.values():
+                future.cancel()
+            self._pending.clear()
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+    def _submit(self, n: int, size: int) -> Future:
+        """Schedules a background read of a page."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix='easy-bigquery-cursor'
+            )
+        return self._executor.submit(self._read, n, size)
+
+    def _read(self, n: int, size: int) -> pd.DataFrame:
+        """Reads a page from the destination table."""
+        logger.debug(f'Reading page {n} ({size} rows) of {self.destination}')
+        if self._scheduler is not None:
+            self._scheduler.throttle()
+        rows = self._client.list_rows(
+            self.destination, start_index=n * size, max_results=size
+        )
+        return rows.to_dataframe(create_bqstorage_client=False)
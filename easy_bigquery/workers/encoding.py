@@ -0,0 +1,188 @@
+"""
+Client-side serialization of DataFrames for BigQuery load jobs.
+
+`PushWorker.push` normally lets `load_table_from_dataframe` pick the
+wire format. On bandwidth-limited hosts the upload dominates the push,
+so this module exposes the format, compression codec, compression
+level and row group size, and can benchmark the candidates on a sample
+frame to compare encode time against bytes sent.
+"""
+import gzip
+import io
+import time
+from typing import Iterable, List, Literal, Optional, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.orc as orc
+import pyarrow.parquet as pq
+
+SourceFormat = Literal['PARQUET', 'ORC', 'NEWLINE_DELIMITED_JSON']
+
+# Codecs accepted by both the encoder and BigQuery, per format. The
+# first entry is the default used when no codec is requested.
+COMPRESSIONS = {
+    'PARQUET': ('snappy', 'none', 'gzip', 'zstd'),
+    'ORC': ('snappy', 'none', 'zlib', 'zstd', 'lz4'),
+    'NEWLINE_DELIMITED_JSON': ('none', 'gzip'),
+}
+
+# Inclusive compression level range of each codec that takes a level.
+# Other codecs, and every ORC codec, do not accept a level.
+COMPRESSION_LEVELS = {
+    ('PARQUET', 'gzip'): (1, 9),
+    ('PARQUET', 'zstd'): (1, 22),
+    ('NEWLINE_DELIMITED_JSON', 'gzip'): (0, 9),
+}
+
+DEFAULT_CANDIDATES: Tuple[Tuple[str, Optional[str], Optional[int]], ...] = (
+    ('PARQUET', 'snappy', None),
+    ('PARQUET', 'zstd', 3),
+    ('PARQUET', 'zstd', 9),
+    ('PARQUET', 'gzip', 6),
+    ('ORC', 'snappy', None),
+    ('ORC', 'zstd', None),
+    ('NEWLINE_DELIMITED_JSON', 'none', None),
+    ('NEWLINE_DELIMITED_JSON', 'gzip', 6),
+)
+
+
+def encode_dataframe(
+    df: pd.DataFrame,
+    source_format: SourceFormat = 'PARQUET',
+    compression: Optional[str] = None,
+    compression_level: Optional[int] = None,
+    row_group_size: Optional[int] = None,
+) -> io.BytesIO:
+    """
+    Serializes a DataFrame into an in-memory load file.
+
+    Args:
+        df: The pandas DataFrame to serialize.
+        source_format: The BigQuery source format: 'PARQUET', 'ORC' or
+            'NEWLINE_DELIMITED_JSON'. Defaults to 'PARQUET'.
+        compression: The compression codec, or 'none' to disable
+            compression. See `COMPRESSIONS` for the codecs accepted by
+            each format. Defaults to the first codec listed there for
+            the format ('snappy' for Parquet and ORC, 'none' for
+            newline-delimited JSON).
+        compression_level: An optional codec-specific compression
+            level. Only supported by the codecs listed in
+            `COMPRESSION_LEVELS`, within the range given there.
+        row_group_size: The maximum number of rows per Parquet row
+            group. Only supported for Parquet.
+
+    Returns:
+        A `BytesIO` positioned at the start of the encoded payload.
+
+    Raises:
+        ValueError: If the format, codec or option combination is not
+            supported.
+    """
+    if source_format not in COMPRESSIONS:
+        raise ValueError(
+            f'Unsupported source format: {source_format}. '
+            f'Choose one of {sorted(COMPRESSIONS)}.'
+        )
+    compression = compression or COMPRESSIONS[source_format][0]
+    if compression not in COMPRESSIONS[source_format]:
+        raise ValueError(
+            f'Unsupported compression {compression!r} for {source_format}. '
+            f'Choose one of {COMPRESSIONS[source_format]}.'
+        )
+    if row_group_size is not None and source_format != 'PARQUET':
+        raise ValueError('row_group_size is only supported for PARQUET.')
+    if compression_level is not None:
+        levels = COMPRESSION_LEVELS.get((source_format, compression))
+        if levels is None:
+            raise ValueError(
+                f'compression_level is not supported for {compression!r} '
+                f'compression in {source_format}.'
+            )
+        if not levels[0] <= compression_level <= levels[1]:
+            raise ValueError(
+                f'compression_level for {compression!r} must be between '
+                f'{levels[0]} and {levels[1]}, got {compression_level}.'
+            )
+
+    buffer = io.BytesIO()
+    if source_format == 'NEWLINE_DELIMITED_JSON':
+        payload = df.to_json(
+            orient='records',
+            lines=True,
+            date_format='iso',
+            # BigQuery keeps microseconds; pandas defaults to millis.
+            date_unit='us',
+        ).encode('utf-8')
+        if compression == 'gzip':
+            payload = gzip.compress(
+                payload,
+                compresslevel=(
+                    9 if compression_level is None else compression_level
+                ),
+            )
+        buffer.write(payload)
+    else:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if source_format == 'PARQUET':
+            pq.write_table(
+                table,
+                buffer,
+                compression=compression,
+                compression_level=compression_level,
+                row_group_size=row_group_size,
+                # BigQuery stores timestamps with microsecond precision.
+                coerce_timestamps='us',
+                allow_truncated_timestamps=True,
+            )
+        else:
+            orc.write_table(
+                table,
+                buffer,
+                compression=(
+                    'uncompressed' if compression == 'none' else compression
+                ),
+            )
+    buffer.seek(0)
+    return buffer
+
+
+def benchmark_encodings(
+    df: pd.DataFrame,
+    candidates: Optional[
+        Iterable[Tuple[str, Optional[str], Optional[int]]]
+    ] = None,
+) -> pd.DataFrame:
+    """
+    Measures encode time and payload size for each encoding option.
+
+    Args:
+        df: A representative pandas DataFrame to encode.
+        candidates: An iterable of `(source_format, compression,
+            compression_level)` tuples. Defaults to
+            `DEFAULT_CANDIDATES`.
+
+    Returns:
+        A DataFrame with one row per candidate and the columns
+        'source_format', 'compression', 'compression_level',
+        'encode_seconds', 'bytes' and 'ratio' (payload size relative
+        to the in-memory size of `df`), sorted by payload size.
+    """
+    memory_bytes = int(df.memory_usage(deep=True).sum()) or 1
+    rows: List[dict] = []
+    for source_format, compression, level in candidates or DEFAULT_CANDIDATES:
+        start = time.perf_counter()
+        payload = encode_dataframe(df, source_format, compression, level)
+        elapsed = time.perf_counter() - start
+        size = payload.getbuffer().nbytes
+        rows.append(
+            {
+                'source_format': source_format,
+                'compression': compression,
+                'compression_level': level,
+                'encode_seconds': elapsed,
+                'bytes': size,
+                'ratio': size / memory_bytes,
+            }
+        )
+    return pd.DataFrame(rows).sort_values('bytes').reset_index(drop=True)
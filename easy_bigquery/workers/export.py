@@ -0,0 +1,285 @@
+"""
+Downloads of query results exported to object storage.
+
+Past a certain size, streaming a result through the Storage API is
+bounded by a single client's read sessions. An EXTRACT job instead
+lets BigQuery write the result in parallel as sharded files to object
+storage, from where the shards can be fetched concurrently. The
+storage side is behind the small `ExportStorage` interface, with a
+Cloud Storage implementation and a local filesystem stand-in for tests
+and development.
+"""
+import os
+import pathlib
+import threading
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from easy_bigquery.logger import logger
+
+# File extension of each supported extract format.
+EXPORT_FORMATS = {'PARQUET': '.parquet', 'AVRO': '.avro'}
+
+
+def split_uri(uri: str) -> Tuple[str, str]:
+    """
+    Splits an object URI into its bucket and object name.
+
+    Args:
+        uri: A URI such as `gs://bucket/path/to/object`.
+
+    Returns:
+        A tuple of the bucket and the object name.
+
+    Raises:
+        ValueError: If the URI has no scheme or bucket.
+    """
+    scheme, separator, rest = uri.partition('://')
+    bucket, _, name = rest.partition('/')
+    if not separator or not scheme or not bucket:
+        raise ValueError(f'Not an object storage URI: {uri!r}')
+    return bucket, name
+
+
+class ExportStorage(ABC):
+    """
+    The object storage that extract jobs write their shards to.
+
+    Implementations only need to list, read, download and delete
+    objects by URI; they must be safe to call from several threads.
+    """
+
+    @abstractmethod
+    def list(self, prefix: str) -> List[str]:
+        """Returns the URIs of the objects under a prefix, sorted."""
+
+    @abstractmethod
+    def read(self, uri: str) -> bytes:
+        """Returns the content of an object."""
+
+    @abstractmethod
+    def download(self, uri: str, path: str) -> None:
+        """Writes the content of an object to a local file."""
+
+    @abstractmethod
+    def delete(self, uris: Iterable[str]) -> None:
+        """Deletes objects, ignoring those that do not exist."""
+
+
+def _import_storage() -> Any:
+    """Imports Cloud Storage, which is an optional dependency."""
+    try:
+        from google.cloud import storage
+    except ImportError as error:
+        raise ImportError(
+            'Exporting through Cloud Storage requires '
+            'google-cloud-storage. Install it with '
+            "`pip install 'easy-bigquery[export]'`."
+        ) from error
+    return storage
+
+
+class GCSStorage(ExportStorage):
+    """
+    Google Cloud Storage, accessed with the connector's credentials.
+
+    The client is created once, on first use, so constructing the
+    storage does not require the optional dependency and one storage
+    can be shared by many threads.
+    """
+
+    def __init__(
+        self,
+        project: Optional[str] = None,
+        credentials: Optional[Any] = None,
+        client: Optional[Any] = None,
+    ):
+        """
+        Initializes the GCSStorage.
+
+        Args:
+            project: The project billed for the requests.
+            credentials: The credentials to authenticate with.
+            client: An existing `google.cloud.storage.Client`, used
+                instead of creating one.
+        """
+        self.project = project
+        self.credentials = credentials
+        self._client = client
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> Any:
+        """The Cloud Storage client, created on first use."""
+        with self._lock:
+            if self._client is None:
+                storage = _import_storage()
+                self._client = storage.Client(
+                    project=self.project, credentials=self.credentials
+                )
+        return self._client
+
+    def _blob(self, uri: str) -> Any:
+        bucket, name = split_uri(uri)
+        return self.client.bucket(bucket).blob(name)
+
+    def list(self, prefix: str) -> List[str]:
+        bucket, name = split_uri(prefix)
+        return sorted(
+            f'gs://{bucket}/{blob.name}'
+            for blob in self.client.list_blobs(bucket, prefix=name)
+        )
+
+    def read(self, uri: str) -> bytes:
+        return self._blob(uri).download_as_bytes()
+
+    def download(self, uri: str, path: str) -> None:
+        self._blob(uri).download_to_filename(path)
+
+    def delete(self, uris: Iterable[str]) -> None:
+        for uri in uris:
+            blob = self._blob(uri)
+            if blob.exists():
+                blob.delete()
+
+
+class LocalStorage(ExportStorage):
+    """
+    A local directory standing in for object storage.
+
+    An object `scheme://bucket/name` is stored at `root/bucket/name`.
+    Useful in tests, and with a file system that mirrors a bucket
+    (e.g. a FUSE mount).
+    """
+
+    def __init__(self, root: str):
+        """
+        Initializes the LocalStorage.
+
+        Args:
+            root: The directory holding one subdirectory per bucket.
+        """
+        self.root = pathlib.Path(root)
+
+    def path(self, uri: str) -> pathlib.Path:
+        """Returns the local path of an object."""
+        bucket, name = split_uri(uri)
+        return self.root / bucket / name
+
+    def list(self, prefix: str) -> List[str]:
+        scheme = prefix.partition('://')[0]
+        bucket, name = split_uri(prefix)
+        base = self.root / bucket
+        if not base.is_dir():
+            return []
+        names = (
+            path.relative_to(base).as_posix()
+            for path in base.rglob('*')
+            if path.is_file()
+        )
+        return sorted(
+            f'{scheme}://{bucket}/{found}'
+            for found in names
+            if found.startswith(name)
+        )
+
+    def read(self, uri: str) -> bytes:
+        return self.path(uri).read_bytes()
+
+    def download(self, uri: str, path: str) -> None:
+        pathlib.Path(path).write_bytes(self.read(uri))
+
+    def delete(self, uris: Iterable[str]) -> None:
+        for uri in uris:
+            self.path(uri).unlink(missing_ok=True)
+
+
+def download_shards(
+    storage: ExportStorage,
+    uris: List[str],
+    directory: str,
+    max_workers: int = 8,
+) -> List[str]:
+    """
+    Downloads shards to a local directory in parallel.
+
+    Args:
+        storage: The storage holding the shards.
+        uris: The shard URIs.
+        directory: The local directory to write to; created if needed.
+        max_workers: The number of concurrent downloads. Defaults to 8.
+
+    Returns:
+        The local paths of the shards, in the order of `uris`.
+    """
+    os.makedirs(directory, exist_ok=True)
+    paths = [os.path.join(directory, uri.rsplit('/', 1)[-1]) for uri in uris]
+    with ThreadPoolExecutor(max_workers, 'easy-bigquery-export') as pool:
+        # list() re-raises the first download error, if any.
+        list(pool.map(storage.download, uris, paths))
+    logger.info(f'Downloaded {len(paths)} shards to {directory}.')
+    return paths
+
+
+def read_shards(
+    storage: ExportStorage,
+    uris: List[str],
+    max_workers: int = 8,
+    cleanup: bool = False,
+) -> pa.RecordBatchReader:
+    """
+    Streams Parquet shards as Arrow record batches.
+
+    Up to `max_workers` shards are downloaded and decoded concurrently
+    ahead of the consumer, so memory use is bounded by that many
+    shards while the network stays busy. Batches are yielded in shard
+    order.
+
+    Args:
+        storage: The storage holding the shards.
+        uris: The URIs of the Parquet shards.
+        max_workers: The number of shards fetched concurrently.
+            Defaults to 8.
+        cleanup: If True, deletes the shards once they are all read or
+            the reader is closed. Defaults to False.
+
+    Returns:
+        A `pyarrow.RecordBatchReader` over the rows of every shard.
+
+    Raises:
+        ValueError: If no shard URIs are given.
+    """
+    if not uris:
+        raise ValueError('There are no shards to read.')
+
+    def fetch(uri: str) -> pa.Table:
+        return pq.read_table(pa.BufferReader(storage.read(uri)))
+
+    pool = ThreadPoolExecutor(max_workers, 'easy-bigquery-export')
+    pending = deque(pool.submit(fetch, uri) for uri in uris[:max_workers])
+    try:
+        first = pending[0].result()
+    except BaseException:
+        pool.shutdown(cancel_futures=True)
+        raise
+
+    def batches() -> Iterator[pa.RecordBatch]:
+        queued = iter(uris[max_workers:])
+        try:
+            while pending:
+                table = pending.popleft().result()
+                uri = next(queued, None)
+                if uri is not None:
+                    pending.append(pool.submit(fetch, uri))
+                yield from table.to_batches()
+        finally:
+            pool.shutdown(cancel_futures=True)
+            if cleanup:
+                storage.delete(uris)
+
+    return pa.RecordBatchReader.from_batches(first.schema, batches())
@@ -1,9 +1,53 @@
-from typing import Any
+import dataclasses
+import datetime as dt
+import re
+import uuid
+from contextlib import ExitStack, contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
 
 import pandas as pd
+import pyarrow as pa
+from google.api_core.exceptions import NotFound
+from google.cloud import bigquery as bq
 
 from easy_bigquery.connector.connector import BQConnector
+from easy_bigquery.connector.jobs import (
+    JobHandle,
+    deadline_after,
+    wait_for_job,
+)
+from easy_bigquery.core.config import (
+    BQ_EXPORT_THRESHOLD_BYTES,
+    BQ_EXPORT_URI,
+    BQ_MATERIALIZE_DATASET,
+)
+from easy_bigquery.core.params import build_query_config
+from easy_bigquery.core.profiling import Profile, ProfileOption, profiling
 from easy_bigquery.logger import logger
+from easy_bigquery.workers.cursor import QueryCursor
+from easy_bigquery.workers.export import (
+    EXPORT_FORMATS,
+    ExportStorage,
+    GCSStorage,
+    download_shards,
+    read_shards,
+)
+from easy_bigquery.workers.materialize import (
+    MaterializedTable,
+    materialized_table_id,
+    query_fingerprint,
+)
+from easy_bigquery.workers.nested import reshape, to_pandas
+from easy_bigquery.workers.shared import SharedTable
+
+# A bare `[project.]dataset.table` path, optionally backticked, as
+# opposed to query text (which always contains whitespace).
+TABLE_PATH = re.compile(r'`?[\w-]+(\.[\w-]+){1,2}`?')
+
+
+def _empty_result(job: Any) -> pa.Table:
+    """Returns a finished job's (empty) result with its schema."""
+    return job.result().to_arrow(create_bqstorage_client=False)
 
 
 class FetchWorker:
@@ -18,6 +62,18 @@ class FetchWorker:
     Attributes:
         connector (BQConnector): An active and connected
             BQConnector instance.
+        materialized (Dict[str, MaterializedTable]): The materialized
+            results created or reused by this worker, by table path.
+        last_profile (Optional[Profile]): The profile of the latest
+            profiled `fetch()` call, if any.
+        export_storage (Optional[ExportStorage]): Where extract jobs
+            write their shards. Defaults to Cloud Storage, created on
+            first use.
+        export_uri (Optional[str]): The base URI (e.g.
+            `gs://bucket/tmp`) under which shards are written.
+        export_threshold (int): The result size, in bytes, past which
+            `fetch()` and `iter_batches()` download through an
+            extract job instead of the Storage API. 0 disables it.
 
     Example:
         ```python
@@ -38,51 +94,851 @@ class FetchWorker:
         ```
     """
 
-    def __init__(self, connector: BQConnector):
+    def __init__(
+        self,
+        connector: BQConnector,
+        export_storage: Optional[ExportStorage] = None,
+    ):
         """
         Initializes the FetchWorker.
 
         Args:
             connector: An initialized and connected `BQConnector`
                 instance.
+            export_storage: The storage extract jobs write to. Defaults
+                to Cloud Storage with the connector's credentials.
 
         Raises:
             ConnectionError: If the provided connector is not active.
         """
+        # An unpickled connector reconnects here, in its new process.
+        connector.ensure_process()
         if not connector.client or not connector.bq_storage:
             raise ConnectionError('Connector must be connected first.')
         self.connector = connector
+        self.materialized: Dict[str, MaterializedTable] = {}
+        self.last_profile: Optional[Profile] = None
+        self.export_storage = export_storage
+        self.export_uri: Optional[str] = BQ_EXPORT_URI
+        self.export_threshold: int = BQ_EXPORT_THRESHOLD_BYTES
 
     def fetch(
-        self, query: str, use_storage_api: bool = True, **kwargs: Any
+        self,
+        query: str,
+        use_storage_api: bool = True,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        handle: Optional[JobHandle] = None,
+        profile: ProfileOption = None,
+        flatten: bool = False,
+        explode: Optional[Union[str, Iterable[str]]] = None,
+        arrow_dtypes: bool = False,
+        lane: str = 'interactive',
+        max_rows: Optional[int] = None,
+        **kwargs: Any,
     ) -> pd.DataFrame:
         """
         Executes a SQL query and returns the result as a DataFrame.
 
+        Nested results can be reshaped during the download: `flatten`
+        turns STRUCT columns into dotted columns (`address.city`),
+        `explode` turns ARRAY columns into one row per element, and
+        `arrow_dtypes` keeps every column, including lists and
+        structs, as a columnar `pandas.ArrowDtype`. With any of these
+        options the result is downloaded as Arrow and reshaped with
+        vectorized Arrow kernels (see `easy_bigquery.workers.nested`)
+        before the pandas conversion, so no per-row Python objects are
+        created.
+
+        With `max_rows`, the download stops as soon as that many rows
+        have arrived: the remaining Storage API streams (or REST pages)
+        are never read, so looking at the head of a huge result costs
+        little more than running the query.
+
+        Results larger than `export_threshold` are instead exported as
+        Parquet shards by an extract job and downloaded in parallel
+        (see `export()`).
+
         Args:
             query: The SQL query string to execute.
             use_storage_api: If True, uses the faster BigQuery Storage
                 API for downloading results. Defaults to True.
+            params: An optional mapping of values for the `@name`
+                placeholders in the query. Values are sent as BigQuery
+                query parameters instead of being formatted into the
+                SQL, which keeps the query text cacheable and safe.
+            timeout: An optional number of seconds the query job may
+                run. When it elapses the job is cancelled server-side
+                and `TimeoutError` is raised. Downloading the results
+                is not bounded by the deadline.
+            handle: An optional `JobHandle` through which another
+                thread can cancel the job.
+            profile: True (or 'phases') to record the wall time, CPU
+                time and peak memory of the 'admission', 'submit', 'job'
+                and 'download' phases (plus 'reshape' and 'convert' with
+                the reshaping options); 'sampling' to also sample stacks,
+                which splits the download between network, Arrow and
+                pandas work; or a `Profile` to record into. Defaults
+                to the `BQ_PROFILE` setting. Reports are logged and
+                kept in `last_profile`.
+            flatten: If True, flattens STRUCT columns, recursively,
+                into dotted columns. Defaults to False.
+            explode: The ARRAY column, or columns, to expand into one
+                row per element (after flattening, so nested arrays are
+                named by their dotted path). Rows with empty arrays
+                are kept with a null element.
+            arrow_dtypes: If True, returns `pandas.ArrowDtype` columns.
+                Defaults to False.
+            lane: The connector scheduler lane the job is admitted
+                through. Defaults to 'interactive'.
+            max_rows: An optional maximum number of rows to download.
+                Which rows are returned is arbitrary unless the query
+                has an ORDER BY.
             **kwargs: Additional keyword arguments to pass to the
-                `to_dataframe()` method of the underlying query job.
+                `to_dataframe()` method of the underlying query job, to
+                `to_arrow()` when a reshaping option is set, or to
+                `to_arrow_iterable()` when `max_rows` is set.
 
         Returns:
             A pandas DataFrame containing the query results.
 
         Raises:
             RuntimeError: If the BigQuery client is not available.
+            ValueError: If a query placeholder has no value in `params`,
+                or if `max_rows` is negative.
+            TimeoutError: If the job does not finish within `timeout`.
+            concurrent.futures.CancelledError: If the job is cancelled
+                through `handle`.
+        """
+        if max_rows is not None and max_rows < 0:
+            raise ValueError('max_rows must not be negative.')
+        deadline = deadline_after(timeout)
+        self.connector.ensure_process()
+        if not self.connector.client:
+            raise RuntimeError('BigQuery client is not available.')
+
+        via_arrow = max_rows is not None or flatten or explode or arrow_dtypes
+        logger.info(f'Executing query with storage_api={use_storage_api}')
+        with profiling('fetch', profile) as prof, ExitStack() as stack:
+            if prof.enabled:
+                self.last_profile = prof
+            with prof.phase('admission'):
+                stack.enter_context(self.connector.scheduler.slot(lane))
+            with prof.phase('submit'):
+                job = self._query(query, params)
+
+            with self.connector.jobs.track(job):
+                with prof.phase('job'):
+                    wait_for_job(job, deadline, handle)
+                    if prof.enabled:
+                        # Separates execution from the download below.
+                        job.result()
+                bqstorage_client = (
+                    self.connector.bq_storage if use_storage_api else None
+                )
+                if max_rows is not None:
+                    with prof.phase('download'):
+                        table = self._head(
+                            job, max_rows, bqstorage_client, **kwargs
+                        )
+                elif self._export_due(job):
+                    via_arrow = True
+                    with prof.phase('download'):
+                        table = self._read_export(
+                            job, deadline, handle
+                        ).read_all()
+                elif not via_arrow:
+                    with prof.phase('download'):
+                        df = job.to_dataframe(
+                            bqstorage_client=bqstorage_client, **kwargs
+                        )
+                else:
+                    with prof.phase('download'):
+                        table = job.to_arrow(
+                            bqstorage_client=bqstorage_client, **kwargs
+                        )
+            stack.close()  # Frees the slot before the local work below.
+            if via_arrow:
+                with prof.phase('reshape'):
+                    table = reshape(table, flatten=flatten, explode=explode)
+                with prof.phase('convert'):
+                    df = to_pandas(table, arrow_dtypes=arrow_dtypes)
+        logger.info(f'Query returned {len(df)} rows.')
+        return df
+
+    def iter_batches(
+        self,
+        query: str,
+        use_storage_api: bool = True,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        handle: Optional[JobHandle] = None,
+        lane: str = 'batch',
+    ) -> Iterator[pa.RecordBatch]:
+        """
+        Executes a query and streams the result as Arrow record batches.
+
+        The query runs (and is waited for) when this method is called;
+        the rows are then downloaded lazily as the iterator is
+        consumed, so memory use is bounded by a few batches regardless
+        of the result size. An empty result yields a single empty batch
+        carrying the schema. Results larger than `export_threshold` are
+        streamed from the Parquet shards of an extract job instead.
+
+        Args:
+            query: The SQL query string to execute.
+            use_storage_api: If True, streams through the BigQuery
+                Storage API. Defaults to True.
+            params: An optional mapping of values for the `@name`
+                placeholders in the query.
+            timeout: An optional number of seconds the query job may
+                run. When it elapses the job is cancelled server-side
+                and `TimeoutError` is raised.
+            handle: An optional `JobHandle` through which another
+                thread can cancel the job.
+            lane: The connector scheduler lane the job is admitted
+                through. Defaults to 'batch'. The slot is released once
+                the job finishes, before the rows are streamed.
+
+        Returns:
+            An iterator of `pyarrow.RecordBatch` objects.
+
+        Raises:
+            RuntimeError: If the BigQuery client is not available.
+            TimeoutError: If the job does not finish within `timeout`.
+            concurrent.futures.CancelledError: If the job is cancelled
+                through `handle`.
+        """
+        deadline = deadline_after(timeout)
+        self.connector.ensure_process()
+        if not self.connector.client:
+            raise RuntimeError('BigQuery client is not available.')
+
+        logger.info(f'Streaming query with storage_api={use_storage_api}')
+        with self._job(query, params, lane) as job:
+            wait_for_job(job, deadline, handle)
+            rows = job.result()
+            if self._export_due(job):
+                return iter(self._read_export(job, deadline, handle))
+        logger.info(f'Query result has {rows.total_rows} rows.')
+        return self._stream(job, rows, use_storage_api)
+
+    def _stream(
+        self, job: Any, rows: Any, use_storage_api: bool
+    ) -> Iterator[pa.RecordBatch]:
+        """Yields the batches of a finished job while tracking it."""
+        with self.connector.jobs.track(job):
+            empty = True
+            for batch in rows.to_arrow_iterable(
+                bqstorage_client=(
+                    self.connector.bq_storage if use_storage_api else None
+                )
+            ):
+                empty = False
+                yield batch
+            if empty:
+                schema = _empty_result(job).schema
+                yield pa.RecordBatch.from_pylist([], schema=schema)
+
+    def _head(
+        self,
+        job: Any,
+        max_rows: int,
+        bqstorage_client: Optional[Any],
+        **kwargs: Any,
+    ) -> pa.Table:
+        """Downloads the first rows of a finished job, then stops."""
+        batches = []
+        remaining = max_rows
+        stream = job.result().to_arrow_iterable(
+            bqstorage_client=bqstorage_client, **kwargs
+        )
+        try:
+            for batch in stream:
+                batches.append(batch.slice(0, remaining))
+                remaining -= batches[-1].num_rows
+                if remaining <= 0:
+                    break
+        finally:
+            # Closing the generator stops the Storage API workers.
+            stream.close()
+        if not batches:
+            return _empty_result(job)
+        return pa.Table.from_batches(batches)
+
+    def fetch_shared(
+        self,
+        query: str,
+        use_storage_api: bool = True,
+        params: Optional[Dict[str, Any]] = None,
+        refs: int = 1,
+        directory: Optional[str] = None,
+        timeout: Optional[float] = None,
+        handle: Optional[JobHandle] = None,
+    ) -> SharedTable:
+        """
+        Executes a query and publishes the result for other processes.
+
+        The result is downloaded as Arrow and written once to shared
+        memory; the returned handle is cheap to pickle and can be
+        opened zero-copy by any process on the same host.
+
+        Args:
+            query: The SQL query string to execute.
+            use_storage_api: If True, uses the faster BigQuery Storage
+                API for downloading results. Defaults to True.
+            params: An optional mapping of values for the `@name`
+                placeholders in the query.
+            refs: The initial number of references, typically the
+                number of consumers. Defaults to 1.
+            directory: Where to write the shared file. Defaults to
+                `/dev/shm` if available.
+            timeout: An optional number of seconds the query job may
+                run. When it elapses the job is cancelled server-side
+                and `TimeoutError` is raised.
+            handle: An optional `JobHandle` through which another
+                thread can cancel the job.
+
+        Returns:
+            A `SharedTable` handle to the result.
+
+        Raises:
+            RuntimeError: If the BigQuery client is not available.
+            TimeoutError: If the job does not finish within `timeout`.
+            concurrent.futures.CancelledError: If the job is cancelled
+                through `handle`.
         """
+        deadline = deadline_after(timeout)
+        self.connector.ensure_process()
         if not self.connector.client:
             raise RuntimeError('BigQuery client is not available.')
 
         logger.info(f'Executing query with storage_api={use_storage_api}')
-        job = self.connector.client.query(query)
+        with self._job(query, params) as job:
+            wait_for_job(job, deadline, handle)
+            table = job.to_arrow(
+                bqstorage_client=(
+                    self.connector.bq_storage if use_storage_api else None
+                )
+            )
+        logger.info(f'Query returned {table.num_rows} rows.')
+        return SharedTable.publish(table, refs=refs, directory=directory)
+
+    def execute(
+        self,
+        query: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        handle: Optional[JobHandle] = None,
+    ) -> Optional[int]:
+        """
+        Executes a statement that returns no rows and waits for it.
+
+        Useful for DDL, DML and scripts, where downloading a result set
+        would be wasted work.
+
+        Args:
+            query: The SQL statement to execute.
+            params: An optional mapping of values for the `@name`
+                placeholders in the statement.
+            timeout: An optional number of seconds the statement may
+                run. When it elapses the job is cancelled server-side
+                and `TimeoutError` is raised.
+            handle: An optional `JobHandle` through which another
+                thread can cancel the job.
 
-        df = job.to_dataframe(
+        Returns:
+            The number of rows affected by a DML statement, or None.
+
+        Raises:
+            RuntimeError: If the BigQuery client is not available.
+            TimeoutError: If the job does not finish within `timeout`.
+            concurrent.futures.CancelledError: If the job is cancelled
+                through `handle`.
+        """
+        deadline = deadline_after(timeout)
+        self.connector.ensure_process()
+        if not self.connector.client:
+            raise RuntimeError('BigQuery client is not available.')
+
+        logger.info('Executing statement')
+        with self._job(query, params) as job:
+            wait_for_job(job, deadline, handle)
+            job.result()
+        logger.info(f'Statement affected {job.num_dml_affected_rows} rows.')
+        return job.num_dml_affected_rows
+
+    def open_cursor(
+        self,
+        query: str,
+        params: Optional[Dict[str, Any]] = None,
+        prefetch: bool = True,
+        timeout: Optional[float] = None,
+        handle: Optional[JobHandle] = None,
+    ) -> QueryCursor:
+        """
+        Runs a query once and returns a cursor over its result pages.
+
+        The first page costs one `list_rows` call regardless of the
+        total result size, making this suitable for paged views.
+
+        Args:
+            query: The SQL query string to execute.
+            params: An optional mapping of values for the `@name`
+                placeholders in the query.
+            prefetch: If True, the cursor reads the next page in the
+                background after each page is served. Defaults to True.
+            timeout: An optional number of seconds the query job may
+                run. When it elapses the job is cancelled server-side
+                and `TimeoutError` is raised.
+            handle: An optional `JobHandle` through which another
+                thread can cancel the job.
+
+        Returns:
+            A `QueryCursor` over the query results.
+
+        Raises:
+            RuntimeError: If the BigQuery client is not available.
+            TimeoutError: If the job does not finish within `timeout`.
+            concurrent.futures.CancelledError: If the job is cancelled
+                through `handle`.
+        """
+        deadline = deadline_after(timeout)
+        self.connector.ensure_process()
+        if not self.connector.client:
+            raise RuntimeError('BigQuery client is not available.')
+
+        logger.info('Executing query for cursor-based pagination')
+        with self._job(query, params) as job:
+            wait_for_job(job, deadline, handle)
+            rows = job.result()
+        logger.info(f'Query result has {rows.total_rows} rows.')
+        return QueryCursor(
+            self.connector.client,
+            job.destination,
+            rows.total_rows or 0,
+            prefetch=prefetch,
+            scheduler=self.connector.scheduler,
+        )
+
+    def materialize(
+        self,
+        query: str,
+        ttl: float = 3600,
+        params: Optional[Dict[str, Any]] = None,
+        dataset: Optional[str] = None,
+        refresh: bool = False,
+        timeout: Optional[float] = None,
+        handle: Optional[JobHandle] = None,
+    ) -> MaterializedTable:
+        """
+        Runs a query once into an auto-expiring table and references it.
+
+        The destination is named after a fingerprint of the query text
+        and parameters, so materializing the same query again (from
+        this or any other process) returns the existing table while it
+        has not expired instead of recomputing it, extending its
+        expiration to at least `ttl` from now. Since reuse ignores
+        changes to the source tables, choose a `ttl` that matches how
+        stale the result may get, or pass `refresh=True`.
+
+        Args:
+            query: The SQL query string to execute.
+            ttl: The number of seconds the table is kept before
+                BigQuery deletes it. Defaults to one hour.
+            params: An optional mapping of values for the `@name`
+                placeholders in the query.
+            dataset: The dataset holding the table. Defaults to the
+                `BQ_MATERIALIZE_DATASET` setting, or the connector's
+                dataset when that is unset.
+            refresh: If True, recomputes the result even if a fresh
+                table exists. Defaults to False.
+            timeout: An optional number of seconds the query job may
+                run. When it elapses the job is cancelled server-side
+                and `TimeoutError` is raised.
+            handle: An optional `JobHandle` through which another
+                thread can cancel the job.
+
+        Returns:
+            A `MaterializedTable` that formats as the quoted table
+            path in SQL and can be passed to `read_table()`.
+
+        Raises:
+            RuntimeError: If the BigQuery client is not available.
+            TimeoutError: If the job does not finish within `timeout`.
+            concurrent.futures.CancelledError: If the job is cancelled
+                through `handle`.
+        """
+        deadline = deadline_after(timeout)
+        self.connector.ensure_process()
+        if not self.connector.client:
+            raise RuntimeError('BigQuery client is not available.')
+
+        fingerprint = query_fingerprint(query, params)
+        table_id = materialized_table_id(
+            self.connector.project_id,
+            dataset or BQ_MATERIALIZE_DATASET or self.connector.dataset,
+            fingerprint,
+        )
+        if not refresh:
+            existing = self._existing_materialization(
+                table_id, fingerprint, ttl
+            )
+            if existing is not None:
+                logger.info(f'Reusing materialized result {table_id}')
+                return existing
+
+        logger.info(f'Materializing query into {table_id}')
+        expires = dt.datetime.now(dt.timezone.utc) + dt.timedelta(seconds=ttl)
+        # The expiration is part of the statement that creates the table,
+        # so no table outlives its ttl even if this process dies mid-way.
+        statement = (
+            f'CREATE OR REPLACE TABLE `{table_id}` '
+            'OPTIONS (expiration_timestamp = '
+            f"TIMESTAMP '{expires.isoformat(sep=' ')}') "
+            f"AS\n{query.strip().rstrip(';')}\n"
+        )
+        with self._job(statement, params) as job:
+            wait_for_job(job, deadline, handle)
+            job.result()
+
+        reference = MaterializedTable(table_id, fingerprint, expires)
+        self.materialized[table_id] = reference
+        logger.info(
+            f'Materialized into {table_id} until {expires.isoformat()}.'
+        )
+        return reference
+
+    def export(
+        self,
+        query: str,
+        directory: str,
+        params: Optional[Dict[str, Any]] = None,
+        destination_format: str = 'PARQUET',
+        compression: Optional[str] = None,
+        destination_uri: Optional[str] = None,
+        max_workers: int = 8,
+        cleanup: bool = True,
+        timeout: Optional[float] = None,
+        handle: Optional[JobHandle] = None,
+    ) -> List[str]:
+        """
+        Exports a query result to local files through an extract job.
+
+        BigQuery writes the result as sharded files to object storage
+        (under `destination_uri`, in a fresh subdirectory), and the
+        shards are then downloaded concurrently. For very large
+        results this scales past a single Storage API read session.
+
+        Args:
+            query: The SQL query string to execute.
+            directory: The local directory to download the shards to.
+            params: An optional mapping of values for the `@name`
+                placeholders in the query.
+            destination_format: 'PARQUET' or 'AVRO'. Defaults to
+                'PARQUET'.
+            compression: An optional codec (e.g. 'SNAPPY', 'GZIP' for
+                Parquet; 'DEFLATE' or 'SNAPPY' for Avro).
+            destination_uri: The base URI for the shards. Defaults to
+                `export_uri` (the `BQ_EXPORT_URI` setting).
+            max_workers: The number of concurrent downloads. Defaults
+                to 8.
+            cleanup: If True, deletes the remote shards once they are
+                downloaded. Defaults to True.
+            timeout: An optional number of seconds the query and
+                extract jobs may run. When it elapses the running job
+                is cancelled server-side and `TimeoutError` is raised.
+            handle: An optional `JobHandle` through which another
+                thread can cancel the jobs.
+
+        Returns:
+            The local paths of the shards, in order.
+
+        Raises:
+            RuntimeError: If the BigQuery client is not available.
+            ValueError: If the format is not supported or no export
+                URI is configured.
+            TimeoutError: If the jobs do not finish within `timeout`.
+            concurrent.futures.CancelledError: If a job is cancelled
+                through `handle`.
+
+        Example:
+            ```python
+            with BQManager() as bq:
+                paths = bq.export(
+                    'SELECT * FROM `my.huge.table`',
+                    '/data/huge',
+                    destination_uri='gs://my-bucket/tmp',
+                )
+            ```
+        """
+        deadline = deadline_after(timeout)
+        self.connector.ensure_process()
+        if not self.connector.client:
+            raise RuntimeError('BigQuery client is not available.')
+
+        logger.info(f'Exporting query as {destination_format}')
+        with self._job(query, params, 'batch') as job:
+            wait_for_job(job, deadline, handle)
+            job.result()
+            uris = self._extract(
+                job.destination,
+                destination_format,
+                compression,
+                destination_uri,
+                deadline,
+                handle,
+            )
+        storage = self._storage()
+        try:
+            return download_shards(storage, uris, directory, max_workers)
+        finally:
+            if cleanup:
+                storage.delete(uris)
+
+    def _export_due(self, job: Any) -> bool:
+        """Whether a finished job's result should be exported."""
+        if not (self.export_uri and self.export_threshold):
+            return False
+        job.result()
+        self.connector.scheduler.throttle()
+        size = self.connector.client.get_table(job.destination).num_bytes
+        return (size or 0) > self.export_threshold
+
+    def _read_export(
+        self, job: Any, deadline: Optional[float], handle: Optional[JobHandle]
+    ) -> pa.RecordBatchReader:
+        """Streams a finished job's result through Parquet shards."""
+        logger.info('Result exceeds the export threshold; extracting it.')
+        uris = self._extract(
+            job.destination, 'PARQUET', None, None, deadline, handle
+        )
+        return read_shards(self._storage(), uris, cleanup=True)
+
+    def _extract(
+        self,
+        source: Any,
+        destination_format: str,
+        compression: Optional[str],
+        destination_uri: Optional[str],
+        deadline: Optional[float],
+        handle: Optional[JobHandle],
+    ) -> List[str]:
+        """
+        Extracts a table to sharded files and returns their URIs.
+
+        Runs within the caller's scheduler slot.
+        """
+        destination_format = destination_format.upper()
+        if destination_format not in EXPORT_FORMATS:
+            raise ValueError(
+                f'Unsupported export format {destination_format!r}; '
+                f'expected one of {list(EXPORT_FORMATS)}.'
+            )
+        base = destination_uri or self.export_uri
+        if not base:
+            raise ValueError(
+                'No export URI; pass destination_uri or set BQ_EXPORT_URI.'
+            )
+        prefix = f'{base.rstrip("/")}/{uuid.uuid4().hex}/'
+        job_config = bq.ExtractJobConfig(destination_format=destination_format)
+        if compression is not None:
+            job_config.compression = compression.upper()
+        job = self.connector.client.extract_table(
+            source,
+            f'{prefix}shard-*{EXPORT_FORMATS[destination_format]}',
+            job_config=job_config,
+        )
+        with self.connector.jobs.track(job):
+            wait_for_job(job, deadline, handle)
+            job.result()
+        uris = self._storage().list(prefix)
+        logger.info(f'Extract job wrote {len(uris)} shards to {prefix}.')
+        return uris
+
+    def _storage(self) -> ExportStorage:
+        """Returns the export storage, creating the default one."""
+        if self.export_storage is None:
+            self.export_storage = GCSStorage(
+                project=self.connector.project_id,
+                credentials=self.connector.credentials,
+            )
+        return self.export_storage
+
+    def preview(
+        self,
+        source: Union[str, MaterializedTable],
+        n: int = 10,
+        use_storage_api: bool = True,
+        **kwargs: Any,
+    ) -> pd.DataFrame:
+        """
+        Returns the first rows of a table or query result.
+
+        Tables (including materialized results) are read with a single
+        `list_rows` call and never start a query job, so a preview
+        costs no query bytes and returns in milliseconds. Query text
+        is run with `fetch(max_rows=n)`, which stops the download as
+        soon as `n` rows have arrived.
+
+        Args:
+            source: A table path (`[project.]dataset.table`, optionally
+                backticked), a `MaterializedTable`, or a SQL query.
+            n: The number of rows to return. Defaults to 10.
+            use_storage_api: If True, query results are read through
+                the Storage API. Table previews always use the REST
+                API, which serves small heads faster than opening a
+                read session. Defaults to True.
+            **kwargs: Additional keyword arguments to pass to `fetch()`
+                for queries (e.g. `params` or `timeout`); ignored for tables.
+
+        Returns:
+            A pandas DataFrame with at most `n` rows.
+
+        Raises:
+            RuntimeError: If the BigQuery client is not available.
+
+        Example:
+            ```python
+            with BQManager() as bq:
+                print(bq.preview('my_dataset.events', n=5))
+                print(bq.preview('SELECT * FROM my_dataset.events_view'))
+            ```
+        """
+        if isinstance(source, MaterializedTable):
+            source = source.table_id
+        elif not TABLE_PATH.fullmatch(source.strip()):
+            return self.fetch(
+                source, use_storage_api=use_storage_api, max_rows=n, **kwargs
+            )
+        return self.read_table(
+            source.strip().strip('`'), max_results=n, use_storage_api=False
+        )
+
+    def read_table(
+        self,
+        table: Union[str, MaterializedTable],
+        columns: Optional[List[str]] = None,
+        max_results: Optional[int] = None,
+        use_storage_api: bool = True,
+        **kwargs: Any,
+    ) -> pd.DataFrame:
+        """
+        Downloads a table directly, without running a query.
+
+        Reading a table costs no query bytes and, through the Storage
+        API, streams the rows in parallel; it is the cheapest way to
+        download a materialized result.
+
+        Args:
+            table: A full table path (`project.dataset.table`) or a
+                `MaterializedTable`.
+            columns: An optional list of columns to read, in order.
+                Defaults to all columns.
+            max_results: An optional maximum number of rows. Limited
+                reads are paged through the REST API, which serves
+                them without opening a read session.
+            use_storage_api: If True, uses the BigQuery Storage API for
+                unlimited reads. Defaults to True.
+            **kwargs: Additional keyword arguments to pass to the
+                `to_dataframe()` method of the row iterator.
+
+        Returns:
+            A pandas DataFrame with the table rows.
+
+        Raises:
+            RuntimeError: If the BigQuery client is not available.
+            ValueError: If a requested column is not in the table.
+        """
+        self.connector.ensure_process()
+        if not self.connector.client:
+            raise RuntimeError('BigQuery client is not available.')
+
+        if isinstance(table, MaterializedTable):
+            table = table.table_id
+        self.connector.scheduler.throttle()
+        table_ref = self.connector.client.get_table(table)
+        selected_fields = None
+        if columns is not None:
+            fields = {field.name: field for field in table_ref.schema}
+            missing = [name for name in columns if name not in fields]
+            if missing:
+                raise ValueError(f'Columns not found in {table}: {missing}')
+            selected_fields = [fields[name] for name in columns]
+
+        logger.info(
+            f'Reading table {table} with storage_api={use_storage_api}'
+        )
+        self.connector.scheduler.throttle()
+        rows = self.connector.client.list_rows(
+            table_ref, selected_fields=selected_fields, max_results=max_results
+        )
+        df = rows.to_dataframe(
             bqstorage_client=(
                 self.connector.bq_storage if use_storage_api else None
             ),
             **kwargs,
         )
-        logger.info(f'Query returned {len(df)} rows.')
+        logger.info(f'Read {len(df)} rows from {table}.')
         return df
+
+    def _existing_materialization(
+        self, table_id: str, fingerprint: str, ttl: float
+    ) -> Optional[MaterializedTable]:
+        """
+        Returns a fresh, previously materialized table if any.
+
+        A table expiring before `ttl` seconds from now has its
+        expiration extended, so the caller gets the lifetime it asked
+        for.
+        """
+        reference = self.materialized.get(table_id)
+        if reference is None or not reference.is_fresh():
+            self.connector.scheduler.throttle()
+            try:
+                table = self.connector.client.get_table(table_id)
+            except NotFound:
+                return None
+            if table.expires is None:
+                return None
+            reference = MaterializedTable(table_id, fingerprint, table.expires)
+            if not reference.is_fresh():
+                return None
+        expires = dt.datetime.now(dt.timezone.utc) + dt.timedelta(seconds=ttl)
+        if reference.expires_at < expires:
+            table = bq.Table(table_id)
+            table.expires = expires
+            self.connector.scheduler.throttle()
+            self.connector.client.update_table(table, ['expires'])
+            reference = dataclasses.replace(
+                reference, expires_at=table.expires
+            )
+        self.materialized[table_id] = reference
+        return dataclasses.replace(reference, reused=True)
+
+    @contextmanager
+    def _job(
+        self,
+        query: str,
+        params: Optional[Dict[str, Any]] = None,
+        lane: str = 'interactive',
+        job_config: Optional[bq.QueryJobConfig] = None,
+    ) -> Iterator[Any]:
+        """Starts a query job in a scheduler slot and tracks it."""
+        with self.connector.scheduler.slot(lane):
+            job = self._query(query, params, job_config)
+            with self.connector.jobs.track(job):
+                yield job
+
+    def _query(
+        self,
+        query: str,
+        params: Optional[Dict[str, Any]] = None,
+        job_config: Optional[bq.QueryJobConfig] = None,
+    ) -> Any:
+        """Starts a query job, binding the parameters when given."""
+        if params is not None:
+            job_config = build_query_config(query, params, job_config)
+        if job_config is None:
+            return self.connector.client.query(query)
+        return self.connector.client.query(query, job_config=job_config)
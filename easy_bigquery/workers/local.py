@@ -0,0 +1,444 @@
+import os
+import pathlib
+import re
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from easy_bigquery.connector.connector import BQConnector
+from easy_bigquery.core.params import replace_placeholders
+from easy_bigquery.logger import logger
+from easy_bigquery.workers.fetch import FetchWorker
+from easy_bigquery.workers.nested import to_pandas
+
+# String literals and comments, which are never rewritten or inspected,
+# and backticked identifiers, which are code (they may spell a table).
+_LITERAL_PATTERN = re.compile(
+    r"""
+    (?P<identifier>`[^`]*`)
+    | '''.*?'''
+    | \"\"\".*?\"\"\"
+    | '(?:\\.|[^'\\])*'
+    | "(?:\\.|[^"\\])*"
+    | --[^\n]*
+    | \#[^\n]*
+    | /\*.*?\*/
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+# Functions known to behave the same in DuckDB and BigQuery, for the
+# argument and result types both accept. Anything else that looks
+# like a call (CONCAT, which ignores NULLs in DuckDB; CAST, which
+# rounds instead of failing; GREATEST; the date functions; ...), as
+# well as the SAFE. prefix, makes a query run on BigQuery.
+ALLOWED_FUNCTIONS = frozenset(
+    {
+        'ABS',
+        'AVG',
+        'COALESCE',
+        'COUNT',
+        'DENSE_RANK',
+        'ENDS_WITH',
+        'IF',
+        'IFNULL',
+        'LAG',
+        'LEAD',
+        'LENGTH',
+        'LOWER',
+        'LTRIM',
+        'MAX',
+        'MIN',
+        'NULLIF',
+        'RANK',
+        'ROW_NUMBER',
+        'RTRIM',
+        'STARTS_WITH',
+        'SUM',
+        'TRIM',
+        'UPPER',
+    }
+)
+
+# Keywords that may be followed by a parenthesis without being a call.
+_KEYWORDS = frozenset(
+    {
+        'ALL',
+        'AND',
+        'AS',
+        'BETWEEN',
+        'BY',
+        'DISTINCT',
+        'ELSE',
+        'EXCEPT',
+        'EXISTS',
+        'FROM',
+        'HAVING',
+        'IN',
+        'INTERSECT',
+        'JOIN',
+        'NOT',
+        'ON',
+        'OR',
+        'OVER',
+        'SELECT',
+        'THEN',
+        'UNION',
+        'USING',
+        'WHEN',
+        'WHERE',
+        'WITH',
+    }
+)
+
+_CALL_PATTERN = re.compile(r'\b(SAFE\.)?([A-Za-z_]\w*)\s*\(')
+
+
+def _map_code(query: str, func: Callable[[str], str]) -> str:
+    """Applies `func` to the SQL outside string literals and comments."""
+    parts = []
+    start = 0
+    for match in _LITERAL_PATTERN.finditer(query):
+        if match.group('identifier'):
+            continue
+        parts.append(func(query[start : match.start()]))
+        parts.append(match.group())
+        start = match.end()
+    parts.append(func(query[start:]))
+    return ''.join(parts)
+
+
+def _unsupported_construct(query: str) -> Optional[str]:
+    """Returns a call not known to behave the same in DuckDB, if any."""
+    found: List[str] = []
+
+    def inspect(code: str) -> str:
+        for match in _CALL_PATTERN.finditer(code):
+            name = match.group(2).upper()
+            if match.group(1) or name not in ALLOWED_FUNCTIONS | _KEYWORDS:
+                found.append(match.group().rstrip('( \t\n'))
+        return code
+
+    _map_code(query, inspect)
+    return found[0] if found else None
+
+
+def _bigquery_types(table: Any) -> pa.Table:
+    """Casts DuckDB result types to those BigQuery would return."""
+    if isinstance(table, pa.RecordBatchReader):
+        table = table.read_all()
+    fields = []
+    for field in table.schema:
+        kind = field.type
+        if pa.types.is_integer(kind) or (
+            # SUM over INT64 is a HUGEINT in DuckDB, but INT64 in BigQuery.
+            pa.types.is_decimal(kind)
+            and kind.scale == 0
+        ):
+            kind = pa.int64()
+        elif pa.types.is_floating(kind):
+            kind = pa.float64()
+        fields.append(field.with_type(kind))
+    return table.cast(pa.schema(fields))
+
+
+def _import_duckdb() -> Any:
+    """Imports DuckDB, which is an optional dependency."""
+    try:
+        import duckdb
+    except ImportError as error:
+        raise ImportError(
+            'The local execution tier requires DuckDB. Install it with '
+            "`pip install 'easy-bigquery[local]'`."
+        ) from error
+    return duckdb
+
+
+class LocalTier:
+    """
+    Answers queries over snapshotted tables with an embedded DuckDB.
+
+    Selected reference tables are copied to local Parquet files through
+    the BigQuery Storage API. Queries that only read snapshotted tables
+    are rewritten to scan those files and executed by DuckDB, which
+    avoids the latency and cost of a BigQuery job. `query()` returns
+    None whenever a query cannot be served locally (it references no
+    snapshotted table, references a table that is not snapshotted,
+    calls a function outside `ALLOWED_FUNCTIONS`, or uses syntax DuckDB
+    does not understand), so callers can fall back to BigQuery. As in
+    BigQuery, NULLs sort first in ascending order and strings compare
+    by code point, and results get the dtypes `FetchWorker.fetch()`
+    returns. Other differences between the dialects (e.g. division by
+    zero yielding NULL instead of an error) are not detected, which is
+    why the tier is opt-in.
+
+    Tables registered with an `incremental_column` are refreshed by
+    appending only the rows whose value in that column is greater than
+    the local maximum. This suits append-only tables; updates and
+    deletes are only picked up by a full snapshot.
+
+    Attributes:
+        connector (BQConnector): An active and connected BQConnector.
+        cache_dir (pathlib.Path): The directory holding the snapshots.
+        max_staleness (Optional[float]): If set, snapshots older than
+            this many seconds are refreshed before serving a query.
+
+    Example:
+        ```python
+        with BQManager() as bq:
+            bq.enable_local_tier(
+                '/tmp/bq-cache',
+                tables={
+                    'my-project.ref.countries': None,
+                    'my-project.ref.events': 'event_time',
+                },
+            )
+            # Served by DuckDB from the local snapshot.
+            df = bq.fetch(
+                'SELECT region, COUNT(*) AS n '
+                'FROM `my-project.ref.countries` GROUP BY region'
+            )
+        ```
+    """
+
+    def __init__(
+        self,
+        connector: BQConnector,
+        cache_dir: str,
+        max_staleness: Optional[float] = None,
+    ):
+        """
+        Initializes the LocalTier.
+
+        Args:
+            connector: An initialized and connected `BQConnector`
+                instance.
+            cache_dir: The directory where snapshots are stored.
+            max_staleness: An optional maximum snapshot age in seconds.
+
+        Raises:
+            ImportError: If DuckDB is not installed.
+        """
+        self._duckdb = _import_duckdb()
+        self._db = self._duckdb.connect()
+        # BigQuery sorts NULLs first in ascending order, last in
+        # descending order; DuckDB sorts them last by default.
+        self._db.execute(
+            "SET default_null_order = 'nulls_first_on_asc_last_on_desc'"
+        )
+        # BigQuery compares strings by code point, whatever the locale.
+        self._db.execute("SET default_collation = 'binary'")
+        self.connector = connector
+        self.cache_dir = pathlib.Path(cache_dir).expanduser()
+        self.max_staleness = max_staleness
+        self._tables: Dict[str, Optional[str]] = {}
+        self._refreshed_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def tables(self) -> Dict[str, Optional[str]]:
+        """The snapshotted table IDs and their incremental columns."""
+        return dict(self._tables)
+
+    def add_tables(
+        self,
+        tables: Union[Iterable[str], Dict[str, Optional[str]]],
+        refresh: bool = True,
+    ) -> 'LocalTier':
+        """
+        Registers tables to be served locally.
+
+        Args:
+            tables: An iterable of fully-qualified table IDs, or a dict
+                mapping table IDs to an optional incremental column.
+            refresh: If True, snapshots the tables immediately.
+                Defaults to True.
+
+        Returns:
+            The tier itself, to allow chaining.
+        """
+        if not isinstance(tables, dict):
+            tables = dict.fromkeys(tables)
+        for table_id, column in tables.items():
+            self._tables[self._normalize(table_id)] = column
+        if refresh:
+            self.refresh(tables)
+        return self
+
+    def refresh(self, tables: Optional[Iterable[str]] = None) -> None:
+        """
+        Updates the local snapshots.
+
+        Tables with an incremental column and an existing snapshot get
+        only their new rows; all others are copied in full.
+
+        Args:
+            tables: The table IDs to refresh. Defaults to all
+                registered tables.
+        """
+        for table_id in tables or list(self._tables):
+            table_id = self._normalize(table_id)
+            column = self._tables[table_id]
+            snapshotted = any(self._table_dir(table_id).glob('*.parquet'))
+            with self._lock:
+                if column and snapshotted:
+                    self._append_new_rows(table_id, column)
+                else:
+                    self._snapshot(table_id)
+                self._refreshed_at[table_id] = time.monotonic()
+
+    def query(
+        self, query: str, params: Optional[Dict[str, Any]] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        Runs a query locally if every table it reads is snapshotted.
+
+        Args:
+            query: The SQL query, written for BigQuery.
+            params: An optional mapping of values for the `@name`
+                placeholders in the query.
+
+        Returns:
+            The query result, or None if the query must run on
+            BigQuery instead.
+        """
+        local_sql, used = self._rewrite(query)
+        if not used:
+            return None
+        construct = _unsupported_construct(query)
+        if construct is not None:
+            logger.info(f'Query not served locally: uses {construct}.')
+            return None
+        if self.max_staleness is not None:
+            stale = [
+                table_id
+                for table_id in used
+                if time.monotonic() - self._refreshed_at.get(table_id, 0)
+                > self.max_staleness
+            ]
+            if stale:
+                self.refresh(stale)
+        if params:
+            local_sql = replace_placeholders(
+                local_sql, lambda name: '$' + name
+            )
+        cursor = self._db.cursor()
+        try:
+            table = cursor.execute(local_sql, params or None).arrow()
+        except self._duckdb.Error as error:
+            logger.info(f'Query not served locally: {error}')
+            return None
+        finally:
+            cursor.close()
+        df = to_pandas(_bigquery_types(table))
+        logger.info(f'Query served locally with {len(df)} rows.')
+        return df
+
+    def _normalize(self, table_id: str) -> str:
+        """Returns a `project.dataset.table` ID."""
+        parts = table_id.replace('`', '').split('.')
+        if len(parts) == 2:
+            parts.insert(0, self.connector.project_id)
+        if len(parts) != 3:
+            raise ValueError(f'Invalid table ID: {table_id!r}')
+        return '.'.join(parts)
+
+    def _table_dir(self, table_id: str) -> pathlib.Path:
+        """Returns the snapshot directory of a table."""
+        return self.cache_dir / table_id
+
+    def _rewrite(self, query: str) -> Tuple[str, List[str]]:
+        """Replaces references to snapshotted tables with Parquet scans."""
+        used = []
+        for table_id in self._tables:
+            project, dataset, table = table_id.split('.')
+            spellings = [
+                f'`{table_id}`',
+                f'`{project}`.`{dataset}`.`{table}`',
+                rf'(?<![\w.`]){re.escape(table_id)}(?![\w`])',
+            ]
+            if project == self.connector.project_id:
+                spellings += [
+                    f'`{dataset}.{table}`',
+                    rf'(?<![\w.`]){re.escape(dataset)}\.'
+                    rf'{re.escape(table)}(?![\w`])',
+                ]
+            pattern = '|'.join(
+                s if s.startswith('(?') else re.escape(s) for s in spellings
+            )
+            path = str(self._table_dir(table_id) / '*.parquet')
+            scan = "read_parquet('{}')".format(path.replace("'", "''"))
+            count = 0
+
+            def substitute(code: str) -> str:
+                nonlocal count
+                code, found = re.subn(pattern, lambda _: scan, code)
+                count += found
+                return code
+
+            query = _map_code(query, substitute)
+            if count:
+                used.append(table_id)
+        return query, used
+
+    def _snapshot(self, table_id: str) -> None:
+        """Copies a whole table to a single local Parquet file."""
+        logger.info(f'Snapshotting {table_id} to {self.cache_dir}')
+        self.connector.scheduler.throttle()
+        arrow_table = self.connector.client.list_rows(table_id).to_arrow(
+            bqstorage_client=self.connector.bq_storage
+        )
+        directory = self._table_dir(table_id)
+        directory.mkdir(parents=True, exist_ok=True)
+        temporary = directory / '.snapshot.parquet.tmp'
+        pq.write_table(arrow_table, temporary)
+        for part in directory.glob('*.parquet'):
+            part.unlink()
+        os.replace(temporary, directory / 'part-00000.parquet')
+        logger.info(f'Snapshot of {table_id} has {arrow_table.num_rows} rows.')
+
+    def _append_new_rows(self, table_id: str, column: str) -> None:
+        """Appends the rows newer than the local watermark."""
+        directory = self._table_dir(table_id)
+        scan = "read_parquet('{}')".format(
+            str(directory / '*.parquet').replace("'", "''")
+        )
+        cursor = self._db.cursor()
+        try:
+            (watermark,) = cursor.execute(
+                f'SELECT max("{column}") FROM {scan}'
+            ).fetchone()
+        finally:
+            cursor.close()
+        if watermark is None:
+            self._snapshot(table_id)
+            return
+        query = f'SELECT * FROM `{table_id}` WHERE `{column}` > @watermark'
+        # The normal fetch path admits and tracks the job.
+        arrow_table = pa.Table.from_batches(
+            FetchWorker(self.connector).iter_batches(
+                query, params={'watermark': watermark}
+            )
+        )
+        if arrow_table.num_rows:
+            index = len(list(directory.glob('*.parquet')))
+            pq.write_table(
+                arrow_table, directory / f'part-{index:05d}.parquet'
+            )
+        logger.info(
+            f'Appended {arrow_table.num_rows} new rows to the snapshot of '
+            f'{table_id}.'
+        )
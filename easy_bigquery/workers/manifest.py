@@ -0,0 +1,134 @@
+import datetime as dt
+import json
+import os
+import pathlib
+import tempfile
+import threading
+from typing import Any, Dict, Optional
+
+from easy_bigquery.core.config import BQ_PUSH_MANIFEST
+from easy_bigquery.logger import logger
+
+# One lock per manifest file, shared by every PushManifest on that path.
+_LOCKS: Dict[pathlib.Path, threading.Lock] = {}
+_LOCKS_GUARD = threading.Lock()
+
+
+def _lock_for(path: pathlib.Path) -> threading.Lock:
+    """Returns the process-wide lock guarding a manifest file."""
+    with _LOCKS_GUARD:
+        return _LOCKS.setdefault(path.resolve(), threading.Lock())
+
+
+class PushManifest:
+    """
+    Records the content hashes of the data last pushed to each table.
+
+    The manifest is a small JSON file mapping a table path to the hash
+    of the whole frame last loaded into it and, for partitioned pushes,
+    the hash of each partition. `PushWorker` consults it to skip loads
+    whose data did not change. Writes are atomic, so a crash never
+    leaves a truncated manifest behind, and serialized across every
+    instance sharing the file in the process. A manifest that cannot be
+    parsed is treated as empty, which only costs a reload.
+
+    The manifest only knows about pushes made through it: if a table
+    is modified by other means, call `forget()` so the next push is not
+    skipped.
+
+    Attributes:
+        path (pathlib.Path): The location of the manifest file.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initializes the PushManifest.
+
+        Args:
+            path: The location of the manifest file. Defaults to the
+                `BQ_PUSH_MANIFEST` setting. The file and its directory
+                are created on the first write.
+        """
+        self.path = pathlib.Path(path or BQ_PUSH_MANIFEST).expanduser()
+        self._lock = _lock_for(self.path)
+
+    def get(self, table: str) -> Dict[str, Any]:
+        """
+        Returns the recorded hashes of a table.
+
+        Args:
+            table: The full table path (`project.dataset.table`).
+
+        Returns:
+            A dict with the optional keys 'hash' and 'partitions'; empty
+            if nothing was recorded for the table.
+        """
+        with self._lock:
+            return self._read().get(table, {})
+
+    def record(
+        self,
+        table: str,
+        frame_hash: Optional[str] = None,
+        partitions: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """
+        Stores the hashes of data that was successfully pushed.
+
+        Args:
+            table: The full table path (`project.dataset.table`).
+            frame_hash: The hash of the whole frame, if known.
+            partitions: Hashes of the partitions that were written.
+                They are merged with the partitions already recorded.
+        """
+        with self._lock:
+            data = self._read()
+            entry = data.setdefault(table, {})
+            if frame_hash is not None:
+                entry['hash'] = frame_hash
+            if partitions:
+                entry.setdefault('partitions', {}).update(partitions)
+            entry['updated_at'] = dt.datetime.now(dt.timezone.utc).isoformat()
+            self._write(data)
+
+    def forget(self, table: str) -> None:
+        """
+        Removes a table from the manifest, forcing its next push.
+
+        Args:
+            table: The full table path (`project.dataset.table`).
+        """
+        with self._lock:
+            data = self._read()
+            if data.pop(table, None) is not None:
+                self._write(data)
+
+    def _read(self) -> Dict[str, Any]:
+        """Loads the manifest, treating a missing or broken file as empty."""
+        try:
+            data = json.loads(self.path.read_text())
+        except FileNotFoundError:
+            return {}
+        except (json.JSONDecodeError, UnicodeDecodeError) as error:
+            logger.warning(
+                f'Ignoring unreadable push manifest {self.path}: {error}'
+            )
+            return {}
+        if not isinstance(data, dict):
+            logger.warning(f'Ignoring malformed push manifest {self.path}.')
+            return {}
+        return data
+
+    def _write(self, data: Dict[str, Any]) -> None:
+        """Atomically replaces the manifest file."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f'.{self.path.name}.', suffix='.tmp'
+        )
+        try:
+            with os.fdopen(descriptor, 'w') as file:
+                json.dump(data, file, indent=2, sort_keys=True)
+            os.replace(temporary, self.path)
+        except BaseException:
+            pathlib.Path(temporary).unlink(missing_ok=True)
+            raise
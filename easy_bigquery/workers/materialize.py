@@ -0,0 +1,127 @@
+import datetime as dt
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from easy_bigquery.core.hashing import hash_value
+
+# Materialized tables are named after the fingerprint of their query.
+TABLE_PREFIX = 'easy_bigquery_mat_'
+
+# Tokens whose whitespace is significant or irrelevant to the result:
+# string literals, quoted identifiers and comments. They are kept
+# verbatim when a query is normalized.
+_VERBATIM_PATTERN = re.compile(
+    r"""
+    '''.*?'''
+    | \"\"\".*?\"\"\"
+    | '(?:\\.|[^'\\])*'
+    | "(?:\\.|[^"\\])*"
+    | `[^`]*`
+    | --[^\n]*
+    | \#[^\n]*
+    | /\*.*?\*/
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+# A table this close to expiry is recomputed rather than reused, so it
+# cannot vanish between being handed out and being read.
+MIN_REMAINING = dt.timedelta(minutes=1)
+
+
+@dataclass(frozen=True)
+class MaterializedTable:
+    """
+    A reference to a query result stored in an auto-expiring table.
+
+    The reference formats as a quoted table path, so it can be used
+    directly in later SQL, and it can be passed to `read_table()` to
+    download the stored rows through the Storage API without running
+    another query.
+
+    Attributes:
+        table_id (str): The full table path (`project.dataset.table`).
+        fingerprint (str): The hash of the query text and parameters.
+        expires_at (datetime.datetime): When BigQuery deletes the table.
+        reused (bool): True if an existing table was returned instead
+            of running the query.
+
+    Example:
+        ```python
+        with BQManager() as bq:
+            base = bq.materialize(
+                'SELECT ... FROM `my.huge.table` WHERE ...', ttl=3600
+            )
+            by_state = bq.fetch(
+                f'SELECT state, COUNT(*) AS n FROM {base} GROUP BY state'
+            )
+            sample = bq.read_table(base, max_results=1000)
+        ```
+    """
+
+    table_id: str
+    fingerprint: str
+    expires_at: dt.datetime
+    reused: bool = False
+
+    def __str__(self) -> str:
+        return f'`{self.table_id}`'
+
+    def is_fresh(self, now: Optional[dt.datetime] = None) -> bool:
+        """
+        Whether the table is far enough from expiry to be reused.
+
+        Args:
+            now: The current time. Defaults to the current UTC time.
+
+        Returns:
+            True if the table expires more than `MIN_REMAINING` from
+            now.
+        """
+        now = now or dt.datetime.now(dt.timezone.utc)
+        return self.expires_at - now > MIN_REMAINING
+
+
+def query_fingerprint(
+    query: str, params: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    Returns a stable fingerprint of a query and its parameters.
+
+    Whitespace outside string literals, quoted identifiers and
+    comments is normalized, so reformatting a query does not defeat
+    reuse while literals that differ only in spacing stay distinct.
+
+    Args:
+        query: The SQL query text.
+        params: An optional mapping of query parameter values.
+
+    Returns:
+        A hexadecimal digest identifying the query result.
+    """
+    parts = []
+    start = 0
+    for match in _VERBATIM_PATTERN.finditer(query):
+        parts.append(re.sub(r'\s+', ' ', query[start : match.start()]))
+        parts.append(match.group())
+        start = match.end()
+    parts.append(re.sub(r'\s+', ' ', query[start:]))
+    normalized = ''.join(parts).strip()
+    bound = sorted((params or {}).items())
+    return hash_value((normalized, repr(bound)))
+
+
+def materialized_table_id(project: str, dataset: str, fingerprint: str) -> str:
+    """
+    Returns the table path where a query result is materialized.
+
+    Args:
+        project: The project ID.
+        dataset: The dataset ID.
+        fingerprint: The query fingerprint.
+
+    Returns:
+        The full table path.
+    """
+    return f'{project}.{dataset}.{TABLE_PREFIX}{fingerprint}'
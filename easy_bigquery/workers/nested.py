@@ -0,0 +1,156 @@
+"""
+Vectorized reshaping of nested (STRUCT/ARRAY) query results.
+
+BigQuery RECORD and REPEATED fields arrive in pandas as object columns
+of Python dicts and lists, which are slow to unpack row by row. The
+helpers here reshape the result while it is still an Arrow table:
+struct columns are flattened into dotted columns and list columns are
+exploded into one row per element, using Arrow compute kernels that
+never create per-row Python objects.
+"""
+from typing import Any, Callable, Iterable, Optional, Union
+
+import db_dtypes
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+
+def flatten_structs(table: pa.Table, separator: str = '.') -> pa.Table:
+    """
+    Flattens struct columns, recursively, into one column per field.
+
+    Args:
+        table: The Arrow table to flatten.
+        separator: The string joining parent and field names. Defaults
+            to '.', e.g. `address.city`.
+
+    Returns:
+        A table without struct columns (structs nested in lists are
+        left as they are; explode the list first).
+    """
+    original = set(table.column_names)
+    while any(pa.types.is_struct(field.type) for field in table.schema):
+        table = table.flatten()
+    if separator != '.':
+        # BigQuery column names cannot contain dots, so every dot was
+        # introduced by flattening.
+        table = table.rename_columns(
+            [
+                name if name in original else name.replace('.', separator)
+                for name in table.column_names
+            ]
+        )
+    return table
+
+
+def explode_lists(
+    table: pa.Table,
+    columns: Union[str, Iterable[str]],
+    keep_empty: bool = True,
+) -> pa.Table:
+    """
+    Expands list columns into one row per list element.
+
+    The other columns are repeated for each element with a single
+    `take`, so the cost is proportional to the output size. Several
+    columns are exploded one after the other, yielding the cross
+    product of their elements.
+
+    Args:
+        table: The Arrow table to explode.
+        columns: The name, or names, of the list columns to explode.
+        keep_empty: If True, rows with an empty or null list are kept
+            with a null element, like `pandas.DataFrame.explode`. If
+            False, they are dropped. Defaults to True.
+
+    Returns:
+        The exploded table, with columns in their original order.
+
+    Raises:
+        ValueError: If a column is not a list column.
+    """
+    if isinstance(columns, str):
+        columns = [columns]
+    for name in columns:
+        values = table.column(name)
+        if not pa.types.is_list(values.type) and not pa.types.is_large_list(
+            values.type
+        ):
+            raise ValueError(f'Column {name!r} is not a list column.')
+        if keep_empty:
+            empty = pc.fill_null(
+                pc.equal(pc.list_value_length(values), 0), True
+            )
+            placeholder = pa.scalar([None], type=values.type)
+            values = pc.if_else(empty, placeholder, values)
+        parents = pc.list_parent_indices(values)
+        table = table.take(parents).set_column(
+            table.schema.get_field_index(name),
+            name,
+            pc.list_flatten(values),
+        )
+    return table
+
+
+def reshape(
+    table: pa.Table,
+    flatten: bool = False,
+    explode: Optional[Union[str, Iterable[str]]] = None,
+) -> pa.Table:
+    """
+    Applies the fetch-time reshaping options to an Arrow table.
+
+    Structs are flattened before exploding, so arrays nested in records
+    can be named by their dotted path, and again afterwards, so arrays
+    of records end up as one dotted column per field.
+
+    Args:
+        table: The Arrow table to reshape.
+        flatten: If True, flattens struct columns.
+        explode: The list column, or columns, to explode.
+
+    Returns:
+        The reshaped table.
+    """
+    if flatten:
+        table = flatten_structs(table)
+    if explode:
+        table = explode_lists(table, explode)
+        if flatten:
+            table = flatten_structs(table)
+    return table
+
+
+def _default_types(arrow_type: pa.DataType) -> Optional[Any]:
+    """Mirrors the nullable dtypes `to_dataframe()` uses by default."""
+    if pa.types.is_boolean(arrow_type):
+        return pd.BooleanDtype()
+    if pa.types.is_int64(arrow_type):
+        return pd.Int64Dtype()
+    if pa.types.is_date32(arrow_type):
+        return db_dtypes.DateDtype()
+    if pa.types.is_time64(arrow_type):
+        return db_dtypes.TimeDtype()
+    return None
+
+
+def to_pandas(table: pa.Table, arrow_dtypes: bool = False) -> pd.DataFrame:
+    """
+    Converts an Arrow table to pandas.
+
+    Args:
+        table: The Arrow table to convert.
+        arrow_dtypes: If True, every column becomes a
+            `pandas.ArrowDtype`, so lists and structs stay columnar
+            instead of turning into Python objects. If False, scalar
+            columns get the same dtypes as `to_dataframe()` would give
+            them. Defaults to False.
+
+    Returns:
+        The pandas DataFrame.
+    """
+    mapper: Callable[[pa.DataType], Optional[Any]] = (
+        pd.ArrowDtype if arrow_dtypes else _default_types
+    )
+    return table.to_pandas(types_mapper=mapper)
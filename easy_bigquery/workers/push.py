@@ -1,10 +1,41 @@
-from typing import List, Literal, Optional
+from typing import Any, List, Literal, Optional, Tuple
 
 import pandas as pd
 from google.cloud import bigquery as bq
 
 from easy_bigquery.connector.connector import BQConnector
+from easy_bigquery.connector.jobs import (
+    JobHandle,
+    deadline_after,
+    wait_for_job,
+)
+from easy_bigquery.core.hashing import (
+    hash_dataframe,
+    hash_partitions,
+    hash_value,
+)
+from easy_bigquery.core.profiling import (
+    NULL_PROFILE,
+    Profile,
+    ProfileOption,
+    ProfileRecorder,
+    profiling,
+)
 from easy_bigquery.logger import logger
+from easy_bigquery.workers.encoding import (
+    SourceFormat,
+    benchmark_encodings,
+    encode_dataframe,
+)
+from easy_bigquery.workers.manifest import PushManifest
+
+# Partition decorator formats per time-partitioning granularity.
+PARTITION_FORMATS = {
+    'HOUR': '%Y%m%d%H',
+    'DAY': '%Y%m%d',
+    'MONTH': '%Y%m',
+    'YEAR': '%Y',
+}
 
 
 class PushWorker:
@@ -19,6 +50,10 @@ class PushWorker:
     Attributes:
         connector (BQConnector): An active and connected
             BQConnector instance.
+        manifest (PushManifest): The record of content hashes used to
+            skip unchanged pushes.
+        last_profile (Optional[Profile]): The profile of the latest
+            profiled `push()` call, if any.
 
     Example:
         ```python
@@ -52,20 +87,30 @@ class PushWorker:
         ```
     """
 
-    def __init__(self, connector: BQConnector):
+    def __init__(
+        self,
+        connector: BQConnector,
+        manifest: Optional[PushManifest] = None,
+    ):
         """
         Initializes the PushWorker.
 
         Args:
             connector: An initialized and connected `BQConnector`
                 instance.
+            manifest: An optional `PushManifest`. Defaults to the file
+                configured by `BQ_PUSH_MANIFEST`.
 
         Raises:
             ConnectionError: If the provided connector is not active.
         """
+        # An unpickled connector reconnects here, in its new process.
+        connector.ensure_process()
         if not connector.client:
             raise ConnectionError('Connector must be connected first.')
         self.connector = connector
+        self.manifest = manifest or PushManifest()
+        self.last_profile: Optional[Profile] = None
 
     def push(
         self,
@@ -81,6 +126,17 @@ class PushWorker:
             'WRITE_DISPOSITION_UNSPECIFIED',
             'WRITE_TRUNCATE_DATA',
         ] = 'WRITE_APPEND',
+        source_format: Optional[SourceFormat] = None,
+        compression: Optional[str] = None,
+        compression_level: Optional[int] = None,
+        row_group_size: Optional[int] = None,
+        skip_unchanged: bool = False,
+        partition_column: Optional[str] = None,
+        partition_type: Literal['HOUR', 'DAY', 'MONTH', 'YEAR'] = 'DAY',
+        timeout: Optional[float] = None,
+        handle: Optional[JobHandle] = None,
+        profile: ProfileOption = None,
+        lane: str = 'batch',
     ) -> None:
         """
         Loads a pandas DataFrame into a BigQuery table.
@@ -88,6 +144,23 @@ class PushWorker:
         This method handles the entire process of uploading a DataFrame,
         including job configuration, execution, and error checking.
 
+        By default the client library chooses how the DataFrame is
+        serialized. Setting any of the encoding options serializes it
+        locally instead (see `easy_bigquery.workers.encoding`), which
+        allows trading CPU time for upload size. Use `benchmark()` to
+        compare the options on a representative frame.
+
+        With `skip_unchanged`, a content hash of the frame is compared
+        with the one recorded in the manifest for the destination, and
+        the load is skipped when they match. With `partition_column`,
+        the frame is split by time partition and each partition is
+        loaded through its partition decorator (`table$20240101`), so
+        `WRITE_TRUNCATE` replaces only the partitions present in the
+        frame; combined with `skip_unchanged`, only partitions whose
+        hash changed are rewritten. Other pushes drop the destination
+        from the manifest; after changing a table by other means, call
+        `manifest.forget()` so its next push is not skipped.
+
         Args:
             df: The pandas DataFrame to be uploaded.
             project_id: The GCP project ID. If None, the project ID from
@@ -101,14 +174,54 @@ class PushWorker:
             write_disposition: Specifies the action if the table exists
                 (e.g., 'WRITE_APPEND', 'WRITE_TRUNCATE'). Defaults to
                 'WRITE_APPEND'.
+            source_format: The wire format: 'PARQUET', 'ORC' or
+                'NEWLINE_DELIMITED_JSON'. Defaults to 'PARQUET' when
+                another encoding option is set.
+            compression: The compression codec (e.g., 'snappy', 'zstd',
+                'gzip' or 'none'). Defaults to the format's default.
+            compression_level: An optional codec-specific level.
+            row_group_size: The maximum number of rows per Parquet row
+                group.
+            skip_unchanged: If True, skips loads whose content hash
+                matches the last successful push. Requires
+                'WRITE_TRUNCATE'. Defaults to False.
+            partition_column: An optional DATE, DATETIME or TIMESTAMP
+                column by which the table is time-partitioned.
+            partition_type: The partitioning granularity. Defaults to
+                'DAY'.
+            timeout: An optional number of seconds the whole push may
+                take, shared by all of its load jobs. When it elapses
+                the running job is cancelled server-side and
+                `TimeoutError` is raised.
+            handle: An optional `JobHandle` through which another
+                thread can cancel the running load job.
+            profile: True (or 'phases') to record the wall time, CPU
+                time and peak memory of the 'hash', 'encode', 'upload'
+                and 'job' phases; 'sampling' to also sample stacks,
+                which splits the upload between pandas, Arrow and
+                network work; or a `Profile` to record into. Defaults
+                to the `BQ_PROFILE` setting. Reports are logged and
+                kept in `last_profile`.
+            lane: The connector scheduler lane the load jobs are
+                admitted through. Defaults to 'batch'.
 
         Raises:
             RuntimeError: If the BigQuery client is not initialized or if
                 the load job fails after execution.
+            ValueError: If the encoding options are not supported, or if
+                `skip_unchanged` is used without 'WRITE_TRUNCATE'.
+            TimeoutError: If the push does not finish within `timeout`.
+            concurrent.futures.CancelledError: If the load job is
+                cancelled through `handle`.
         """
+        deadline = deadline_after(timeout)
+        self.connector.ensure_process()
         if not self.connector.client:
             raise RuntimeError('BigQuery client not initialized.')
 
+        if skip_unchanged and write_disposition != 'WRITE_TRUNCATE':
+            raise ValueError('skip_unchanged requires WRITE_TRUNCATE.')
+
         job_config = bq.LoadJobConfig(
             create_disposition=bq.CreateDisposition.CREATE_IF_NEEDED,
             write_disposition=write_disposition,
@@ -117,14 +230,206 @@ class PushWorker:
         )
 
         full_table_path = f'{project_id or self.connector.project_id}.{dataset or self.connector.dataset}.{table or self.connector.table}'
-        logger.info(f'Loading {len(df)} rows to {full_table_path}...')
+        encoding = (
+            source_format,
+            compression,
+            compression_level,
+            row_group_size,
+        )
+        supervision = (deadline, handle)
+
+        with profiling('push', profile) as prof:
+            if prof.enabled:
+                self.last_profile = prof
+            if partition_column is not None:
+                job_config.time_partitioning = bq.TimePartitioning(
+                    type_=partition_type, field=partition_column
+                )
+                self._push_partitions(
+                    df,
+                    full_table_path,
+                    job_config,
+                    encoding,
+                    partition_column,
+                    partition_type,
+                    skip_unchanged,
+                    supervision,
+                    prof,
+                    lane,
+                )
+                return
+
+            frame_hash = None
+            if skip_unchanged:
+                with prof.phase('hash'):
+                    frame_hash = hash_value((hash_dataframe(df), repr(schema)))
+                recorded = self.manifest.get(full_table_path)
+                if recorded.get('hash') == frame_hash:
+                    logger.info(
+                        f'Skipping push to {full_table_path}: data unchanged.'
+                    )
+                    return
 
-        load_job = self.connector.client.load_table_from_dataframe(
-            dataframe=df, destination=full_table_path, job_config=job_config
+            logger.info(f'Loading {len(df)} rows to {full_table_path}...')
+            self._load(
+                df,
+                full_table_path,
+                job_config,
+                encoding,
+                supervision,
+                prof,
+                lane,
+            )
+            if skip_unchanged:
+                self.manifest.record(full_table_path, frame_hash=frame_hash)
+            else:
+                # The recorded hashes no longer describe the table contents.
+                self.manifest.forget(full_table_path)
+
+    def _push_partitions(
+        self,
+        df: pd.DataFrame,
+        full_table_path: str,
+        job_config: bq.LoadJobConfig,
+        encoding: Tuple[Any, ...],
+        partition_column: str,
+        partition_type: str,
+        skip_unchanged: bool,
+        supervision: Tuple[Optional[float], Optional[JobHandle]],
+        prof: ProfileRecorder = NULL_PROFILE,
+        lane: str = 'batch',
+    ) -> None:
+        """Loads each (changed) partition through its decorator."""
+        values = df[partition_column]
+        if not pd.api.types.is_datetime64_any_dtype(values):
+            values = pd.to_datetime(values)
+        if getattr(values.dt, 'tz', None) is not None:
+            values = values.dt.tz_convert('UTC')
+        keys = values.dt.strftime(PARTITION_FORMATS[partition_type]).fillna(
+            '__NULL__'
+        )
+        schema_tag = repr(job_config.schema)
+        with prof.phase('hash'):
+            hashes = {
+                key: hash_value((digest, schema_tag))
+                for key, digest in hash_partitions(df, keys).items()
+            }
+
+        recorded = (
+            self.manifest.get(full_table_path).get('partitions', {})
+            if skip_unchanged
+            else {}
+        )
+        changed = [
+            key
+            for key, digest in hashes.items()
+            if recorded.get(key) != digest
+        ]
+        logger.info(
+            f'{len(changed)} of {len(hashes)} partitions of '
+            f'{full_table_path} to load.'
         )
-        load_job.result()  # Wait for the job to complete
+        if not changed:
+            return
+
+        mask = keys.isin(changed).to_numpy()
+        for key, part in df[mask].groupby(keys[mask].to_numpy(), sort=False):
+            destination = f'{full_table_path}${key}'
+            logger.info(f'Loading {len(part)} rows to {destination}...')
+            self._load(
+                part,
+                destination,
+                job_config,
+                encoding,
+                supervision,
+                prof,
+                lane,
+            )
+            if skip_unchanged:
+                self.manifest.record(
+                    full_table_path, partitions={key: hashes[key]}
+                )
+        if not skip_unchanged:
+            self.manifest.forget(full_table_path)
+
+    def _load(
+        self,
+        df: pd.DataFrame,
+        destination: str,
+        job_config: bq.LoadJobConfig,
+        encoding: Tuple[Any, ...],
+        supervision: Tuple[Optional[float], Optional[JobHandle]] = (
+            None,
+            None,
+        ),
+        prof: ProfileRecorder = NULL_PROFILE,
+        lane: str = 'batch',
+    ) -> None:
+        """Runs one load job and waits for it, under a deadline if any."""
+        payload = None
+        if any(option is not None for option in encoding):
+            source_format, compression, level, row_group_size = encoding
+            job_config.source_format = source_format or 'PARQUET'
+            with prof.phase('encode'):
+                payload = encode_dataframe(
+                    df,
+                    job_config.source_format,
+                    compression,
+                    level,
+                    row_group_size,
+                )
+            logger.info(
+                f'Encoded {job_config.source_format} payload of '
+                f'{payload.getbuffer().nbytes} bytes.'
+            )
+        with self.connector.scheduler.slot(lane):
+            if payload is not None:
+                with prof.phase('upload'):
+                    load_job = self.connector.client.load_table_from_file(
+                        payload,
+                        destination=destination,
+                        job_config=job_config,
+                    )
+            else:
+                # The client library converts and encodes the frame
+                # itself, so this phase includes dtype coercion and
+                # Parquet writing.
+                with prof.phase('upload'):
+                    load_job = self.connector.client.load_table_from_dataframe(
+                        dataframe=df,
+                        destination=destination,
+                        job_config=job_config,
+                    )
+            with self.connector.jobs.track(load_job):
+                with prof.phase('job'):
+                    wait_for_job(load_job, *supervision)
+                    load_job.result()  # Wait for the job to complete
 
         if load_job.errors:
             logger.error(f'Load job failed: {load_job.errors}')
             raise RuntimeError('BigQuery load job failed.', load_job.errors)
         logger.info(f'Successfully loaded {load_job.output_rows} rows.')
+
+    def benchmark(
+        self,
+        df: pd.DataFrame,
+        candidates: Optional[
+            List[Tuple[str, Optional[str], Optional[int]]]
+        ] = None,
+    ) -> pd.DataFrame:
+        """
+        Compares encoding options for a DataFrame without uploading it.
+
+        Args:
+            df: A representative pandas DataFrame.
+            candidates: An optional list of `(source_format,
+                compression, compression_level)` tuples. Defaults to a
+                grid of common Parquet, ORC and JSON settings.
+
+        Returns:
+            A DataFrame with the encode time and payload size of each
+            candidate, sorted by payload size.
+        """
+        report = benchmark_encodings(df, candidates)
+        logger.info(f'Encoding benchmark:\n{report.to_string(index=False)}')
+        return report
@@ -0,0 +1,181 @@
+import os
+import pathlib
+import tempfile
+import uuid
+from typing import Optional, Union
+
+import pandas as pd
+import pyarrow as pa
+
+from easy_bigquery.logger import logger
+
+
+def _default_directory() -> str:
+    """Prefers the RAM-backed /dev/shm over the temporary directory."""
+    return '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+
+
+class SharedTable:
+    """
+    A picklable handle to an Arrow table published for other processes.
+
+    The table is written once as an Arrow IPC file (in `/dev/shm` when
+    available, so it lives in memory). Any process holding the handle
+    can `open()` it as a memory-mapped table without copying or
+    unpickling the data, which makes fanning a large result out to a
+    process pool as cheap as sending a file path.
+
+    The file is reference-counted across processes: `publish()` starts
+    with the given number of references, `retain()` adds references
+    before handing the handle to more consumers, and each consumer
+    calls `release()` (or uses the handle as a context manager) when
+    done. The file is deleted when the count reaches zero; tables
+    already opened stay valid until they are garbage collected.
+    Reference counting relies on POSIX file locks (`fcntl`).
+
+    Attributes:
+        path (str): The location of the Arrow IPC file.
+
+    Example:
+        ```python
+        from concurrent.futures import ProcessPoolExecutor
+
+        def summarize(handle, column):
+            with handle:
+                table = handle.open()  # Zero-copy, no unpickling.
+                return table.column(column).null_count
+
+        with BQManager() as bq:
+            columns = ['name', 'state']
+            handle = bq.fetch_shared(
+                'SELECT * FROM `my.big.table`', refs=len(columns)
+            )
+            with ProcessPoolExecutor() as pool:
+                futures = [
+                    pool.submit(summarize, handle, column)
+                    for column in columns
+                ]
+                print([future.result() for future in futures])
+        ```
+    """
+
+    def __init__(self, path: str):
+        """
+        Initializes a handle to an already published table.
+
+        Args:
+            path: The location of the Arrow IPC file.
+        """
+        self.path = path
+
+    def __enter__(self) -> 'SharedTable':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.release()
+
+    def __repr__(self) -> str:
+        return f'SharedTable({self.path!r})'
+
+    @classmethod
+    def publish(
+        cls,
+        data: Union[pa.Table, pd.DataFrame],
+        refs: int = 1,
+        directory: Optional[str] = None,
+    ) -> 'SharedTable':
+        """
+        Writes a table to shared memory and returns a handle to it.
+
+        Args:
+            data: The Arrow table or pandas DataFrame to publish.
+            refs: The initial number of references. Defaults to 1.
+            directory: Where to write the file. Defaults to `/dev/shm`
+                if it exists, otherwise the temporary directory.
+
+        Returns:
+            A `SharedTable` handle owning `refs` references.
+
+        Raises:
+            ValueError: If `refs` is not positive.
+        """
+        if refs < 1:
+            raise ValueError('A shared table needs at least one reference.')
+        if isinstance(data, pd.DataFrame):
+            data = pa.Table.from_pandas(data, preserve_index=False)
+        path = os.path.join(
+            directory or _default_directory(),
+            f'easy_bigquery-{uuid.uuid4().hex}.arrow',
+        )
+        with pa.OSFile(path, 'wb') as sink:
+            with pa.ipc.new_file(sink, data.schema) as writer:
+                writer.write_table(data)
+        pathlib.Path(f'{path}.refs').write_text(str(refs))
+        logger.info(
+            f'Published {data.num_rows} rows ({data.nbytes} bytes) to {path}'
+        )
+        return cls(path)
+
+    @property
+    def refs(self) -> int:
+        """The current number of references, or 0 once released."""
+        try:
+            return int(pathlib.Path(f'{self.path}.refs').read_text() or 0)
+        except FileNotFoundError:
+            return 0
+
+    def open(self) -> pa.Table:
+        """
+        Opens the table as a zero-copy, memory-mapped Arrow table.
+
+        Returns:
+            A `pyarrow.Table` backed by the shared file.
+
+        Raises:
+            FileNotFoundError: If the table was already released.
+        """
+        source = pa.memory_map(self.path, 'r')
+        return pa.ipc.open_file(source).read_all()
+
+    def retain(self, count: int = 1) -> 'SharedTable':
+        """
+        Adds references, e.g. before sending the handle to more workers.
+
+        Args:
+            count: The number of references to add. Defaults to 1.
+
+        Returns:
+            The handle itself, to allow chaining.
+        """
+        self._adjust(count)
+        return self
+
+    def release(self) -> None:
+        """Drops one reference, deleting the file when none remain."""
+        self._adjust(-1)
+
+    def _adjust(self, delta: int) -> int:
+        """Atomically changes the reference count across processes."""
+        import fcntl
+
+        refs_path = f'{self.path}.refs'
+        try:
+            counter = open(refs_path, 'r+')
+        except FileNotFoundError:
+            raise RuntimeError(f'{self!r} was already released.') from None
+        with counter:
+            fcntl.flock(counter, fcntl.LOCK_EX)
+            current = int(counter.read() or 0)
+            if current <= 0:
+                # Another process released the last reference meanwhile.
+                raise RuntimeError(f'{self!r} was already released.')
+            count = current + delta
+            counter.seek(0)
+            counter.truncate()
+            counter.write(str(count))
+            counter.flush()
+            if count <= 0:
+                os.unlink(self.path)
+                os.unlink(refs_path)
+                logger.info(f'Released shared table {self.path}')
+        return count
@@ -3,6 +3,7 @@ from unittest.mock import MagicMock
 import pandas as pd
 import pytest
 
+from easy_bigquery.connector import credentials
 from easy_bigquery.connector.connector import BQConnector
 
 # Define constants for mocking to ensure consistency across tests.
@@ -14,6 +15,30 @@ MOCK_CREDS_INFO_STR = (
 )
 
 
+@pytest.fixture(autouse=True)
+def isolated_credentials_cache(mocker):
+    """
+    Isolate the process-wide credentials cache between tests.
+
+    The cache would otherwise hand credentials created (and mocked) by
+    one test to the next. The background refresher is disabled so no
+    thread touches the mocked credentials.
+    """
+    mocker.patch('easy_bigquery.connector.credentials._ensure_refresher')
+    credentials.clear_cache()
+    yield
+    credentials.clear_cache()
+
+
+@pytest.fixture(autouse=True)
+def isolated_push_manifest(mocker, tmp_path):
+    """Keep the default push manifest out of the user's home directory."""
+    mocker.patch(
+        'easy_bigquery.workers.manifest.BQ_PUSH_MANIFEST',
+        str(tmp_path / 'push_manifest.json'),
+    )
+
+
 @pytest.fixture
 def mock_connector_tuple(mocker):
     """
@@ -1,6 +1,10 @@
 import json
+import pickle
 
 from easy_bigquery.connector.connector import BQConnector
+from easy_bigquery.connector.credentials import SCOPES
+from easy_bigquery.workers.fetch import FetchWorker
+from easy_bigquery.workers.push import PushWorker
 
 
 def test_connector_initialization(mock_connector_tuple):
@@ -30,7 +34,9 @@ def test_connector_connect(mock_connector_tuple):
     mock_creds_info = json.loads(
         '{"type": "service_account", "project_id": "test-project"}'
     )
-    mocks['from_creds'].assert_called_once_with(info=mock_creds_info)
+    mocks['from_creds'].assert_called_once_with(
+        info=mock_creds_info, scopes=SCOPES
+    )
 
     # Verify that both BigQuery and BigQuery Storage clients are created.
     mocks['client_class'].assert_called_once_with(
@@ -60,3 +66,65 @@ def test_connector_close(mock_connector_tuple):
     mocks['storage_instance'].transport.close.assert_called_once()
     assert connector.client is None
     assert connector.bq_storage is None
+
+
+def test_connector_reconnects_in_a_new_process(mock_connector_tuple, mocker):
+    """Test that clients are rebuilt when the process ID changes."""
+    connector, mocks = mock_connector_tuple
+    connector.connect()
+    child_pid = connector._pid + 1
+    mocker.patch(
+        'easy_bigquery.connector.connector.os.getpid',
+        return_value=child_pid,
+    )
+
+    connector.ensure_process()
+
+    # Inherited transports belong to the parent and must not be closed.
+    mocks['storage_instance'].transport.close.assert_not_called()
+    assert mocks['client_class'].call_count == 2
+    assert connector._pid == child_pid
+
+
+def test_connector_ensure_process_is_noop_in_same_process(
+    mock_connector_tuple,
+):
+    """Test that ensure_process neither connects nor reconnects needlessly."""
+    connector, mocks = mock_connector_tuple
+
+    # A connector that was never connected stays disconnected.
+    connector.ensure_process()
+    mocks['client_class'].assert_not_called()
+
+    connector.connect()
+    connector.ensure_process()
+    mocks['client_class'].assert_called_once()
+
+
+def test_connector_pickling_drops_clients(mock_connector_tuple):
+    """Test that the pickled state carries no process-bound clients."""
+    connector, _ = mock_connector_tuple
+    connector.connect()
+
+    state = connector.__getstate__()
+
+    assert state['client'] is None
+    assert state['bq_storage'] is None
+    assert state['credentials'] is None
+    assert state['project_id'] == 'test-project'
+    # The live connector keeps its clients.
+    assert connector.client is not None
+
+
+def test_unpickled_connector_reconnects_for_workers(mock_connector_tuple):
+    """Test that workers can be built from an unpickled connector."""
+    connector, mocks = mock_connector_tuple
+    connector.connect()
+
+    clone = pickle.loads(pickle.dumps(connector))
+    fetcher = FetchWorker(clone)
+    pusher = PushWorker(clone)
+
+    assert fetcher.connector.client is not None
+    assert pusher.connector is clone
+    assert mocks['client_class'].call_count == 2
@@ -0,0 +1,67 @@
+import datetime as dt
+from unittest.mock import MagicMock
+
+from easy_bigquery.connector import credentials
+from easy_bigquery.connector.connector import BQConnector
+
+SERVICE_ACCOUNT = (
+    '{"type": "service_account", "client_email": "a@p.iam", '
+    '"private_key_id": "k1"}'
+)
+
+
+def test_connectors_share_credentials(mock_connector_tuple):
+    """Test that one service account yields one credentials object."""
+    _, mocks = mock_connector_tuple
+    first = BQConnector(project_id='p', credentials_info=SERVICE_ACCOUNT)
+    second = BQConnector(project_id='p', credentials_info=SERVICE_ACCOUNT)
+
+    first.connect()
+    second.connect()
+
+    mocks['from_creds'].assert_called_once()
+    assert first.credentials is second.credentials
+
+
+def test_distinct_keys_get_distinct_credentials(mock_connector_tuple):
+    """Test that different service account keys are cached separately."""
+    _, mocks = mock_connector_tuple
+    mocks['from_creds'].side_effect = lambda **kwargs: MagicMock()
+    other_key = SERVICE_ACCOUNT.replace('k1', 'k2')
+
+    first = credentials.get_credentials(
+        credentials.parse_credentials_info(SERVICE_ACCOUNT)
+    )
+    second = credentials.get_credentials(
+        credentials.parse_credentials_info(other_key)
+    )
+
+    assert first is not second
+
+
+def test_parse_returns_independent_dicts():
+    """Test that cached parsing never shares a mutable dict."""
+    first = credentials.parse_credentials_info(SERVICE_ACCOUNT)
+    first['client_email'] = 'changed'
+
+    second = credentials.parse_credentials_info(SERVICE_ACCOUNT)
+
+    assert second['client_email'] == 'a@p.iam'
+
+
+def test_refresh_expiring_only_renews_stale_tokens(mocker):
+    """Test that fresh tokens are kept and failures are tolerated."""
+    now = dt.datetime.now(dt.timezone.utc).replace(tzinfo=None)
+    fresh = MagicMock(token='t', expiry=now + dt.timedelta(hours=1))
+    expiring = MagicMock(token='t', expiry=now + dt.timedelta(minutes=1))
+    missing = MagicMock(token=None, expiry=None)
+    missing.refresh.side_effect = RuntimeError('network down')
+    mocker.patch.dict(
+        credentials._cache, {'fresh': fresh, 'old': expiring, 'new': missing}
+    )
+
+    assert credentials.refresh_expiring() == 1
+
+    fresh.refresh.assert_not_called()
+    expiring.refresh.assert_called_once()
+    missing.refresh.assert_called_once()
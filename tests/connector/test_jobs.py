@@ -0,0 +1,121 @@
+import threading
+from concurrent.futures import CancelledError
+from unittest.mock import MagicMock
+
+import pytest
+
+from easy_bigquery.connector import jobs
+from easy_bigquery.connector.jobs import (
+    JobHandle,
+    JobRegistry,
+    deadline_after,
+    wait_for_job,
+)
+
+
+@pytest.fixture
+def fast_polling(mocker):
+    """Shrink the polling intervals so tests run quickly."""
+    mocker.patch.object(jobs, 'INITIAL_POLL_INTERVAL', 0.01)
+    mocker.patch.object(jobs, 'MAX_POLL_INTERVAL', 0.02)
+
+
+def make_job(done_after=None):
+    """Create a job mock that reports done after `done_after` polls."""
+    job = MagicMock(job_id='job-1')
+    if done_after is None:
+        job.done.return_value = False
+    else:
+        job.done.side_effect = [False] * done_after + [True]
+    return job
+
+
+def test_wait_returns_immediately_without_deadline_or_handle():
+    """Test that unsupervised waits leave the blocking to the caller."""
+    job = make_job()
+
+    wait_for_job(job)
+
+    job.done.assert_not_called()
+
+
+def test_wait_polls_until_the_job_is_done(fast_polling):
+    """Test that the job state is polled until it reports done."""
+    job = make_job(done_after=3)
+
+    wait_for_job(job, deadline=deadline_after(5))
+
+    assert job.done.call_count == 4
+    job.cancel.assert_not_called()
+
+
+def test_wait_cancels_the_job_at_the_deadline(fast_polling):
+    """Test that a missed deadline cancels the job server-side."""
+    job = make_job()
+
+    with pytest.raises(TimeoutError, match='job-1'):
+        wait_for_job(job, deadline=deadline_after(0.05))
+
+    job.cancel.assert_called_once()
+
+
+def test_handle_cancels_from_another_thread():
+    """Test that cancelling a handle wakes the waiter and the job."""
+    job = make_job()
+    handle = JobHandle()
+    threading.Timer(0.05, handle.cancel).start()
+
+    with pytest.raises(CancelledError):
+        wait_for_job(job, handle=handle)
+
+    assert handle.cancelled
+    assert handle.job is job
+    job.cancel.assert_called()
+
+
+def test_handle_cancelled_before_attach_cancels_the_job():
+    """Test that a job attached to a cancelled handle is cancelled."""
+    handle = JobHandle()
+    handle.cancel()
+    job = make_job()
+
+    with pytest.raises(CancelledError):
+        wait_for_job(job, handle=handle)
+
+    job.cancel.assert_called()
+    job.done.assert_not_called()
+
+
+def test_registry_tracks_and_cancels_jobs():
+    """Test that tracked jobs are registered and can be cancelled."""
+    registry = JobRegistry()
+    job = make_job()
+
+    with registry.track(job):
+        assert len(registry) == 1
+        assert registry.cancel_all() == 1
+
+    job.cancel.assert_called_once()
+    assert len(registry) == 0
+
+
+def test_registry_cancels_job_on_keyboard_interrupt():
+    """Test that an interrupt while a job is tracked cancels it."""
+    registry = JobRegistry()
+    job = make_job()
+
+    with pytest.raises(KeyboardInterrupt):
+        with registry.track(job):
+            raise KeyboardInterrupt
+
+    job.cancel.assert_called_once()
+    assert len(registry) == 0
+
+
+def test_cancel_failures_are_swallowed():
+    """Test that a failing cancel request does not mask the timeout."""
+    job = make_job()
+    job.cancel.side_effect = RuntimeError('boom')
+
+    with pytest.raises(TimeoutError):
+        wait_for_job(job, deadline=deadline_after(0))
@@ -0,0 +1,46 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from easy_bigquery.connector import pool
+
+
+@pytest.fixture
+def mock_pool_connector(mocker):
+    """Patch the connector class and reset the per-process connector."""
+    mocker.patch('easy_bigquery.connector.pool.Finalize')
+    connector_class = mocker.patch('easy_bigquery.connector.pool.BQConnector')
+    yield connector_class
+    pool._worker_connector = None
+
+
+def test_init_worker_connects_once(mock_pool_connector):
+    """Test that the initializer creates and connects the connector."""
+    pool.init_worker({'project_id': 'my-project'})
+
+    mock_pool_connector.assert_called_once_with(project_id='my-project')
+    connector = mock_pool_connector.return_value
+    connector.connect.assert_called_once()
+
+    assert pool.get_worker_connector() is connector
+    assert pool.get_worker_connector() is connector
+    mock_pool_connector.assert_called_once()
+    assert connector.ensure_process.call_count == 2
+
+
+def test_get_worker_connector_requires_initializer(mock_pool_connector):
+    """Test that tasks fail clearly outside an initialized worker."""
+    with pytest.raises(RuntimeError, match='not initialized'):
+        pool.get_worker_connector()
+
+
+def test_process_pool_uses_worker_initializer():
+    """Test that the pool wires the initializer and connector kwargs."""
+    executor = pool.process_pool(max_workers=1, project_id='my-project')
+
+    try:
+        assert isinstance(executor, ProcessPoolExecutor)
+        assert executor._initializer is pool.init_worker
+        assert executor._initargs == ({'project_id': 'my-project'},)
+    finally:
+        executor.shutdown()
@@ -0,0 +1,123 @@
+import pickle
+import threading
+import time
+
+import pytest
+
+from easy_bigquery.connector.scheduler import JobScheduler, TokenBucket
+
+
+def test_unlimited_scheduler_admits_immediately():
+    """Test that a scheduler without limits only collects metrics."""
+    scheduler = JobScheduler()
+
+    with scheduler.slot():
+        with scheduler.slot('batch'):
+            assert scheduler.metrics().running == 2
+
+    metrics = scheduler.metrics()
+    assert metrics.running == 0
+    assert metrics.admitted == {'interactive': 1, 'batch': 1}
+
+
+def test_scheduler_enforces_the_concurrency_cap():
+    """Test that no more than max_concurrent_jobs slots are held."""
+    scheduler = JobScheduler(max_concurrent_jobs=2)
+    lock = threading.Lock()
+    peak = [0]
+
+    def job():
+        with scheduler.slot():
+            with lock:
+                peak[0] = max(peak[0], scheduler.metrics().running)
+            time.sleep(0.01)
+
+    threads = [threading.Thread(target=job) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak[0] == 2
+    assert scheduler.metrics().admitted['interactive'] == 8
+
+
+def test_scheduler_admits_interactive_before_batch():
+    """Test that waiting interactive jobs overtake waiting batch jobs."""
+    scheduler = JobScheduler(max_concurrent_jobs=1)
+    order = []
+
+    def job(lane):
+        with scheduler.slot(lane):
+            order.append(lane)
+
+    with scheduler.slot('batch'):
+        batch = threading.Thread(target=job, args=('batch',))
+        batch.start()
+        while scheduler.metrics().queued['batch'] < 1:
+            time.sleep(0.001)
+        interactive = threading.Thread(target=job, args=('interactive',))
+        interactive.start()
+        while scheduler.metrics().queued['interactive'] < 1:
+            time.sleep(0.001)
+    batch.join()
+    interactive.join()
+
+    assert order == ['interactive', 'batch']
+
+
+def test_scheduler_rejects_unknown_lanes():
+    """Test that an unknown lane raises a ValueError."""
+    with pytest.raises(ValueError, match='Unknown lane'):
+        with JobScheduler().slot('bulk'):
+            pass
+
+
+def test_token_bucket_spaces_out_calls():
+    """Test that calls beyond the burst wait for tokens to accrue."""
+    bucket = TokenBucket(rate=100, capacity=1)
+
+    assert bucket.acquire() == 0
+    start = time.monotonic()
+    waited = bucket.acquire() + bucket.acquire()
+
+    assert waited > 0
+    assert time.monotonic() - start >= 0.015
+
+
+def test_scheduler_records_throttling():
+    """Test that rate-limited admissions are reflected in the metrics."""
+    scheduler = JobScheduler(requests_per_second=100, burst=1)
+
+    for _ in range(3):
+        with scheduler.slot():
+            pass
+
+    metrics = scheduler.metrics()
+    assert metrics.throttled_seconds > 0
+    assert metrics.max_wait['interactive'] >= metrics.mean_wait['interactive']
+
+
+def test_throttle_shares_the_job_rate_limit():
+    """Test that throttled calls and slots draw from one bucket."""
+    scheduler = JobScheduler(requests_per_second=100, burst=1)
+
+    assert scheduler.throttle() == 0
+    with scheduler.slot():
+        pass
+
+    assert scheduler.metrics().throttled_seconds > 0
+    assert scheduler.metrics().running == 0
+    assert JobScheduler().throttle() == 0
+
+
+def test_scheduler_pickles_and_resets_limits_only():
+    """Test that copies keep the limits but start without state."""
+    scheduler = JobScheduler(max_concurrent_jobs=3, requests_per_second=2)
+    with scheduler.slot():
+        pass
+
+    for copy in (pickle.loads(pickle.dumps(scheduler)), scheduler.reset()):
+        assert copy.max_concurrent_jobs == 3
+        assert copy.requests_per_second == 2
+        assert copy.metrics().admitted['interactive'] == 0
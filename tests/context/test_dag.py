@@ -0,0 +1,168 @@
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from easy_bigquery.context.dag import JobGraph
+
+
+@pytest.fixture
+def graph_manager():
+    """Provide a mock manager whose fetch returns a DataFrame per query."""
+    manager = MagicMock()
+    tables = {
+        'SELECT orders': pd.DataFrame({'user_id': [1, 2], 'total': [5, 7]}),
+        'SELECT users': pd.DataFrame({'user_id': [1, 2], 'name': ['a', 'b']}),
+    }
+    manager.fetch.side_effect = lambda query, **kwargs: tables[query].copy()
+    manager.tables = tables
+    return manager
+
+
+def build_graph(manager):
+    """Build a fetch -> transform -> push graph."""
+    return (
+        JobGraph(manager, max_workers=2)
+        .fetch('orders', 'SELECT orders')
+        .fetch('users', 'SELECT users')
+        .transform(
+            'joined',
+            lambda orders, users: orders.merge(users, on='user_id'),
+            depends_on=['orders', 'users'],
+        )
+        .push('save', source='joined', table='target')
+    )
+
+
+def test_graph_runs_steps_in_dependency_order(graph_manager):
+    """Test that outputs flow between steps and timings are reported."""
+    results = build_graph(graph_manager).run()
+
+    assert {r.status for r in results.values()} == {'ran'}
+    assert list(results['joined'].output.columns) == [
+        'user_id',
+        'total',
+        'name',
+    ]
+    pushed = graph_manager.push.call_args
+    assert pushed.args[0] is results['joined'].output
+    assert pushed.kwargs['table'] == 'target'
+    assert all(r.seconds >= 0 for r in results.values())
+
+
+def test_graph_skips_steps_with_unchanged_inputs(graph_manager):
+    """Test that a rerun skips steps whose inputs hash equally."""
+    graph = build_graph(graph_manager)
+    graph.run()
+
+    results = graph.run()
+
+    # Root fetches always run; everything downstream is skipped.
+    assert results['orders'].status == 'ran'
+    assert results['joined'].status == 'skipped'
+    assert results['save'].status == 'skipped'
+    graph_manager.push.assert_called_once()
+
+    # Changing the fetched data re-runs the dependent steps.
+    graph_manager.tables['SELECT orders'].loc[0, 'total'] = 99
+    results = graph.run()
+    assert results['joined'].status == 'ran'
+    assert graph_manager.push.call_count == 2
+
+
+def test_graph_passes_dependency_outputs_to_params(graph_manager):
+    """Test that callable params receive upstream outputs."""
+    graph = (
+        JobGraph(graph_manager)
+        .fetch('users', 'SELECT users')
+        .fetch(
+            'orders',
+            'SELECT orders',
+            depends_on=['users'],
+            params=lambda inputs: {'ids': inputs['users']['user_id'].tolist()},
+        )
+    )
+
+    graph.run()
+
+    graph_manager.fetch.assert_any_call(
+        'SELECT orders', params={'ids': [1, 2]}
+    )
+
+
+def test_graph_reruns_dependent_fetches(graph_manager):
+    """Test that a fetch with dependencies reads fresh BigQuery data."""
+    graph = (
+        JobGraph(graph_manager)
+        .fetch('users', 'SELECT users')
+        .fetch(
+            'orders',
+            'SELECT orders',
+            depends_on=['users'],
+            params=lambda inputs: {'ids': inputs['users']['user_id'].tolist()},
+        )
+    )
+    graph.run()
+    graph_manager.tables['SELECT orders'].loc[0, 'total'] = 99
+
+    results = graph.run()
+
+    assert results['orders'].status == 'ran'
+    assert results['orders'].output['total'].tolist() == [99, 7]
+
+
+def test_graph_stops_on_failure(graph_manager):
+    """Test that a failing step aborts the run and skips dependents."""
+    graph_manager.execute.side_effect = ValueError('boom')
+    graph = (
+        JobGraph(graph_manager)
+        .sql('ddl', 'CREATE TABLE t (x INT64)')
+        .fetch('after', 'SELECT users', depends_on=['ddl'])
+    )
+
+    with pytest.raises(RuntimeError, match="Step 'ddl' failed."):
+        graph.run()
+    graph_manager.fetch.assert_not_called()
+
+
+def test_graph_validates_structure(graph_manager):
+    """Test duplicate names, unknown dependencies and cycles."""
+    graph = JobGraph(graph_manager).fetch('a', 'SELECT users')
+    with pytest.raises(ValueError, match='Duplicate'):
+        graph.fetch('a', 'SELECT users')
+
+    with pytest.raises(ValueError, match='unknown steps'):
+        JobGraph(graph_manager).sql('a', 'x', depends_on=['missing']).run()
+
+    cyclic = (
+        JobGraph(graph_manager)
+        .sql('a', 'x', depends_on=['b'])
+        .sql('b', 'y', depends_on=['a'])
+    )
+    with pytest.raises(ValueError, match='cycle'):
+        cyclic.run()
+
+
+def test_graph_reruns_fetches_that_read_pushed_tables(graph_manager):
+    """Test that a fetch after a push is not skipped with stale data."""
+    pushed = {}
+    graph_manager.push.side_effect = lambda df, **kwargs: pushed.update(
+        {'SELECT target': df.copy()}
+    )
+    graph_manager.fetch.side_effect = lambda query, **kwargs: (
+        pushed.get(query, graph_manager.tables.get(query)).copy()
+    )
+    graph = build_graph(graph_manager).fetch(
+        'after', 'SELECT target', depends_on=['save']
+    )
+    first = graph.run()
+    graph_manager.tables['SELECT orders'] = pd.DataFrame(
+        {'user_id': [1, 2], 'total': [50, 70]}
+    )
+
+    second = graph.run()
+
+    assert first['after'].output['total'].tolist() == [5, 7]
+    assert second['save'].status == 'ran'
+    assert second['after'].status == 'ran'
+    assert second['after'].output['total'].tolist() == [50, 70]
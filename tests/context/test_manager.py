@@ -1,6 +1,12 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
 import pytest
 
 from easy_bigquery.context.manager import BQManager
+from easy_bigquery.workers.export import GCSStorage
 
 
 def test_manager_initialization(mocked_manager_dependencies):
@@ -49,6 +55,32 @@ def test_manager_context_entry_and_exit(mocked_manager_dependencies):
     mocks['connector_instance'].close.assert_called_once()
 
 
+def test_manager_exit_cancels_in_flight_jobs(mocked_manager_dependencies):
+    """Test that leaving the context cancels jobs still running."""
+    mocks = mocked_manager_dependencies
+
+    with BQManager():
+        pass
+
+    mocks['connector_instance'].jobs.cancel_all.assert_called_once()
+
+
+def test_manager_applies_default_timeout(mocked_manager_dependencies):
+    """Test that the manager deadline is used unless overridden."""
+    mocks = mocked_manager_dependencies
+
+    with BQManager(timeout=30) as manager:
+        manager.fetch('SELECT 1')
+        manager.fetch('SELECT 2', timeout=5)
+        manager.push(MagicMock())
+
+    fetch = mocks['fetcher_instance'].fetch
+    assert fetch.call_args_list[0].kwargs == {'timeout': 30}
+    assert fetch.call_args_list[1].kwargs == {'timeout': 5}
+    assert mocks['pusher_instance'].push.call_args.kwargs == {'timeout': 30}
+    mocks['connector_class'].assert_called_once_with()
+
+
 def test_manager_delegates_fetch_call(mocked_manager_dependencies):
     """Test if the Manager's fetch method delegates the call to the Fetcher."""
     mocks = mocked_manager_dependencies
@@ -106,3 +138,172 @@ def test_fetch_or_push_fails_outside_context(
         ConnectionError, match='Manager context is not active.'
     ):
         manager.push(df=sample_dataframe)
+
+
+def test_manager_delegates_open_cursor_call(mocked_manager_dependencies):
+    """Test if the Manager's open_cursor delegates to the Fetcher."""
+    mocks = mocked_manager_dependencies
+    manager = BQManager()
+
+    with manager:
+        cursor = manager.open_cursor('SELECT 1', prefetch=False)
+
+    mocks['fetcher_instance'].open_cursor.assert_called_once_with(
+        'SELECT 1', prefetch=False
+    )
+    assert cursor is mocks['fetcher_instance'].open_cursor.return_value
+
+
+def test_manager_fetch_prefers_local_tier(mocked_manager_dependencies):
+    """Test that the local tier answers first and BigQuery is the fallback."""
+    mocks = mocked_manager_dependencies
+    manager = BQManager()
+
+    with manager:
+        manager.local_tier = MagicMock()
+        manager.local_tier.query.return_value = 'local result'
+        assert manager.fetch('SELECT 1', params={'a': 1}) == 'local result'
+        mocks['fetcher_instance'].fetch.assert_not_called()
+
+        # Queries the tier cannot serve go to BigQuery.
+        manager.local_tier.query.return_value = None
+        manager.fetch('SELECT 2')
+        mocks['fetcher_instance'].fetch.assert_called_once_with('SELECT 2')
+
+        # Options the tier does not understand bypass it entirely.
+        manager.fetch('SELECT 3', use_storage_api=False)
+        assert manager.local_tier.query.call_count == 2
+
+
+def test_manager_delegates_materialize_and_read_table(
+    mocked_manager_dependencies,
+):
+    """Test that materialize and read_table delegate to the fetcher."""
+    mocks = mocked_manager_dependencies
+    fetcher = mocks['fetcher_instance']
+
+    with BQManager(timeout=60) as manager:
+        reference = manager.materialize('SELECT 1', ttl=120)
+        manager.read_table(reference, max_results=10)
+
+    fetcher.materialize.assert_called_once_with(
+        'SELECT 1', ttl=120, timeout=60
+    )
+    fetcher.read_table.assert_called_once_with(
+        fetcher.materialize.return_value, max_results=10
+    )
+
+
+def test_manager_delegates_preview(mocked_manager_dependencies):
+    """Test that preview delegates to the fetcher with the timeout."""
+    fetcher = mocked_manager_dependencies['fetcher_instance']
+
+    with BQManager(timeout=30) as manager:
+        manager.preview('d.t', n=5)
+
+    fetcher.preview.assert_called_once_with('d.t', n=5, timeout=30)
+
+
+def test_manager_entry_is_reference_counted(mocked_manager_dependencies):
+    """Test that only the last exit closes the shared connection."""
+    connector = mocked_manager_dependencies['connector_instance']
+    manager = BQManager()
+
+    with manager:
+        with manager:
+            manager.fetch('SELECT 1')
+        connector.close.assert_not_called()
+        manager.fetch('SELECT 2')
+
+    connector.connect.assert_called_once()
+    connector.jobs.cancel_all.assert_called_once()
+    connector.close.assert_called_once()
+    manager.close()  # Unbalanced closes are ignored.
+    connector.close.assert_called_once()
+    assert manager.fetcher is None and manager.pusher is None
+    with pytest.raises(ConnectionError):
+        manager.fetch('SELECT 3')
+
+
+def test_thread_safe_manager_uses_per_call_workers(
+    mocker, mock_connector_tuple, sample_dataframe
+):
+    """Test that concurrent calls share clients but not worker state."""
+    connector, mocks = mock_connector_tuple
+    mocker.patch(
+        'easy_bigquery.context.manager.BQConnector', return_value=connector
+    )
+    job_mock = mocks['client_instance'].query.return_value
+    job_mock.to_dataframe.return_value = sample_dataframe
+
+    shared = BQManager(thread_safe=True).open()
+    with ThreadPoolExecutor(4) as pool:
+        frames = list(
+            pool.map(
+                lambda query: shared.fetch(query, profile=True),
+                [f'SELECT {n}' for n in range(8)],
+            )
+        )
+
+    assert all(frame is sample_dataframe for frame in frames)
+    assert shared.fetcher.last_profile is None
+    mocks['client_class'].assert_called_once()
+    assert connector.scheduler.metrics().admitted['interactive'] == 8
+    shared.close()
+    assert connector.client is None
+
+
+def test_thread_safe_manager_shares_export_storage(
+    mocker, mock_connector_tuple
+):
+    """Test that per-call fetchers reuse the manager's export storage."""
+    connector, _ = mock_connector_tuple
+    mocker.patch(
+        'easy_bigquery.context.manager.BQConnector', return_value=connector
+    )
+
+    with BQManager(thread_safe=True) as shared:
+        storage = shared.fetcher.export_storage
+        assert isinstance(storage, GCSStorage)
+        with shared._fetcher() as fetcher:
+            assert fetcher.export_storage is storage
+            assert fetcher._storage() is storage
+
+    with pytest.raises(ConnectionError):
+        shared.fetch('SELECT 1')
+
+
+def test_last_close_waits_for_calls_in_progress(
+    mocker, mock_connector_tuple, sample_dataframe
+):
+    """Test that closing does not pull the clients from a running call."""
+    connector, mocks = mock_connector_tuple
+    mocker.patch(
+        'easy_bigquery.context.manager.BQConnector', return_value=connector
+    )
+    started, release = threading.Event(), threading.Event()
+
+    def query(*args, **kwargs):
+        started.set()
+        release.wait(5)
+        return job
+
+    job = MagicMock()
+    job.to_dataframe.return_value = sample_dataframe
+    mocks['client_instance'].query.side_effect = query
+    shared = BQManager(thread_safe=True).open()
+
+    with ThreadPoolExecutor(2) as pool:
+        call = pool.submit(shared.fetch, 'SELECT 1')
+        started.wait(5)
+        closing = pool.submit(shared.close)
+        while shared.fetcher is not None:
+            time.sleep(0.001)
+        with pytest.raises(ConnectionError):
+            shared.fetch('SELECT 2')
+        assert connector.client is not None
+        release.set()
+
+        assert call.result() is sample_dataframe
+        closing.result()
+    assert connector.client is None
@@ -0,0 +1,49 @@
+import pandas as pd
+
+from easy_bigquery.core.hashing import (
+    hash_dataframe,
+    hash_partitions,
+    hash_value,
+)
+
+
+def test_hash_dataframe_detects_changes(sample_dataframe):
+    """Test that values, names and dtypes all affect the hash."""
+    base = hash_dataframe(sample_dataframe)
+
+    assert base == hash_dataframe(sample_dataframe.copy())
+    assert base != hash_dataframe(sample_dataframe.assign(col1=[1, 3]))
+    assert base != hash_dataframe(sample_dataframe.rename(columns=str.upper))
+    assert base != hash_dataframe(sample_dataframe.astype({'col1': float}))
+
+
+def test_hash_dataframe_ignores_index_by_default(sample_dataframe):
+    """Test that the index only matters when requested."""
+    reindexed = sample_dataframe.set_axis([10, 11])
+
+    assert hash_dataframe(sample_dataframe) == hash_dataframe(reindexed)
+    assert hash_dataframe(sample_dataframe, index=True) != hash_dataframe(
+        reindexed, index=True
+    )
+
+
+def test_hash_handles_nested_cells_and_plain_values():
+    """Test the fallbacks for unhashable cells and non-frame values."""
+    nested = pd.DataFrame({'items': [[1, 2], [3]]})
+
+    assert hash_dataframe(nested) == hash_dataframe(nested.copy())
+    assert hash_value(('a', 1)) == hash_value(('a', 1))
+    assert hash_value(nested) == hash_dataframe(nested)
+
+
+def test_hash_partitions_is_order_insensitive():
+    """Test that partition hashes ignore row order but not content."""
+    df = pd.DataFrame({'key': ['a', 'a', 'b'], 'value': [1, 2, 3]})
+
+    hashes = hash_partitions(df, df['key'])
+    shuffled = hash_partitions(df.iloc[::-1], df['key'].iloc[::-1])
+    changed = hash_partitions(df.assign(value=[1, 2, 4]), df['key'])
+
+    assert hashes == shuffled
+    assert hashes['a'] == changed['a']
+    assert hashes['b'] != changed['b']
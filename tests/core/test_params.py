@@ -0,0 +1,92 @@
+import datetime as dt
+import decimal
+
+import numpy as np
+import pytest
+from google.cloud import bigquery as bq
+
+from easy_bigquery.core.params import (
+    build_query_config,
+    build_query_parameters,
+    template_names,
+)
+
+
+def test_template_names_ignores_literals_and_comments():
+    """Test that only real placeholders are reported."""
+    query = """
+        SELECT @a, '@b', "@c", `@d`, @@time_zone
+        FROM t -- @e
+        /* @f */
+        WHERE x = @g AND y IN UNNEST(@h)
+    """
+
+    assert template_names(query) == {'a', 'g', 'h'}
+
+
+def test_build_scalar_parameters():
+    """Test that Python scalars map to the expected BigQuery types."""
+    params = build_query_parameters(
+        {
+            'flag': True,
+            'count': np.int64(3),
+            'ratio': 0.5,
+            'price': decimal.Decimal('1.25'),
+            'name': 'x',
+            'day': dt.date(2024, 1, 1),
+            'naive': dt.datetime(2024, 1, 1),
+            'aware': dt.datetime(2024, 1, 1, tzinfo=dt.timezone.utc),
+        }
+    )
+    types = {param.name: param.type_ for param in params}
+
+    assert types == {
+        'flag': 'BOOL',
+        'count': 'INT64',
+        'ratio': 'FLOAT64',
+        'price': 'NUMERIC',
+        'name': 'STRING',
+        'day': 'DATE',
+        'naive': 'DATETIME',
+        'aware': 'TIMESTAMP',
+    }
+    # numpy scalars are converted to builtin values.
+    assert type(params[1].value) is int
+
+
+def test_build_array_and_struct_parameters():
+    """Test that lists and dicts become array and struct parameters."""
+    ids, point = build_query_parameters(
+        {'ids': [1, 2, 3], 'point': {'x': 1.0, 'label': 'a'}}
+    )
+
+    assert isinstance(ids, bq.ArrayQueryParameter)
+    assert ids.array_type == 'INT64'
+    assert ids.values == [1, 2, 3]
+    assert isinstance(point, bq.StructQueryParameter)
+    assert point.struct_types == {'x': 'FLOAT64', 'label': 'STRING'}
+
+
+def test_explicit_parameters_are_passed_through():
+    """Test that prebuilt parameters are kept, allowing typed NULLs."""
+    null_param = bq.ScalarQueryParameter('value', 'STRING', None)
+
+    assert build_query_parameters({'value': null_param}) == [null_param]
+
+    with pytest.raises(ValueError, match='NULL parameter @value'):
+        build_query_parameters({'value': None})
+    with pytest.raises(ValueError, match='empty or all-null'):
+        build_query_parameters({'ids': []})
+    with pytest.raises(TypeError, match='Unsupported'):
+        build_query_parameters({'obj': object()})
+
+
+def test_build_query_config_requires_all_placeholders():
+    """Test that a missing placeholder value raises an error."""
+    config = build_query_config('SELECT @a', {'a': 1})
+
+    assert isinstance(config, bq.QueryJobConfig)
+    assert config.query_parameters[0].name == 'a'
+
+    with pytest.raises(ValueError, match=r"\['b'\]"):
+        build_query_config('SELECT @a, @b', {'a': 1})
@@ -0,0 +1,106 @@
+import time
+import tracemalloc
+
+import pandas as pd
+import pytest
+
+from easy_bigquery.core import profiling
+from easy_bigquery.core.profiling import (
+    NULL_PROFILE,
+    Profile,
+    create_profile,
+)
+
+
+def test_phases_record_time_and_memory():
+    """Test that each phase records wall time, CPU time and peak memory."""
+    with Profile('test') as profile:
+        with profile.phase('allocate'):
+            data = bytearray(4 * 2**20)
+        with profile.phase('sleep'):
+            time.sleep(0.02)
+
+    allocate, sleep = profile.phases
+    assert allocate.name == 'allocate'
+    assert allocate.peak_bytes >= len(data)
+    assert sleep.wall >= 0.02
+    assert sleep.cpu < sleep.wall
+    assert not tracemalloc.is_tracing()
+    assert list(profile.to_frame()['phase']) == ['allocate', 'sleep']
+
+
+def test_concurrent_profiles_share_memory_tracing():
+    """Test that one profile exiting leaves tracing to the others."""
+    outer, inner = Profile('outer'), Profile('inner')
+
+    with outer:
+        with outer.phase('allocate'):
+            data = bytearray(4 * 2**20)
+            del data
+            with inner:
+                with inner.phase('small'):
+                    pass
+            assert tracemalloc.is_tracing()
+
+    assert outer.phases[0].peak_bytes >= 4 * 2**20
+    assert inner.phases[0].peak_bytes >= 4 * 2**20
+    assert not tracemalloc.is_tracing()
+
+
+def test_profile_leaves_existing_tracing_running():
+    """Test that tracing started by the caller is not stopped."""
+    tracemalloc.start()
+    try:
+        with Profile('test') as profile:
+            with profile.phase('noop'):
+                pass
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+def test_sampling_attributes_samples_to_phases_and_categories():
+    """Test that stack samples are tagged with the phase and category."""
+    with Profile('test', sample_interval=0.001) as profile:
+        with profile.phase('convert'):
+            deadline = time.perf_counter() + 0.1
+            while time.perf_counter() < deadline:
+                pd.DataFrame({'a': range(1000)}).sum()
+
+    assert profile.samples[('convert', 'pandas')] > 0
+    assert 'pandas_pct' in profile.to_frame().columns
+    hottest = profile.collapsed_stacks().splitlines()[0]
+    assert hottest.startswith('convert;')
+    assert 'Hottest of' in profile.report()
+
+
+@pytest.mark.parametrize(
+    ('option', 'sampling'),
+    [(True, False), ('phases', False), ('sampling', True)],
+)
+def test_create_profile_from_options(option, sampling):
+    """Test that profile options create owned profiles."""
+    profile, owned = create_profile('call', option)
+
+    assert owned
+    assert isinstance(profile, Profile)
+    assert bool(profile.sample_interval) is sampling
+
+
+def test_create_profile_defaults_to_setting(mocker):
+    """Test that the BQ_PROFILE setting applies when no option is given."""
+    assert create_profile('call') == (NULL_PROFILE, False)
+
+    mocker.patch.object(profiling, 'BQ_PROFILE', 'phases')
+    profile, owned = create_profile('call')
+
+    assert owned and isinstance(profile, Profile)
+
+
+def test_create_profile_passes_existing_profile_through():
+    """Test that caller-owned profiles are recorded into, not owned."""
+    existing = Profile('mine')
+
+    assert create_profile('call', existing) == (existing, False)
+    with pytest.raises(ValueError):
+        create_profile('call', 'everything')
@@ -0,0 +1,126 @@
+import io
+
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+import pytest
+
+from easy_bigquery import cli
+
+
+@pytest.fixture
+def bq(mocker):
+    """Patch the manager used by the CLI and return the active instance."""
+    mocker.patch.object(cli, 'logger')
+    manager_class = mocker.patch.object(cli, 'BQManager')
+    return manager_class.return_value.__enter__.return_value
+
+
+@pytest.fixture
+def batches():
+    """Two record batches shaped like a streamed query result."""
+    return [
+        pa.record_batch({'id': [1, 2], 'name': ['a', 'b']}),
+        pa.record_batch({'id': [3], 'name': ['c']}),
+    ]
+
+
+@pytest.mark.parametrize('suffix', ['.arrows', '.parquet', '.csv'])
+def test_export_streams_batches_to_file(bq, batches, tmp_path, suffix):
+    """Test that export writes every batch in the inferred format."""
+    bq.iter_batches.return_value = iter(batches)
+    output = tmp_path / f'out{suffix}'
+
+    code = cli.main(['export', 'SELECT 1', '-o', str(output), '-q'])
+
+    assert code == 0
+    if suffix == '.parquet':
+        table = pq.read_table(output)
+    elif suffix == '.csv':
+        table = pacsv.read_csv(output)
+    else:
+        table = pa.ipc.open_stream(output.read_bytes()).read_all()
+    assert table.column('id').to_pylist() == [1, 2, 3]
+
+
+def test_export_binds_params_and_reports_progress(
+    bq, batches, tmp_path, capsys
+):
+    """Test that params are parsed as JSON and progress goes to stderr."""
+    bq.iter_batches.return_value = iter(batches)
+
+    cli.main(
+        [
+            'export',
+            'SELECT @n, @s',
+            '-p',
+            'n=7',
+            '-p',
+            's=abc',
+            '-o',
+            str(tmp_path / 'out.arrows'),
+        ]
+    )
+
+    bq.iter_batches.assert_called_once_with(
+        'SELECT @n, @s', params={'n': 7, 's': 'abc'}, use_storage_api=True
+    )
+    assert 'Exported 3 rows' in capsys.readouterr().err
+
+
+def test_import_pushes_in_chunks(bq, tmp_path):
+    """Test that import truncates with the first chunk, then appends."""
+    source = tmp_path / 'in.parquet'
+    pq.write_table(pa.table({'id': list(range(5))}), source)
+
+    code = cli.main(
+        [
+            'import',
+            'my_dataset.events',
+            '-i',
+            str(source),
+            '--chunk-rows',
+            '2',
+            '--replace',
+            '-q',
+        ]
+    )
+
+    assert code == 0
+    calls = bq.push.call_args_list
+    assert [len(call.args[0]) for call in calls] == [2, 2, 1]
+    assert [call.kwargs['write_disposition'] for call in calls] == [
+        'WRITE_TRUNCATE',
+        'WRITE_APPEND',
+        'WRITE_APPEND',
+    ]
+    assert calls[0].kwargs['dataset'] == 'my_dataset'
+    assert calls[0].kwargs['table'] == 'events'
+    assert calls[0].kwargs['project_id'] is None
+
+
+def test_import_reads_arrow_stream_from_stdin(bq, batches, mocker):
+    """Test that an Arrow IPC stream is read from stdin."""
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, batches[0].schema) as writer:
+        for batch in batches:
+            writer.write_batch(batch)
+    mocker.patch.object(
+        cli.sys, 'stdin', mocker.Mock(buffer=io.BytesIO(sink.getvalue()))
+    )
+
+    cli.main(['import', 'events', '-q'])
+
+    (call,) = bq.push.call_args_list
+    assert call.args[0]['name'].tolist() == ['a', 'b', 'c']
+    assert call.kwargs['write_disposition'] == 'WRITE_APPEND'
+
+
+def test_errors_are_reported_with_exit_code(bq, capsys):
+    """Test that failures print a message instead of a traceback."""
+    bq.iter_batches.side_effect = RuntimeError('boom')
+
+    code = cli.main(['export', 'SELECT 1', '-q'])
+
+    assert code == 1
+    assert 'error: boom' in capsys.readouterr().err
@@ -0,0 +1,73 @@
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from easy_bigquery.workers.cursor import QueryCursor
+
+
+@pytest.fixture
+def paged_client():
+    """Provide a mock client whose list_rows serves a 10-row table."""
+    client = MagicMock()
+
+    def list_rows(table, start_index, max_results):
+        rows = MagicMock()
+        stop = min(start_index + max_results, 10)
+        rows.to_dataframe.return_value = pd.DataFrame(
+            {'id': range(start_index, stop)}
+        )
+        return rows
+
+    client.list_rows.side_effect = list_rows
+    return client
+
+
+def test_cursor_pages_use_row_offsets(paged_client):
+    """Test that each page reads the right slice of the destination."""
+    with QueryCursor(paged_client, 'p.d.t', 10, prefetch=False) as cursor:
+        page = cursor.page(1, size=4)
+        last = cursor.page(2, size=4)
+
+    assert page['id'].tolist() == [4, 5, 6, 7]
+    assert last['id'].tolist() == [8, 9]
+    assert cursor.num_pages(4) == 3
+    paged_client.list_rows.assert_any_call(
+        'p.d.t', start_index=4, max_results=4
+    )
+
+
+def test_cursor_page_reads_are_throttled(paged_client):
+    """Test that every page read takes a scheduler token."""
+    scheduler = MagicMock()
+    with QueryCursor(
+        paged_client, 'p.d.t', 10, prefetch=False, scheduler=scheduler
+    ) as cursor:
+        cursor.page(0, size=4)
+        cursor.page(1, size=4)
+
+    assert scheduler.throttle.call_count == 2
+
+
+def test_cursor_prefetches_next_page(paged_client):
+    """Test that the next page is read in the background and reused."""
+    with QueryCursor(paged_client, 'p.d.t', 10) as cursor:
+        cursor.page(0, size=5)
+        prefetched = cursor._pending[(1, 5)]
+        prefetched.result()
+
+        second = cursor.page(1, size=5)
+
+    assert second['id'].tolist() == [5, 6, 7, 8, 9]
+    # Page 1 was read once by the prefetch; no page 2 exists to prefetch.
+    assert paged_client.list_rows.call_count == 2
+
+
+def test_cursor_rejects_invalid_pages(paged_client):
+    """Test that negative pages and empty sizes are rejected."""
+    cursor = QueryCursor(paged_client, 'p.d.t', 10)
+
+    with pytest.raises(ValueError):
+        cursor.page(-1, size=5)
+    with pytest.raises(ValueError):
+        cursor.page(0, size=0)
@@ -0,0 +1,102 @@
+import gzip
+
+import pandas as pd
+import pyarrow.orc as orc
+import pyarrow.parquet as pq
+import pytest
+
+from easy_bigquery.workers.encoding import (
+    benchmark_encodings,
+    encode_dataframe,
+)
+
+
+def test_encode_parquet_round_trip(sample_dataframe):
+    """Test Parquet encoding with codec and row group size."""
+    payload = encode_dataframe(
+        pd.concat([sample_dataframe] * 5, ignore_index=True),
+        compression='zstd',
+        compression_level=5,
+        row_group_size=4,
+    )
+
+    parquet_file = pq.ParquetFile(payload)
+    assert parquet_file.metadata.num_row_groups == 3
+    assert parquet_file.metadata.row_group(0).column(0).compression == 'ZSTD'
+    assert parquet_file.read().num_rows == 10
+
+
+def test_encode_orc_round_trip(sample_dataframe):
+    """Test ORC encoding preserves the data."""
+    payload = encode_dataframe(sample_dataframe, 'ORC', 'zstd')
+
+    table = orc.read_table(payload)
+    pd.testing.assert_frame_equal(table.to_pandas(), sample_dataframe)
+
+
+def test_encode_gzip_ndjson(sample_dataframe):
+    """Test that NDJSON is written one record per line and gzipped."""
+    payload = encode_dataframe(
+        sample_dataframe, 'NEWLINE_DELIMITED_JSON', 'gzip'
+    )
+
+    lines = gzip.decompress(payload.read()).decode().splitlines()
+    assert lines == ['{"col1":1,"col2":"a"}', '{"col1":2,"col2":"b"}']
+
+
+def test_encode_ndjson_keeps_microseconds():
+    """Test that NDJSON timestamps keep BigQuery's full precision."""
+    stamp = pd.Timestamp('2024-01-02 03:04:05.123456', tz='UTC')
+    df = pd.DataFrame({'ts': [stamp]})
+
+    payload = encode_dataframe(df, 'NEWLINE_DELIMITED_JSON')
+
+    decoded = pd.read_json(payload, lines=True, convert_dates=['ts'])
+    assert decoded['ts'][0] == stamp
+    assert '05.123456' in payload.getvalue().decode()
+
+
+@pytest.mark.parametrize(
+    'kwargs, message',
+    [
+        ({'source_format': 'AVRO'}, 'Unsupported source format'),
+        ({'source_format': 'ORC', 'compression_level': 1}, 'ORC'),
+        ({'compression_level': 3}, "'snappy'"),
+        ({'compression': 'none', 'compression_level': 3}, "'none'"),
+        ({'compression': 'gzip', 'compression_level': 12}, 'between 1 and 9'),
+        (
+            {
+                'source_format': 'NEWLINE_DELIMITED_JSON',
+                'compression_level': 1,
+            },
+            "'none'",
+        ),
+        (
+            {'source_format': 'NEWLINE_DELIMITED_JSON', 'row_group_size': 1},
+            'row_group_size',
+        ),
+    ],
+)
+def test_encode_rejects_invalid_options(sample_dataframe, kwargs, message):
+    """Test that unsupported option combinations raise ValueError."""
+    with pytest.raises(ValueError, match=message):
+        encode_dataframe(sample_dataframe, **kwargs)
+
+
+def test_benchmark_reports_each_candidate(sample_dataframe):
+    """Test that the benchmark returns one sorted row per candidate."""
+    report = benchmark_encodings(
+        sample_dataframe,
+        [('PARQUET', 'none', None), ('NEWLINE_DELIMITED_JSON', 'gzip', 1)],
+    )
+
+    assert len(report) == 2
+    assert list(report.columns) == [
+        'source_format',
+        'compression',
+        'compression_level',
+        'encode_seconds',
+        'bytes',
+        'ratio',
+    ]
+    assert report['bytes'].is_monotonic_increasing
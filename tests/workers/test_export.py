@@ -0,0 +1,65 @@
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from easy_bigquery.workers.export import (
+    LocalStorage,
+    download_shards,
+    read_shards,
+    split_uri,
+)
+
+
+@pytest.fixture
+def storage_with_shards(tmp_path):
+    """Provides a LocalStorage holding three Parquet shards."""
+    storage = LocalStorage(str(tmp_path / 'bucket-root'))
+    uris = []
+    for index in range(3):
+        uri = f'gs://bucket/run/shard-{index:012d}.parquet'
+        path = storage.path(uri)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(pa.table({'id': [index * 10, index * 10 + 1]}), path)
+        uris.append(uri)
+    return storage, uris
+
+
+def test_split_uri():
+    """Test that URIs are split into bucket and object name."""
+    assert split_uri('gs://bucket/a/b.parquet') == ('bucket', 'a/b.parquet')
+    with pytest.raises(ValueError, match='Not an object storage URI'):
+        split_uri('/local/path')
+
+
+def test_local_storage_lists_by_prefix(storage_with_shards):
+    """Test that listing returns the sorted URIs under a prefix."""
+    storage, uris = storage_with_shards
+
+    assert storage.list('gs://bucket/run/') == uris
+    assert storage.list('gs://bucket/other/') == []
+    assert storage.list('gs://missing/run/') == []
+
+
+def test_download_shards_writes_local_files(storage_with_shards, tmp_path):
+    """Test that shards are downloaded to the directory in order."""
+    storage, uris = storage_with_shards
+
+    paths = download_shards(storage, uris, str(tmp_path / 'out'), 2)
+
+    assert [p.rsplit('/', 1)[-1] for p in paths] == [
+        uri.rsplit('/', 1)[-1] for uri in uris
+    ]
+    assert pq.read_table(paths[2])['id'].to_pylist() == [20, 21]
+
+
+def test_read_shards_streams_in_order_and_cleans_up(storage_with_shards):
+    """Test that shards are decoded in order and deleted afterwards."""
+    storage, uris = storage_with_shards
+
+    reader = read_shards(storage, uris, max_workers=2, cleanup=True)
+
+    assert reader.schema.names == ['id']
+    assert reader.read_all()['id'].to_pylist() == [0, 1, 10, 11, 20, 21]
+    assert storage.list('gs://bucket/run/') == []
+    with pytest.raises(ValueError, match='no shards'):
+        read_shards(storage, [])
@@ -1,6 +1,13 @@
+import datetime as dt
+
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
+from google.api_core.exceptions import NotFound
+from google.cloud import bigquery as bq
 
+from easy_bigquery.workers.export import LocalStorage
 from easy_bigquery.workers.fetch import FetchWorker
 
 
@@ -108,3 +115,415 @@ def test_fetch_raises_runtime_error_if_client_disappears(
         RuntimeError, match='BigQuery client is not available.'
     ):
         fetcher.fetch('SELECT 1')
+
+
+def test_fetch_with_params_binds_query_parameters(mock_connector_tuple):
+    """Test that params are sent as query parameters in the job config."""
+    connector, mocks = mock_connector_tuple
+    connector.connect()
+    fetcher = FetchWorker(connector)
+    sql_query = 'SELECT * FROM my_table WHERE id = @id'
+
+    fetcher.fetch(sql_query, params={'id': 7})
+
+    call = mocks['client_instance'].query.call_args
+    assert call.args == (sql_query,)
+    parameters = call.kwargs['job_config'].query_parameters
+    assert [(p.name, p.type_, p.value) for p in parameters] == [
+        ('id', 'INT64', 7)
+    ]
+
+
+def test_open_cursor_runs_query_once(mock_connector_tuple):
+    """Test that open_cursor waits for the job and keeps its destination."""
+    connector, mocks = mock_connector_tuple
+    connector.connect()
+    fetcher = FetchWorker(connector)
+    job_mock = mocks['client_instance'].query.return_value
+    job_mock.result.return_value.total_rows = 42
+
+    cursor = fetcher.open_cursor('SELECT 1', prefetch=False)
+
+    mocks['client_instance'].query.assert_called_once_with('SELECT 1')
+    job_mock.result.assert_called_once()
+    assert cursor.destination is job_mock.destination
+    assert cursor.total_rows == 42
+
+
+def test_fetch_timeout_cancels_the_job(mock_connector_tuple):
+    """Test that a fetch past its deadline cancels the job."""
+    connector, mocks = mock_connector_tuple
+    connector.connect()
+    fetcher = FetchWorker(connector)
+    job_mock = mocks['client_instance'].query.return_value
+    job_mock.done.return_value = False
+
+    with pytest.raises(TimeoutError):
+        fetcher.fetch('SELECT 1', timeout=0)
+
+    job_mock.cancel.assert_called_once()
+    job_mock.to_dataframe.assert_not_called()
+    assert len(connector.jobs) == 0
+
+
+def test_fetch_tracks_the_job_while_downloading(
+    mock_connector_tuple, sample_dataframe
+):
+    """Test that the job is registered on the connector until done."""
+    connector, mocks = mock_connector_tuple
+    connector.connect()
+    fetcher = FetchWorker(connector)
+    job_mock = mocks['client_instance'].query.return_value
+    tracked = []
+
+    def to_dataframe(**_):
+        tracked.append(len(connector.jobs))
+        return sample_dataframe
+
+    job_mock.to_dataframe.side_effect = to_dataframe
+
+    fetcher.fetch('SELECT 1')
+
+    assert tracked == [1]
+    assert len(connector.jobs) == 0
+
+
+def test_execute_waits_without_downloading(mock_connector_tuple):
+    """Test that execute waits for the job and reports affected rows."""
+    connector, mocks = mock_connector_tuple
+    connector.connect()
+    fetcher = FetchWorker(connector)
+    job_mock = mocks['client_instance'].query.return_value
+    job_mock.num_dml_affected_rows = 3
+
+    affected = fetcher.execute('DELETE FROM t WHERE true')
+
+    assert affected == 3
+    job_mock.result.assert_called_once()
+    job_mock.to_dataframe.assert_not_called()
+
+
+def test_fetch_shared_publishes_arrow_result(mock_connector_tuple, tmp_path):
+    """Test that fetch_shared downloads Arrow and publishes it."""
+    import pyarrow as pa
+
+    connector, mocks = mock_connector_tuple
+    connector.connect()
+    fetcher = FetchWorker(connector)
+    job_mock = mocks['client_instance'].query.return_value
+    job_mock.to_arrow.return_value = pa.table({'x': [1, 2]})
+
+    handle = fetcher.fetch_shared('SELECT x', refs=2, directory=str(tmp_path))
+
+    job_mock.to_arrow.assert_called_once_with(
+        bqstorage_client=mocks['storage_instance']
+    )
+    assert handle.refs == 2
+    assert handle.open().column('x').to_pylist() == [1, 2]
+
+
+def test_materialize_writes_expiring_destination(mock_connector_tuple):
+    """Test that materialize creates the table with its expiration."""
+    connector, mocks = mock_connector_tuple
+    connector.connect()
+    fetcher = FetchWorker(connector)
+    client = mocks['client_instance']
+    client.get_table.side_effect = NotFound('missing')
+
+    reference = fetcher.materialize('SELECT @x;', ttl=600, params={'x': 1})
+
+    statement = client.query.call_args.args[0]
+    assert statement.startswith(f'CREATE OR REPLACE TABLE {reference} ')
+    assert 'expiration_timestamp' in statement
+    assert statement.endswith('AS\nSELECT @x\n')
+    client.update_table.assert_not_called()
+    remaining = reference.expires_at - dt.datetime.now(dt.timezone.utc)
+    assert dt.timedelta(seconds=590) < remaining <= dt.timedelta(seconds=600)
+    assert not reference.reused
+
+
+def test_materialize_reuses_fresh_result(mock_connector_tuple):
+    """Test that materializing the same query again skips the job."""
+    connector, mocks = mock_connector_tuple
+    connector.connect()
+    fetcher = FetchWorker(connector)
+    client = mocks['client_instance']
+    client.get_table.return_value.expires = dt.datetime.now(
+        dt.timezone.utc
+    ) + dt.timedelta(hours=1)
+
+    first = fetcher.materialize('SELECT  1', ttl=600)
+    second = fetcher.materialize('SELECT 1', ttl=600)
+
+    client.query.assert_not_called()
+    client.update_table.assert_not_called()
+    assert first.reused and second.reused
+    assert first.table_id == second.table_id
+
+
+def test_materialize_extends_reused_tables_to_the_ttl(mock_connector_tuple):
+    """Test that a reused table is kept for at least the requested ttl."""
+    connector, mocks = mock_connector_tuple
+    connector.connect()
+    fetcher = FetchWorker(connector)
+    client = mocks['client_instance']
+    client.get_table.return_value.expires = dt.datetime.now(
+        dt.timezone.utc
+    ) + dt.timedelta(seconds=90)
+
+    reference = fetcher.materialize('SELECT 1', ttl=3600)
+
+    client.query.assert_not_called()
+    table, fields = client.update_table.call_args.args
+    assert fields == ['expires']
+    assert table.expires == reference.expires_at
+    remaining = reference.expires_at - dt.datetime.now(dt.timezone.utc)
+    assert remaining > dt.timedelta(seconds=3590)
+    assert reference.reused
+
+
+def test_read_table_selects_columns(mock_connector_tuple, sample_dataframe):
+    """Test that read_table lists rows of the requested columns."""
+    connector, mocks = mock_connector_tuple
+    connector.connect()
+    fetcher = FetchWorker(connector)
+    client = mocks['client_instance']
+    table_ref = client.get_table.return_value
+    table_ref.schema = [
+        bq.SchemaField('a', 'INT64'),
+        bq.SchemaField('b', 'STRING'),
+    ]
+    client.list_rows.return_value.to_dataframe.return_value = sample_dataframe
+
+    df = fetcher.read_table('p.d.t', columns=['b'])
+
+    client.list_rows.assert_called_once_with(
+        table_ref, selected_fields=[table_ref.schema[1]], max_results=None
+    )
+    client.list_rows.return_value.to_dataframe.assert_called_once_with(
+        bqstorage_client=mocks['storage_instance']
+    )
+    pd.testing.assert_frame_equal(df, sample_dataframe)
+    with pytest.raises(ValueError, match='missing'):
+        fetcher.read_table('p.d.t', columns=['missing'])
+
+
+def test_fetch_profile_records_phases(mock_connector_tuple, sample_dataframe):
+    """Test that a profiled fetch times the job apart from the download."""
+    connector, mocks = mock_connector_tuple
+    connector.connect()
+    fetcher = FetchWorker(connector)
+    job_mock = mocks['client_instance'].query.return_value
+    job_mock.to_dataframe.return_value = sample_dataframe
+
+    fetcher.fetch('SELECT 1', profile=True)
+
+    phases = [stats.name for stats in fetcher.last_profile.phases]
+    assert phases == ['admission', 'submit', 'job', 'download']
+    job_mock.result.assert_called_once()
+
+
+def test_fetch_flattens_nested_results_via_arrow(mock_connector_tuple):
+    """Test that reshaping options download Arrow instead of pandas."""
+    connector, mocks = mock_connector_tuple
+    connector.connect()
+    fetcher = FetchWorker(connector)
+    job_mock = mocks['client_instance'].query.return_value
+    job_mock.to_arrow.return_value = pa.table(
+        {'id': [1], 'tags': [['a', 'b']], 'user': [{'name': 'ana'}]}
+    )
+
+    df = fetcher.fetch('SELECT 1', flatten=True, explode='tags')
+
+    job_mock.to_dataframe.assert_not_called()
+    job_mock.to_arrow.assert_called_once_with(
+        bqstorage_client=mocks['storage_instance']
+    )
+    assert list(df.columns) == ['id', 'tags', 'user.name']
+    assert df['tags'].tolist() == ['a', 'b']
+
+
+def test_iter_batches_streams_arrow_batches(mock_connector_tuple):
+    """Test that iter_batches waits for the job, then streams batches."""
+    connector, mocks = mock_connector_tuple
+    connector.connect()
+    fetcher = FetchWorker(connector)
+    job_mock = mocks['client_instance'].query.return_value
+    rows = job_mock.result.return_value
+    batch = pa.record_batch({'id': [1, 2]})
+    rows.to_arrow_iterable.return_value = iter([batch])
+
+    batches = fetcher.iter_batches('SELECT 1')
+
+    job_mock.result.assert_called_once()
+    rows.to_arrow_iterable.assert_not_called()
+    assert list(batches) == [batch]
+    rows.to_arrow_iterable.assert_called_once_with(
+        bqstorage_client=mocks['storage_instance']
+    )
+    assert len(connector.jobs) == 0
+
+
+def test_iter_batches_yields_schema_for_empty_results(mock_connector_tuple):
+    """Test that an empty result still carries its schema."""
+    connector, mocks = mock_connector_tuple
+    connector.connect()
+    fetcher = FetchWorker(connector)
+    rows = mocks['client_instance'].query.return_value.result.return_value
+    rows.to_arrow_iterable.return_value = iter([])
+    rows.to_arrow.return_value = pa.table({'id': pa.array([], pa.int64())})
+
+    (batch,) = fetcher.iter_batches('SELECT 1')
+
+    assert batch.num_rows == 0
+    assert batch.schema.names == ['id']
+
+
+def test_fetch_and_iter_batches_are_admitted_by_lane(mock_connector_tuple):
+    """Test that queries go through the connector scheduler lanes."""
+    connector, mocks = mock_connector_tuple
+    connector.connect()
+    fetcher = FetchWorker(connector)
+
+    fetcher.fetch('SELECT 1')
+    fetcher.iter_batches('SELECT 2')
+
+    admitted = connector.scheduler.metrics().admitted
+    assert admitted == {'interactive': 1, 'batch': 1}
+    assert connector.scheduler.metrics().running == 0
+
+
+def test_fetch_max_rows_stops_the_download_early(mock_connector_tuple):
+    """Test that max_rows stops reading batches once enough arrived."""
+    connector, mocks = mock_connector_tuple
+    connector.connect()
+    fetcher = FetchWorker(connector)
+    rows = mocks['client_instance'].query.return_value.result.return_value
+    read = []
+
+    def batches(**kwargs):
+        for start in range(0, 100, 10):
+            read.append(start)
+            yield pa.record_batch({'id': list(range(start, start + 10))})
+
+    rows.to_arrow_iterable.side_effect = batches
+
+    df = fetcher.fetch('SELECT id FROM t', max_rows=15)
+
+    assert df['id'].tolist() == list(range(15))
+    assert str(df['id'].dtype) == 'Int64'
+    assert read == [0, 10]
+    rows.to_arrow_iterable.assert_called_once_with(
+        bqstorage_client=mocks['storage_instance']
+    )
+    with pytest.raises(ValueError, match='max_rows'):
+        fetcher.fetch('SELECT 1', max_rows=-1)
+
+
+def test_preview_reads_tables_without_a_query(
+    mock_connector_tuple, sample_dataframe
+):
+    """Test that previewing a table lists rows instead of querying."""
+    connector, mocks = mock_connector_tuple
+    connector.connect()
+    fetcher = FetchWorker(connector)
+    client = mocks['client_instance']
+    client.list_rows.return_value.to_dataframe.return_value = sample_dataframe
+
+    fetcher.preview('`p.d.t`', n=5)
+
+    client.query.assert_not_called()
+    client.get_table.assert_called_once_with('p.d.t')
+    client.list_rows.assert_called_once_with(
+        client.get_table.return_value, selected_fields=None, max_results=5
+    )
+    client.list_rows.return_value.to_dataframe.assert_called_once_with(
+        bqstorage_client=None
+    )
+
+
+def test_table_reads_are_throttled(mocker, mock_connector_tuple):
+    """Test that metadata and row reads take scheduler tokens."""
+    connector, _ = mock_connector_tuple
+    connector.connect()
+    throttle = mocker.spy(connector.scheduler, 'throttle')
+
+    FetchWorker(connector).preview('p.d.t', n=5)
+
+    assert throttle.call_count == 2
+
+
+def test_preview_runs_queries_with_max_rows(mocker, mock_connector_tuple):
+    """Test that previewing query text fetches its first rows."""
+    connector, _ = mock_connector_tuple
+    connector.connect()
+    fetcher = FetchWorker(connector)
+    fetch = mocker.patch.object(fetcher, 'fetch')
+
+    fetcher.preview('SELECT * FROM d.t WHERE x = @x', n=3, params={'x': 1})
+
+    fetch.assert_called_once_with(
+        'SELECT * FROM d.t WHERE x = @x',
+        use_storage_api=True,
+        max_rows=3,
+        params={'x': 1},
+    )
+
+
+@pytest.fixture
+def exporting_fetcher(mock_connector_tuple, tmp_path):
+    """Provides a FetchWorker whose extract jobs write to local storage."""
+    connector, mocks = mock_connector_tuple
+    connector.connect()
+    storage = LocalStorage(str(tmp_path / 'storage'))
+    fetcher = FetchWorker(connector, export_storage=storage)
+    fetcher.export_uri = 'gs://bucket/tmp'
+    client = mocks['client_instance']
+
+    def extract_table(source, destination_uri, job_config):
+        for index in range(2):
+            path = storage.path(destination_uri.replace('*', str(index)))
+            path.parent.mkdir(parents=True, exist_ok=True)
+            pq.write_table(pa.table({'id': [index, index + 10]}), path)
+        return client.extract_table.return_value
+
+    client.extract_table.side_effect = extract_table
+    return fetcher, client, storage
+
+
+def test_export_downloads_shards_and_cleans_up(exporting_fetcher, tmp_path):
+    """Test that export extracts the result and downloads its shards."""
+    fetcher, client, storage = exporting_fetcher
+
+    paths = fetcher.export('SELECT id FROM t', str(tmp_path / 'out'))
+
+    job_config = client.extract_table.call_args.kwargs['job_config']
+    assert job_config.destination_format == 'PARQUET'
+    assert client.extract_table.call_args.args[0] == (
+        client.query.return_value.destination
+    )
+    assert len(paths) == 2
+    assert pq.read_table(paths[1])['id'].to_pylist() == [1, 11]
+    assert storage.list('gs://bucket/tmp/') == []
+    assert fetcher.connector.scheduler.metrics().admitted['batch'] == 1
+    with pytest.raises(ValueError, match='Unsupported export format'):
+        fetcher.export('SELECT 1', str(tmp_path), destination_format='CSV')
+
+
+def test_fetch_switches_to_export_past_threshold(exporting_fetcher):
+    """Test that large results are read from extracted shards."""
+    fetcher, client, storage = exporting_fetcher
+    client.get_table.return_value.num_bytes = 2000
+    fetcher.export_threshold = 1000
+    job_mock = client.query.return_value
+
+    df = fetcher.fetch('SELECT id FROM t')
+
+    client.get_table.assert_called_once_with(job_mock.destination)
+    job_mock.to_dataframe.assert_not_called()
+    assert df['id'].tolist() == [0, 10, 1, 11]
+    assert storage.list('gs://bucket/tmp/') == []
+
+    client.get_table.return_value.num_bytes = 10
+    fetcher.fetch('SELECT id FROM t')
+    job_mock.to_dataframe.assert_called_once()
@@ -0,0 +1,177 @@
+import datetime as dt
+
+import pyarrow as pa
+import pytest
+
+pytest.importorskip('duckdb')
+
+from easy_bigquery.workers.local import LocalTier
+
+
+@pytest.fixture
+def local_tier(mock_connector_tuple, tmp_path):
+    """Provide a LocalTier with one snapshotted reference table."""
+    connector, mocks = mock_connector_tuple
+    connector.connect()
+    mocks[
+        'client_instance'
+    ].list_rows.return_value.to_arrow.return_value = pa.table(
+        {
+            'region': ['eu', 'eu', 'us'],
+            'ts': [dt.datetime(2024, 1, day) for day in (1, 2, 3)],
+        }
+    )
+    tier = LocalTier(connector, str(tmp_path))
+    tier.add_tables({'test_dataset.countries': 'ts'})
+    return tier, mocks
+
+
+def test_snapshot_reads_table_without_a_query_job(local_tier):
+    """Test that snapshots use list_rows with the Storage API client."""
+    tier, mocks = local_tier
+
+    mocks['client_instance'].list_rows.assert_called_once_with(
+        'test-project.test_dataset.countries'
+    )
+    mocks[
+        'client_instance'
+    ].list_rows.return_value.to_arrow.assert_called_once_with(
+        bqstorage_client=mocks['storage_instance']
+    )
+    mocks['client_instance'].query.assert_not_called()
+    assert tier.tables == {'test-project.test_dataset.countries': 'ts'}
+
+
+@pytest.mark.parametrize(
+    'reference',
+    [
+        '`test-project.test_dataset.countries`',
+        '`test-project`.`test_dataset`.`countries`',
+        'test_dataset.countries',
+    ],
+)
+def test_query_is_served_locally(local_tier, reference):
+    """Test that compatible queries are answered by DuckDB."""
+    tier, mocks = local_tier
+
+    df = tier.query(
+        f'SELECT region, COUNT(*) AS n FROM {reference} '
+        'WHERE region = @region GROUP BY region',
+        params={'region': 'eu'},
+    )
+
+    assert df.to_dict('records') == [{'region': 'eu', 'n': 2}]
+    mocks['client_instance'].query.assert_not_called()
+
+
+def test_query_falls_back_when_not_servable(local_tier):
+    """Test that unknown tables and unsupported SQL return None."""
+    tier, _ = local_tier
+
+    assert tier.query('SELECT 1') is None
+    assert (
+        tier.query(
+            'SELECT * FROM `test-project.test_dataset.countries` c '
+            'JOIN `test-project.other.table` o USING (region)'
+        )
+        is None
+    )
+    assert (
+        tier.query(
+            'SELECT SAFE.NOT_A_FUNCTION(region) ' 'FROM test_dataset.countries'
+        )
+        is None
+    )
+
+
+def test_incremental_refresh_appends_new_rows(local_tier):
+    """Test that refresh only fetches rows newer than the watermark."""
+    tier, mocks = local_tier
+    job = mocks['client_instance'].query.return_value
+    job.result.return_value.to_arrow_iterable.return_value = iter(
+        [pa.record_batch({'region': ['br'], 'ts': [dt.datetime(2024, 1, 4)]})]
+    )
+
+    tier.refresh()
+
+    call = mocks['client_instance'].query.call_args
+    assert '`ts` > @watermark' in call.args[0]
+    (param,) = call.kwargs['job_config'].query_parameters
+    assert param.value == dt.datetime(2024, 1, 3)
+    assert tier.connector.scheduler.metrics().admitted['batch'] == 1
+    df = tier.query('SELECT COUNT(*) AS n FROM test_dataset.countries')
+    assert df['n'].tolist() == [4]
+
+
+def test_query_matches_bigquery_null_ordering(local_tier):
+    """Test that NULLs sort first ascending and last descending."""
+    tier, _ = local_tier
+
+    df = tier.query(
+        "SELECT IF(region = 'us', NULL, region) AS r "
+        'FROM test_dataset.countries ORDER BY r'
+    )
+    descending = tier.query(
+        "SELECT IF(region = 'us', NULL, region) AS r "
+        'FROM test_dataset.countries ORDER BY r DESC'
+    )
+
+    assert df['r'].isna().tolist() == [True, False, False]
+    assert descending['r'].isna().tolist() == [False, False, True]
+
+
+@pytest.mark.parametrize(
+    'expression',
+    [
+        'SUBSTR(region, 0, 2)',
+        'CONCAT(region, NULL)',
+        "CAST('1.5' AS INT64)",
+        'GREATEST(region, NULL)',
+    ],
+)
+def test_query_falls_back_outside_allowed_functions(local_tier, expression):
+    """Test that calls not known to behave the same run on BigQuery."""
+    tier, _ = local_tier
+
+    assert (
+        tier.query(f'SELECT {expression} FROM test_dataset.countries') is None
+    )
+
+
+def test_query_ignores_calls_inside_literals(local_tier):
+    """Test that names inside literals and comments are not calls."""
+    tier, _ = local_tier
+
+    df = tier.query(
+        "SELECT 'CONCAT(' AS s FROM test_dataset.countries -- CAST(x)"
+    )
+
+    assert df['s'].tolist() == ['CONCAT('] * 3
+
+
+def test_query_matches_bigquery_types_and_collation(local_tier):
+    """Test that local results look like those of FetchWorker.fetch."""
+    tier, _ = local_tier
+
+    df = tier.query(
+        "SELECT region, COUNT(*) AS n, SUM(1) AS s, 'B' < 'a' AS upper_first "
+        'FROM test_dataset.countries GROUP BY region ORDER BY region'
+    )
+
+    assert df['n'].dtype == 'Int64' and df['s'].dtype == 'Int64'
+    assert df['upper_first'].dtype == 'boolean'
+    assert df['upper_first'].all()
+    assert df['s'].tolist() == [2, 1]
+
+
+def test_rewrite_leaves_literals_and_comments_alone(local_tier):
+    """Test that table spellings inside literals are not rewritten."""
+    tier, _ = local_tier
+
+    df = tier.query(
+        "SELECT 'test_dataset.countries' AS name, region "
+        'FROM test_dataset.countries /* test_dataset.countries */ '
+        'ORDER BY region'
+    )
+
+    assert df['name'].tolist() == ['test_dataset.countries'] * 3
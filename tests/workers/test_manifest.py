@@ -0,0 +1,62 @@
+import json
+import threading
+
+from easy_bigquery.workers.manifest import PushManifest
+
+
+def test_manifest_records_and_merges_partitions(tmp_path):
+    """Test that hashes persist and partition entries are merged."""
+    path = tmp_path / 'nested' / 'manifest.json'
+    manifest = PushManifest(str(path))
+
+    assert manifest.get('p.d.t') == {}
+    manifest.record('p.d.t', frame_hash='abc')
+    manifest.record('p.d.t', partitions={'20240101': 'x'})
+    manifest.record('p.d.t', partitions={'20240102': 'y'})
+
+    entry = PushManifest(str(path)).get('p.d.t')
+    assert entry['hash'] == 'abc'
+    assert entry['partitions'] == {'20240101': 'x', '20240102': 'y'}
+    assert 'p.d.t' in json.loads(path.read_text())
+
+
+def test_manifest_forget(tmp_path):
+    """Test that forgetting a table removes its entry."""
+    manifest = PushManifest(str(tmp_path / 'manifest.json'))
+    manifest.record('p.d.t', frame_hash='abc')
+
+    manifest.forget('p.d.t')
+    manifest.forget('p.d.unknown')
+
+    assert manifest.get('p.d.t') == {}
+
+
+def test_manifest_instances_share_the_file_safely(tmp_path):
+    """Test that concurrent writers on one path lose no entries."""
+    path = str(tmp_path / 'manifest.json')
+
+    def push(worker):
+        manifest = PushManifest(path)
+        for index in range(20):
+            manifest.record(f'p.d.t{worker}_{index}', frame_hash='abc')
+
+    threads = [threading.Thread(target=push, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(json.loads((tmp_path / 'manifest.json').read_text())) == 80
+    assert list(tmp_path.iterdir()) == [tmp_path / 'manifest.json']
+
+
+def test_manifest_treats_unreadable_files_as_empty(tmp_path):
+    """Test that a corrupt manifest reads as empty and is rewritten."""
+    path = tmp_path / 'manifest.json'
+    path.write_text('{"p.d.t": {"hash": ')
+    manifest = PushManifest(str(path))
+
+    assert manifest.get('p.d.t') == {}
+    manifest.record('p.d.t', frame_hash='abc')
+
+    assert manifest.get('p.d.t')['hash'] == 'abc'
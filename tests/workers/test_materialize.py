@@ -0,0 +1,55 @@
+import datetime as dt
+
+from easy_bigquery.workers.materialize import (
+    TABLE_PREFIX,
+    MaterializedTable,
+    materialized_table_id,
+    query_fingerprint,
+)
+
+
+def test_fingerprint_ignores_whitespace_but_not_params():
+    """Test that fingerprints identify the query result, not its layout."""
+    query = 'SELECT *\n  FROM t WHERE id = @id'
+
+    assert query_fingerprint(query, {'id': 1}) == query_fingerprint(
+        'SELECT * FROM t   WHERE id = @id', {'id': 1}
+    )
+    assert query_fingerprint(query, {'id': 1}) != query_fingerprint(
+        query, {'id': 2}
+    )
+
+
+def test_fingerprint_keeps_whitespace_inside_literals():
+    """Test that literals differing only in spacing are distinguished."""
+    assert query_fingerprint("SELECT 1 WHERE name = 'a  b'") != (
+        query_fingerprint("SELECT 1 WHERE name = 'a b'")
+    )
+    assert query_fingerprint("SELECT  'a  b'\n") == query_fingerprint(
+        "SELECT 'a  b'"
+    )
+
+
+def test_table_id_is_named_after_fingerprint():
+    """Test that materialized tables have deterministic names."""
+    table_id = materialized_table_id('p', 'd', 'abc')
+
+    assert table_id == f'p.d.{TABLE_PREFIX}abc'
+
+
+def test_reference_formats_as_quoted_table_path():
+    """Test that a reference can be embedded in SQL."""
+    now = dt.datetime.now(dt.timezone.utc)
+    reference = MaterializedTable('p.d.t', 'abc', now)
+
+    assert f'SELECT * FROM {reference}' == 'SELECT * FROM `p.d.t`'
+
+
+def test_reference_is_stale_close_to_expiry():
+    """Test that tables about to expire are not reused."""
+    now = dt.datetime.now(dt.timezone.utc)
+
+    assert MaterializedTable('t', 'f', now + dt.timedelta(hours=1)).is_fresh()
+    assert not MaterializedTable(
+        't', 'f', now + dt.timedelta(seconds=5)
+    ).is_fresh()
@@ -0,0 +1,105 @@
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from easy_bigquery.workers.nested import (
+    explode_lists,
+    flatten_structs,
+    reshape,
+    to_pandas,
+)
+
+
+@pytest.fixture
+def nested_table():
+    """An Arrow table shaped like a BigQuery result with nested fields."""
+    return pa.table(
+        {
+            'id': [1, 2, 3],
+            'tags': [['a', 'b'], [], None],
+            'address': [
+                {'city': 'Recife', 'geo': {'lat': -8.0}},
+                None,
+                {'city': 'Natal', 'geo': None},
+            ],
+            'items': [
+                [{'sku': 10, 'qty': 1}],
+                [{'sku': 20, 'qty': 2}, {'sku': 30, 'qty': 3}],
+                None,
+            ],
+        }
+    )
+
+
+def test_flatten_structs_recursively(nested_table):
+    """Test that nested structs become dotted columns."""
+    table = flatten_structs(nested_table)
+
+    assert table.column_names == [
+        'id',
+        'tags',
+        'address.city',
+        'address.geo.lat',
+        'items',
+    ]
+    assert table.column('address.geo.lat').to_pylist() == [-8.0, None, None]
+
+
+def test_flatten_structs_with_custom_separator(nested_table):
+    """Test that the separator only replaces introduced dots."""
+    table = flatten_structs(nested_table, separator='__')
+
+    assert 'address__geo__lat' in table.column_names
+
+
+def test_explode_lists_keeps_empty_rows_like_pandas(nested_table):
+    """Test that exploding matches pandas.DataFrame.explode."""
+    table = explode_lists(nested_table.select(['id', 'tags']), 'tags')
+    expected = (
+        nested_table.select(['id', 'tags'])
+        .to_pandas()
+        .explode('tags')
+        .reset_index(drop=True)
+    )
+
+    assert table.column('id').to_pylist() == expected['id'].tolist()
+    assert table.column('tags').to_pylist() == [
+        None if pd.isna(tag) else tag for tag in expected['tags']
+    ]
+
+
+def test_explode_lists_can_drop_empty_rows(nested_table):
+    """Test that keep_empty=False drops empty and null lists."""
+    table = explode_lists(nested_table, 'tags', keep_empty=False)
+
+    assert table.column('id').to_pylist() == [1, 1]
+
+
+def test_explode_lists_rejects_scalar_columns(nested_table):
+    """Test that only list columns can be exploded."""
+    with pytest.raises(ValueError, match='not a list column'):
+        explode_lists(nested_table, 'id')
+
+
+def test_reshape_explodes_arrays_of_records(nested_table):
+    """Test that exploded records are flattened into dotted columns."""
+    table = reshape(nested_table, flatten=True, explode='items')
+
+    assert table.column('id').to_pylist() == [1, 2, 2, 3]
+    assert table.column('items.sku').to_pylist() == [10, 20, 30, None]
+    assert table.column('address.city').to_pylist() == [
+        'Recife',
+        None,
+        None,
+        'Natal',
+    ]
+
+
+def test_to_pandas_dtypes(nested_table):
+    """Test the default and Arrow-backed pandas conversions."""
+    default = to_pandas(nested_table)
+    arrow = to_pandas(nested_table, arrow_dtypes=True)
+
+    assert default['id'].dtype == pd.Int64Dtype()
+    assert isinstance(arrow['items'].dtype, pd.ArrowDtype)
+    assert pa.types.is_list(arrow['items'].dtype.pyarrow_dtype)
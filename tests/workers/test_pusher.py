@@ -1,3 +1,4 @@
+import pandas as pd
 import pytest
 from google.cloud import bigquery as bq
 
@@ -63,6 +64,25 @@ def test_push_success_with_defaults(mock_connector_tuple, sample_dataframe):
     load_job_mock.result.assert_called_once()
 
 
+def test_push_timeout_cancels_the_load_job(
+    mock_connector_tuple, sample_dataframe
+):
+    """Test that a push past its deadline cancels the load job."""
+    connector, mocks = mock_connector_tuple
+    connector.connect()
+    pusher = PushWorker(connector)
+    load_job_mock = mocks[
+        'client_instance'
+    ].load_table_from_dataframe.return_value
+    load_job_mock.done.return_value = False
+
+    with pytest.raises(TimeoutError):
+        pusher.push(df=sample_dataframe, timeout=0)
+
+    load_job_mock.cancel.assert_called_once()
+    load_job_mock.result.assert_not_called()
+
+
 def test_push_with_explicit_parameters(mock_connector_tuple, sample_dataframe):
     """Test that explicit parameters override connector defaults."""
     connector, mocks = mock_connector_tuple
@@ -154,3 +174,158 @@ def test_push_raises_error_if_client_disappears(
 
     with pytest.raises(RuntimeError, match='BigQuery client not initialized.'):
         pusher.push(df=sample_dataframe)
+
+
+def test_push_with_encoding_options_uploads_encoded_file(
+    mock_connector_tuple, sample_dataframe
+):
+    """Test that encoding options serialize locally and load from file."""
+    connector, mocks = mock_connector_tuple
+    connector.connect()
+    pusher = PushWorker(connector)
+    load_job_mock = mocks['client_instance'].load_table_from_file.return_value
+    load_job_mock.errors = None
+
+    pusher.push(df=sample_dataframe, compression='zstd', compression_level=3)
+
+    mocks['client_instance'].load_table_from_dataframe.assert_not_called()
+    call = mocks['client_instance'].load_table_from_file.call_args
+    payload = call.args[0]
+    assert payload.read(4) == b'PAR1'
+    assert call.kwargs['job_config'].source_format == 'PARQUET'
+    load_job_mock.result.assert_called_once()
+
+
+def test_push_rejects_unsupported_encoding(
+    mock_connector_tuple, sample_dataframe
+):
+    """Test that invalid codec/format combinations fail before uploading."""
+    connector, mocks = mock_connector_tuple
+    connector.connect()
+    pusher = PushWorker(connector)
+
+    with pytest.raises(ValueError, match='Unsupported compression'):
+        pusher.push(
+            df=sample_dataframe,
+            source_format='NEWLINE_DELIMITED_JSON',
+            compression='zstd',
+        )
+    mocks['client_instance'].load_table_from_file.assert_not_called()
+
+
+@pytest.fixture
+def truncate_pusher(mock_connector_tuple):
+    """Provide a connected PushWorker whose load jobs succeed."""
+    connector, mocks = mock_connector_tuple
+    connector.connect()
+    load = mocks['client_instance'].load_table_from_dataframe
+    load.return_value.errors = None
+    return PushWorker(connector), load
+
+
+def test_push_skips_unchanged_frames(truncate_pusher, sample_dataframe):
+    """Test that an identical frame is not loaded twice."""
+    pusher, load = truncate_pusher
+    options = {'write_disposition': 'WRITE_TRUNCATE', 'skip_unchanged': True}
+
+    pusher.push(df=sample_dataframe, **options)
+    pusher.push(df=sample_dataframe.copy(), **options)
+    assert load.call_count == 1
+
+    pusher.push(df=sample_dataframe.assign(col1=[1, 3]), **options)
+    assert load.call_count == 2
+
+
+def test_push_without_skip_invalidates_manifest(
+    truncate_pusher, sample_dataframe
+):
+    """Test that a regular push makes the next skip-aware push load."""
+    pusher, load = truncate_pusher
+    options = {'write_disposition': 'WRITE_TRUNCATE', 'skip_unchanged': True}
+
+    pusher.push(df=sample_dataframe, **options)
+    pusher.push(df=sample_dataframe, write_disposition='WRITE_APPEND')
+    pusher.push(df=sample_dataframe, **options)
+
+    assert load.call_count == 3
+
+
+def test_push_skip_requires_truncate(truncate_pusher, sample_dataframe):
+    """Test that skipping is refused for appends."""
+    pusher, load = truncate_pusher
+
+    with pytest.raises(ValueError, match='WRITE_TRUNCATE'):
+        pusher.push(df=sample_dataframe, skip_unchanged=True)
+    load.assert_not_called()
+
+
+def test_push_rewrites_only_changed_partitions(truncate_pusher):
+    """Test that partitions are loaded through decorators when changed."""
+    pusher, load = truncate_pusher
+    df = pd.DataFrame(
+        {
+            'day': pd.to_datetime(['2024-01-01', '2024-01-01', '2024-01-02']),
+            'value': [1, 2, 3],
+        }
+    )
+    options = {
+        'table': 'events',
+        'write_disposition': 'WRITE_TRUNCATE',
+        'skip_unchanged': True,
+        'partition_column': 'day',
+    }
+
+    pusher.push(df=df, **options)
+    destinations = [c.kwargs['destination'] for c in load.call_args_list]
+    assert destinations == [
+        'test-project.test_dataset.events$20240101',
+        'test-project.test_dataset.events$20240102',
+    ]
+    job_config = load.call_args.kwargs['job_config']
+    assert job_config.time_partitioning.field == 'day'
+
+    # Row order within a partition does not matter; changed values do.
+    changed = df.iloc[::-1].copy()
+    changed.loc[2, 'value'] = 30
+    pusher.push(df=changed, **options)
+
+    assert load.call_count == 3
+    assert load.call_args.kwargs['destination'].endswith('$20240102')
+    assert load.call_args.kwargs['dataframe']['value'].tolist() == [30]
+
+
+def test_push_profile_records_phases(mock_connector_tuple, sample_dataframe):
+    """Test that a profiled push times encoding, upload and the job."""
+    connector, mocks = mock_connector_tuple
+    connector.connect()
+    pusher = PushWorker(connector)
+    load_job_mock = mocks['client_instance'].load_table_from_file.return_value
+    load_job_mock.errors = None
+
+    pusher.push(df=sample_dataframe, compression='zstd', profile='phases')
+
+    phases = [stats.name for stats in pusher.last_profile.phases]
+    assert phases == ['encode', 'upload', 'job']
+    assert pusher.last_profile.phases[0].peak_bytes > 0
+
+
+def test_push_is_admitted_through_the_batch_lane(
+    mock_connector_tuple, sample_dataframe
+):
+    """Test that load jobs hold a batch scheduler slot while they run."""
+    connector, mocks = mock_connector_tuple
+    connector.connect()
+    pusher = PushWorker(connector)
+    load_job_mock = mocks[
+        'client_instance'
+    ].load_table_from_dataframe.return_value
+    load_job_mock.errors = None
+    running = []
+    load_job_mock.result.side_effect = lambda: running.append(
+        connector.scheduler.metrics().running
+    )
+
+    pusher.push(sample_dataframe, table='t')
+
+    assert running == [1]
+    assert connector.scheduler.metrics().admitted['batch'] == 1
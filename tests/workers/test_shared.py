@@ -0,0 +1,67 @@
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pyarrow as pa
+import pytest
+
+from easy_bigquery.workers.shared import SharedTable
+
+
+def sum_column(handle, column):
+    """Open a shared table in another process and release it."""
+    with handle:
+        return pa.compute.sum(handle.open().column(column)).as_py()
+
+
+def test_publish_round_trips_dataframe(tmp_path, sample_dataframe):
+    """Test that a published frame reopens with the same contents."""
+    handle = SharedTable.publish(sample_dataframe, directory=str(tmp_path))
+
+    assert handle.open().to_pandas().equals(sample_dataframe)
+    assert pickle.loads(pickle.dumps(handle)).path == handle.path
+
+
+def test_open_does_not_copy_buffers(tmp_path):
+    """Test that opening maps the file instead of allocating memory."""
+    handle = SharedTable.publish(
+        pa.table({'x': list(range(1_000_000))}), directory=str(tmp_path)
+    )
+    allocated = pa.total_allocated_bytes()
+
+    table = handle.open()
+
+    assert table.nbytes >= 8_000_000
+    assert pa.total_allocated_bytes() - allocated < 1_000
+
+
+def test_reference_counting_deletes_file(tmp_path):
+    """Test that the file lives until the last reference is released."""
+    handle = SharedTable.publish(
+        pa.table({'x': [1]}), refs=2, directory=str(tmp_path)
+    )
+    handle.retain()
+    assert handle.refs == 3
+
+    handle.release()
+    handle.release()
+    assert os.path.exists(handle.path)
+
+    handle.release()
+    assert not os.path.exists(handle.path)
+    assert handle.refs == 0
+    with pytest.raises(RuntimeError, match='already released'):
+        handle.release()
+
+
+def test_handles_are_shared_across_processes(tmp_path):
+    """Test that worker processes open and release the same table."""
+    handle = SharedTable.publish(
+        pa.table({'x': list(range(100))}), refs=2, directory=str(tmp_path)
+    )
+
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        results = list(pool.map(sum_column, [handle, handle], ['x', 'x']))
+
+    assert results == [4950, 4950]
+    assert not os.path.exists(handle.path)